@@ -0,0 +1,15 @@
+"""
+Benchmarks
+==========
+
+CPU benchmark suite of ScrAIbe that runs without downloading models.
+
+Synthetic multi-speaker audio and deterministic stub models exercise the
+audio processing, the Scraibe pipeline, the formatting of diarisations and
+the Transcript exporters. Results are written as JSON so runs of different
+commits can be compared.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --output new.json --compare results.json
+"""
@@ -0,0 +1,125 @@
+"""
+Import Time Benchmark
+=====================
+
+Measures how long typical entry points of ScrAIbe take to import in a fresh
+interpreter, and which heavy dependencies each of them pulls in. Lightweight
+users, e.g. workers that only export transcripts, should not pay for torch,
+Whisper or pyannote.audio.
+
+Usage:
+    python -m benchmarks.import_time --output imports.json
+    python -m benchmarks.import_time --check
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from argparse import ArgumentParser
+from typing import List, Optional
+
+HEAVY_MODULES = ("torch", "whisper", "faster_whisper", "ctranslate2",
+                 "pyannote.audio", "huggingface_hub")
+
+# entry point -> heavy modules it may import
+ENTRY_POINTS = {
+    "import scraibe": (),
+    "from scraibe import Transcript": (),
+    "from scraibe import TimingCollector, SegmentScheduler": (),
+    "scraibe --help": (),
+    "from scraibe import AudioProcessor": ("torch",),
+    "from scraibe.transcriber import Transcriber": ("torch",),
+    "from scraibe import Scraibe": ("torch",),
+}
+
+_HELP = ("import sys; sys.argv = ['scraibe', '--help']\n"
+         "from scraibe.cli import cli\n"
+         "try:\n    cli()\nexcept SystemExit:\n    pass\n")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds,
+                  "modules": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(entry_point: str) -> dict:
+    """
+    Imports an entry point in a fresh interpreter.
+
+    Args:
+        entry_point (str): A key of ENTRY_POINTS.
+
+    Returns:
+        dict: The import time in seconds and the heavy modules that were imported.
+    """
+    code = _HELP if entry_point == "scraibe --help" else entry_point
+    probe = _PROBE.format(code=code, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", probe], capture_output=True,
+                            text=True, check=True).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(repeat: int = 3, entry_points: Optional[List[str]] = None) -> List[dict]:
+    """
+    Measures the entry points `repeat` times each.
+
+    Args:
+        repeat (int, optional): Number of fresh interpreters per entry point. Defaults to 3.
+        entry_points (Optional[List[str]], optional): Entry points to measure.
+                                                      Defaults to all ENTRY_POINTS.
+
+    Returns:
+        List[dict]: The median and minimum import time, the heavy modules imported and
+                    the heavy modules that were not expected for each entry point.
+    """
+    results = []
+    for entry_point in entry_points or ENTRY_POINTS:
+        runs = [measure(entry_point) for _ in range(repeat)]
+        modules = runs[-1]["modules"]
+        results.append({"entry_point": entry_point,
+                        "seconds_median": statistics.median(r["seconds"] for r in runs),
+                        "seconds_min": min(r["seconds"] for r in runs),
+                        "modules": modules,
+                        "unexpected": [m for m in modules
+                                       if m not in ENTRY_POINTS[entry_point]]})
+
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> List[dict]:
+    parser = ArgumentParser(description="Import time of ScrAIbe entry points.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Number of fresh interpreters per entry point.")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Path of the JSON results. Printed if not given.")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit with an error if an entry point imports "
+                             "heavy modules it should not.")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    failed = [r for r in results if r["unexpected"]]
+    if args.check and failed:
+        for result in failed:
+            print(f"{result['entry_point']} imports {', '.join(result['unexpected'])}",
+                  file=sys.stderr)
+        sys.exit(1)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
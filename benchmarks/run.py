@@ -0,0 +1,289 @@
+"""
+Benchmark Runner
+================
+
+Runs the benchmark suite on synthetic audio of several lengths and reports the
+wall time, the throughput in seconds of audio per second, the time of each
+Scraibe stage and the peak memory of every benchmark as JSON.
+
+Benchmarks:
+- audio_cut_many: Cutting all turns out of the audio.
+- audio_detect_speech: Voice activity detection.
+- format_diarization_output: Formatting a pyannote Annotation with
+                             consecutive tracks of the same speaker.
+- transcript_export: Building a Transcript and exporting it to text, JSON and HTML.
+- autotranscribe: The full pipeline with stub models, one segment per call.
+- autotranscribe_batch: The full pipeline with stub models, batched segments.
+- autotranscribe_whisper_tiny: The full pipeline with the real Whisper tiny
+                               model, only if it is already downloaded.
+
+Usage:
+    python -m benchmarks.run --durations 60 600 --output results.json
+    python -m benchmarks.run --output new.json --compare results.json
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+import torch
+
+from scraibe import AudioProcessor, Scraibe, TimingCollector, Transcript
+from scraibe.misc import WHISPER_DEFAULT_PATH
+from scraibe.placement import peak_rss_mb, reset_peak_rss
+
+from .stubs import StubDiariser, StubTranscriber
+from .synthetic import synthetic_audio
+
+
+def bench_audio_cut_many(audio: AudioProcessor, turns: list, args) -> None:
+    audio.cut_many([[start, end] for start, end, _ in turns])
+
+
+def bench_audio_detect_speech(audio: AudioProcessor, turns: list, args) -> None:
+    audio.detect_speech()
+
+
+def bench_format_diarization_output(audio: AudioProcessor, turns: list, args) -> None:
+    StubDiariser.format_diarization_output(StubDiariser.annotation(turns, args.splits))
+
+
+def bench_transcript_export(audio: AudioProcessor, turns: list, args) -> None:
+    transcript = Transcript({i: {"speakers": speaker, "segments": [start, end],
+                                 "text": StubTranscriber._text(end - start)}
+                             for i, (start, end, speaker) in enumerate(turns)})
+    str(transcript)
+    transcript.get_json()
+    transcript.get_html()
+
+
+def _autotranscribe(transcriber, audio: AudioProcessor, turns: list,
+                    args, timings: TimingCollector, batch_size: int) -> None:
+    diariser = StubDiariser(turns, splits=args.splits,
+                            latency=args.latency, rtf=args.diariser_rtf)
+    model = Scraibe(transcriber, dia_model=diariser, observers=[timings])
+    model.autotranscribe(audio, language="en", batch_size=batch_size)
+
+
+def bench_autotranscribe(audio: AudioProcessor, turns: list, args,
+                         timings: TimingCollector) -> None:
+    transcriber = StubTranscriber(latency=args.latency, rtf=args.transcriber_rtf)
+    _autotranscribe(transcriber, audio, turns, args, timings, batch_size=1)
+
+
+def bench_autotranscribe_batch(audio: AudioProcessor, turns: list, args,
+                               timings: TimingCollector) -> None:
+    transcriber = StubTranscriber(latency=args.latency, rtf=args.transcriber_rtf)
+    _autotranscribe(transcriber, audio, turns, args, timings, batch_size=8)
+
+
+_WHISPER_TINY = None
+
+
+def bench_autotranscribe_whisper_tiny(audio: AudioProcessor, turns: list, args,
+                                      timings: TimingCollector) -> None:
+    global _WHISPER_TINY
+    if _WHISPER_TINY is None:
+        from scraibe import load_transcriber
+        _WHISPER_TINY = load_transcriber("tiny", "whisper", device="cpu")
+    _autotranscribe(_WHISPER_TINY, audio, turns, args, timings, batch_size=8)
+
+
+def whisper_tiny_cached() -> bool:
+    """
+    Whether the Whisper tiny model is downloaded, so it can be used without network.
+    """
+    return os.path.exists(os.path.join(WHISPER_DEFAULT_PATH, "tiny.pt"))
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    "audio_cut_many": bench_audio_cut_many,
+    "audio_detect_speech": bench_audio_detect_speech,
+    "format_diarization_output": bench_format_diarization_output,
+    "transcript_export": bench_transcript_export,
+    "autotranscribe": bench_autotranscribe,
+    "autotranscribe_batch": bench_autotranscribe_batch,
+    "autotranscribe_whisper_tiny": bench_autotranscribe_whisper_tiny,
+}
+
+# benchmarks that report the stages of the Scraibe pipeline
+PIPELINE_BENCHMARKS = ("autotranscribe", "autotranscribe_batch", "autotranscribe_whisper_tiny")
+
+
+def run_benchmark(name: str, audio: AudioProcessor, turns: list, args) -> dict:
+    """
+    Runs a benchmark `args.repeat` times after one warm-up run.
+
+    Args:
+        name (str): Name of the benchmark, a key of BENCHMARKS.
+        audio (AudioProcessor): The synthetic audio.
+        turns (list): Start, end and speaker of each turn of the audio.
+        args: Parsed command line arguments.
+
+    Returns:
+        dict: Wall times, throughput, the stages of the last run and the peak
+                resident memory in MiB.
+    """
+    func = BENCHMARKS[name]
+    timings = TimingCollector()
+    extra = (timings,) if name in PIPELINE_BENCHMARKS else ()
+
+    # the peak of this benchmark where supported, else the peak of the process
+    reset_peak_rss()
+    func(audio, turns, args, *extra)
+
+    times = []
+    for _ in range(args.repeat):
+        timings.reset()
+        start = perf_counter()
+        func(audio, turns, args, *extra)
+        times.append(perf_counter() - start)
+
+    audio_seconds = len(audio.waveform) / audio.sr
+    median = statistics.median(times)
+
+    return {"name": name,
+            "duration": audio_seconds,
+            "turns": len(turns),
+            "repeat": args.repeat,
+            "wall_time_min": min(times),
+            "wall_time_median": median,
+            "throughput": audio_seconds / median if median else None,
+            "stages": timings.to_dict() if extra else None,
+            "peak_rss_mb": peak_rss_mb()}
+
+
+def metadata() -> dict:
+    """
+    Describes the environment of a run, so results of different commits can be matched.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                                text=True, check=True,
+                                cwd=os.path.dirname(__file__)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {"commit": commit,
+            "python": platform.python_version(),
+            "torch": torch.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "torch_threads": torch.get_num_threads()}
+
+
+def run_suite(args) -> dict:
+    """
+    Runs the selected benchmarks for every audio length.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        dict: The metadata of the run, its settings and the result of each benchmark.
+    """
+    names = args.benchmarks or [name for name in BENCHMARKS
+                                if name != "autotranscribe_whisper_tiny" or whisper_tiny_cached()]
+    results = []
+
+    for duration in args.durations:
+        waveform, turns = synthetic_audio(duration, num_speakers=args.speakers, seed=args.seed)
+        audio = AudioProcessor(waveform)
+
+        for name in names:
+            result = run_benchmark(name, audio, turns, args)
+            results.append(result)
+            if args.verbose:
+                print(f"{name} ({duration:g} s): {result['wall_time_median'] * 1000:.1f} ms, "
+                      f"{result['throughput']:.0f}x real time")
+
+    settings = {key: value for key, value in vars(args).items()
+                if key not in ("output", "compare", "verbose")}
+
+    return {"metadata": metadata(), "settings": settings, "results": results}
+
+
+def compare(results: dict, baseline: dict, threshold: float = 0.1) -> List[dict]:
+    """
+    Compares the median wall times of two runs and prints the ratios.
+
+    Args:
+        results (dict): The new run, see `run_suite`.
+        baseline (dict): The run to compare with.
+        threshold (float, optional): Relative slow-down reported as a regression.
+                                     Defaults to 0.1.
+
+    Returns:
+        List[dict]: Name, duration and wall time ratio of each benchmark in both runs.
+    """
+    base = {(r["name"], r["duration"]): r for r in baseline["results"]}
+    ratios = []
+
+    for result in results["results"]:
+        other = base.get((result["name"], result["duration"]))
+        if other is None or not other["wall_time_median"]:
+            continue
+        ratio = result["wall_time_median"] / other["wall_time_median"]
+        flag = "  regression" if ratio > 1 + threshold else ""
+        print(f"{result['name']} ({result['duration']:g} s): {ratio:.2f}x{flag}")
+        ratios.append({"name": result["name"], "duration": result["duration"], "ratio": ratio})
+
+    return ratios
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = ArgumentParser(description="CPU benchmarks of ScrAIbe with synthetic "
+                                        "audio and stub models.")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=None,
+                        help="Benchmarks to run. Defaults to all, the real Whisper tiny "
+                             "model only if it is already downloaded.")
+    parser.add_argument("--durations", nargs="+", type=float, default=[60.0, 600.0, 1800.0],
+                        help="Lengths of the synthetic audio in seconds.")
+    parser.add_argument("--speakers", type=int, default=3,
+                        help="Number of speakers of the synthetic audio.")
+    parser.add_argument("--splits", type=int, default=4,
+                        help="Number of diarisation tracks each turn is split into.")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Simulated seconds per call of the stub models.")
+    parser.add_argument("--transcriber-rtf", type=float, default=0.0,
+                        help="Simulated seconds of the stub transcriber per second of audio.")
+    parser.add_argument("--diariser-rtf", type=float, default=0.0,
+                        help="Simulated seconds of the stub diariser per second of audio.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Number of timed runs of each benchmark.")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed of the synthetic audio.")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Path of the JSON results. Printed if not given.")
+    parser.add_argument("--compare", type=str, default=None,
+                        help="JSON results of an earlier run to compare with.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Print the result of each benchmark as it finishes.")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    args = parse_args(argv)
+    results = run_suite(args)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
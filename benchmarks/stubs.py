@@ -0,0 +1,182 @@
+"""
+Stub Models
+===========
+
+Deterministic stand-ins for the Whisper and pyannote models, so the pipeline
+around the models can be benchmarked on any CPU. The latency of the models is
+simulated by sleeping, with a fixed part per call and a part proportional to
+the seconds of audio.
+
+Available Classes:
+- StubTranscriber: Transcriber returning deterministic text for each segment.
+- StubDiariser: Diariser returning the known turns of synthetic audio.
+"""
+
+import time
+from typing import List, Optional, Tuple, Union
+
+from numpy import ndarray
+from pyannote.core import Annotation, Segment
+from torch import Tensor
+
+from scraibe.audio import SAMPLE_RATE
+from scraibe.diarisation import Diariser
+from scraibe.transcriber import Transcriber, WhisperTranscriber
+
+WORDS_PER_SECOND = 2.5
+
+
+def _sleep(latency: float, rtf: float, seconds: float) -> None:
+    delay = latency + rtf * seconds
+    if delay > 0:
+        time.sleep(delay)
+
+
+class StubTranscriber(Transcriber):
+    """
+    Transcriber that returns "word" repeated for every 0.4 seconds of audio.
+
+    Attributes:
+        latency (float): Simulated seconds per model call.
+        rtf (float): Simulated seconds per second of audio.
+        calls (int): Number of model calls.
+    """
+
+    def __init__(self, latency: float = 0.0, rtf: float = 0.0,
+                 sr: int = SAMPLE_RATE) -> None:
+        """
+        Initialize the StubTranscriber.
+
+        Args:
+            latency (float, optional): Simulated seconds per model call. Defaults to 0.0.
+            rtf (float, optional): Simulated seconds per second of audio. Defaults to 0.0.
+            sr (int, optional): Sample rate of the audio. Defaults to SAMPLE_RATE.
+        """
+        super().__init__(None, "stub")
+        self.latency = latency
+        self.rtf = rtf
+        self.sr = sr
+        self.calls = 0
+
+    def transcribe(self, audio: Union[Tensor, ndarray], *args, **kwargs) -> str:
+        seconds = len(audio) / self.sr
+        self.calls += 1
+        _sleep(self.latency, self.rtf, seconds)
+
+        return self._text(seconds)
+
+    def transcribe_batch(self, audios: List[Union[Tensor, ndarray]],
+                         batch_size: int = 8, *args, **kwargs) -> List[str]:
+        seconds = [len(audio) / self.sr for audio in audios]
+        # one model call per batch
+        self.calls += -(-len(audios) // batch_size)
+        _sleep(self.latency * -(-len(audios) // batch_size), self.rtf, sum(seconds))
+
+        return [self._text(duration) for duration in seconds]
+
+    def transcribe_words(self, audio: Union[Tensor, ndarray],
+                         *args, **kwargs) -> List[Tuple[float, float, str]]:
+        seconds = len(audio) / self.sr
+        self.calls += 1
+        _sleep(self.latency, self.rtf, seconds)
+
+        return self._words(seconds)
+
+    def transcribe_words_batch(self, audios: List[Union[Tensor, ndarray]],
+                               batch_size: int = 8, *args,
+                               **kwargs) -> List[List[Tuple[float, float, str]]]:
+        seconds = [len(audio) / self.sr for audio in audios]
+        # one model call per batch
+        self.calls += -(-len(audios) // batch_size)
+        _sleep(self.latency * -(-len(audios) // batch_size), self.rtf, sum(seconds))
+
+        return [self._words(duration) for duration in seconds]
+
+    def detect_language(self, audio: Union[Tensor, ndarray],
+                        *args, **kwargs) -> Tuple[str, float]:
+        self.calls += 1
+        _sleep(self.latency, 0.0, 0.0)
+
+        return "en", 1.0
+
+    @staticmethod
+    def _get_whisper_kwargs(**kwargs) -> dict:
+        # the stub stands in for a Whisper model, so it takes the same options
+        return WhisperTranscriber._get_whisper_kwargs(**kwargs)
+
+    @staticmethod
+    def _text(seconds: float) -> str:
+        return " word" * max(1, int(seconds * WORDS_PER_SECOND))
+
+    @staticmethod
+    def _words(seconds: float) -> List[Tuple[float, float, str]]:
+        num_words = int(seconds * WORDS_PER_SECOND)
+        step = seconds / num_words if num_words else 0.0
+
+        return [(i * step, (i + 1) * step, " word") for i in range(num_words)]
+
+    def __repr__(self) -> str:
+        return f"StubTranscriber(latency={self.latency}, rtf={self.rtf})"
+
+
+class StubDiariser(Diariser):
+    """
+    Diariser that returns known turns as a pyannote Annotation, so the output
+    still goes through `Diariser.format_diarization_output`.
+
+    Attributes:
+        turns (List[Tuple[float, float, str]]): Start, end and speaker of each turn.
+        splits (int): Number of tracks each turn is split into.
+        latency (float): Simulated seconds per call.
+        rtf (float): Simulated seconds per second of audio.
+    """
+
+    def __init__(self, turns: Optional[List[Tuple[float, float, str]]] = None,
+                 splits: int = 1, latency: float = 0.0, rtf: float = 0.0) -> None:
+        """
+        Initialize the StubDiariser.
+
+        Args:
+            turns (List[Tuple[float, float, str]], optional): Start, end and speaker
+                                    of each turn, e.g. from `synthetic_audio`.
+                                    Defaults to a single speaker for the whole audio.
+            splits (int, optional): Number of consecutive tracks of the same speaker
+                                    each turn is split into, to increase the number of
+                                    segments to format. Defaults to 1.
+            latency (float, optional): Simulated seconds per call. Defaults to 0.0.
+            rtf (float, optional): Simulated seconds per second of audio. Defaults to 0.0.
+        """
+        super().__init__(self._annotate, model_name="stub")
+        self.turns = turns
+        self.splits = splits
+        self.latency = latency
+        self.rtf = rtf
+
+    def _annotate(self, audio: dict, *args, **kwargs) -> Annotation:
+        seconds = audio["waveform"].shape[-1] / audio["sample_rate"]
+        _sleep(self.latency, self.rtf, seconds)
+
+        return self.annotation(self.turns or [(0.0, seconds, "SPEAKER_00")], self.splits)
+
+    @staticmethod
+    def annotation(turns: List[Tuple[float, float, str]], splits: int = 1) -> Annotation:
+        """
+        Build a pyannote Annotation from turns.
+
+        Args:
+            turns (List[Tuple[float, float, str]]): Start, end and speaker of each turn.
+            splits (int, optional): Number of tracks each turn is split into. Defaults to 1.
+
+        Returns:
+            Annotation: The annotation.
+        """
+        annotation = Annotation()
+        for start, end, speaker in turns:
+            step = (end - start) / splits
+            for k in range(splits):
+                annotation[Segment(start + k * step, start + (k + 1) * step), k] = speaker
+
+        return annotation
+
+    def __repr__(self) -> str:
+        return f"StubDiariser(splits={self.splits}, latency={self.latency}, rtf={self.rtf})"
@@ -1,11 +1,141 @@
-from .autotranscript import *
-from .transcriber import *
-from .audio import *
-from .transcript_exporter import *
-from .diarisation import *
+"""
+ScrAIbe
+=======
 
-from .misc import *
+Transcription and speaker diarisation of audio files based on Whisper and pyannote.
 
-from .cli import *
+The public classes and functions are loaded on first access (PEP 562), so
+`import scraibe` is fast and e.g. `from scraibe import Transcript` does not
+import torch, Whisper or pyannote.audio.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from ._version import __version__
+
+# public attribute -> submodule defining it
+_LAZY_ATTRIBUTES = {
+    # autotranscript
+    "Scraibe": "autotranscript",
+    "DiarisationType": "autotranscript",
+    # transcriber
+    "Transcriber": "transcriber",
+    "WhisperTranscriber": "transcriber",
+    "FasterWhisperTranscriber": "transcriber",
+    "load_transcriber": "transcriber",
+    "whisper": "transcriber",
+    "N_FRAMES": "transcriber",
+    "N_SAMPLES": "transcriber",
+    "TO_LANGUAGE_CODE": "transcriber",
+    # audio
+    "AudioProcessor": "audio",
+    "AudioCache": "audio",
+    "AudioPrefetcher": "audio",
+    "register_decoder": "audio",
+    "SAMPLE_RATE": "audio",
+    "NORMALIZATION_FACTOR": "audio",
+    "CHUNK_SIZE": "audio",
+    "STORAGE_DTYPES": "audio",
+    "AUDIO_DECODERS": "audio",
+    "DECODER_STATS": "audio",
+    # transcript_exporter
+    "Transcript": "transcript_exporter",
+    "ALPHABET": "transcript_exporter",
+    "KNOWN_HALLUCINATIONS": "transcript_exporter",
+    # diarisation
+    "Diariser": "diarisation",
+    "Annotation": "diarisation",
+    "TOKEN_PATH": "diarisation",
+    "PIPELINE_CONFIG_NAME": "diarisation",
+    "MANIFEST_NAME": "diarisation",
+    "WINDOW_KWARGS": "diarisation",
+    "SpeakerStitcher": "diarisation",
+    # scheduler
+    "SegmentScheduler": "scheduler",
+    "WHISPER_WINDOW": "scheduler",
+    # journal
+    "Journal": "journal",
+    # disk_cache
+    "DiskCache": "disk_cache",
+    # result_cache
+    "ResultCache": "result_cache",
+    "RESULT_KINDS": "result_cache",
+    # instrumentation
+    "StageObserver": "instrumentation",
+    "TimingCollector": "instrumentation",
+    "StageTimer": "instrumentation",
+    "NULL_TIMER": "instrumentation",
+    "STAGES": "instrumentation",
+    # placement
+    "ModelPlacement": "placement",
+    "OFFLOAD_POLICIES": "placement",
+    "STAGE_MODELS": "placement",
+    "current_rss_mb": "placement",
+    "peak_rss_mb": "placement",
+    "reset_peak_rss": "placement",
+    # registry
+    "ModelRegistry": "registry",
+    "MODEL_REGISTRY": "registry",
+    # misc
+    "CACHE_DIR": "misc",
+    "WHISPER_DEFAULT_PATH": "misc",
+    "PYANNOTE_DEFAULT_PATH": "misc",
+    "PYANNOTE_DEFAULT_CONFIG": "misc",
+    "AUDIO_CACHE_DIR": "misc",
+    "AUDIO_CACHE_MAX_BYTES": "misc",
+    "RESULT_CACHE_DIR": "misc",
+    "RESULT_CACHE_MAX_BYTES": "misc",
+    "MODEL_REGISTRY_MAX_BYTES": "misc",
+    "SCRAIBE_TORCH_DEVICE": "misc",
+    "SCRAIBE_NUM_THREADS": "misc",
+    "SCRAIBE_OFFLINE": "misc",
+    "DIARISATION_OVERLAP": "misc",
+    "SPEAKER_THRESHOLD": "misc",
+    "config_diarization_yaml": "misc",
+    "set_threads": "misc",
+    "ParseKwargs": "misc",
+    # cli
+    "cli": "cli",
+    "process_file": "cli",
+    "run_workers": "cli",
+    "save_timings": "cli",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES) + ["__version__"]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    # cache it, this also replaces the submodule `cli` by the function
+    globals()[name] = value
+    if module == "cli":
+        # importing the submodule binds `cli` to it, the package exports the function
+        globals()["cli"] = import_module(".cli", __name__).cli
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if TYPE_CHECKING:
+    from .autotranscript import *
+    from .transcriber import *
+    from .audio import *
+    from .transcript_exporter import *
+    from .diarisation import *
+    from .scheduler import *
+    from .journal import *
+    from .disk_cache import *
+    from .result_cache import *
+    from .instrumentation import *
+    from .placement import *
+    from .registry import *
+    from .misc import *
+    from .cli import *
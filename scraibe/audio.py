@@ -9,6 +9,19 @@ flexible audio processing.
 Available Classes:
 - AudioProcessor: Processes audio waveforms and provides methods for loading, 
                     cutting, and handling audio.
+- AudioCache: On-disk cache of decoded waveforms, loaded through memory maps.
+- AudioPrefetcher: Decodes the next audio files in the background while
+                    the current one is processed.
+
+Available Functions:
+- register_decoder: Registers an additional audio decoder backend.
+
+Decoders:
+    Audio files are decoded by the first backend in AUDIO_DECODERS that can handle
+    them. The in-process "soundfile" (if installed) and "wave" backends read PCM
+    WAV/FLAC files without spawning a subprocess, "ffmpeg" handles everything else.
+    The backend used for a file is stored in `AudioProcessor.decoder` and counted
+    in DECODER_STATS.
 
 Usage:
     from .audio_import AudioProcessor
@@ -19,14 +32,40 @@ Usage:
 Constants:
 - SAMPLE_RATE (int): Default sample rate for processing.
 - NORMALIZATION_FACTOR (float): Normalization factor for audio waveform.
+- CHUNK_SIZE (int): Number of samples read from ffmpeg per chunk when streaming.
+- STORAGE_DTYPES (tuple): Supported storage dtypes of the waveform.
+- AUDIO_DECODERS (dict): Registered decoder backends in the order they are tried.
+- DECODER_STATS (Counter): Number of files decoded by each backend.
 """
 
-from subprocess import CalledProcessError, run
+import os
+import wave
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from subprocess import CalledProcessError, PIPE, DEVNULL, Popen, run
+from tempfile import TemporaryFile
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 import numpy as np
 import torch
 
+try:
+    import soundfile
+except (ImportError, OSError):
+    soundfile = None
+
+try:
+    from torchaudio.functional import resample
+except (ImportError, OSError):
+    resample = None
+
+from .disk_cache import DiskCache
+from .misc import AUDIO_CACHE_DIR, AUDIO_CACHE_MAX_BYTES
+
 SAMPLE_RATE = 16000
 NORMALIZATION_FACTOR = 32768.0
+CHUNK_SIZE = 2 ** 20
+STORAGE_DTYPES = (torch.float32, torch.float16, torch.int16)
 
 
 class AudioProcessor:
@@ -36,48 +75,115 @@ class AudioProcessor:
 
     Attributes:
         waveform: torch.Tensor
-            The audio waveform tensor.
+            The audio waveform tensor in its storage dtype.
         sr: int
             The sample rate of the audio.
+        decoder: Optional[str]
+            The backend that decoded the audio, if it was loaded from a file.
+        offset: float
+            Time in seconds of the first sample within the original file.
+            All times passed to and returned by the methods are absolute
+            file times, so they are unaffected by partial decoding.
+
+    The waveform can be stored as int16 or float16 to halve resident memory.
+    `cut`, `cut_many` and `float_waveform` always return float32, converting
+    only the requested samples.
     """
 
     def __init__(self, waveform: torch.Tensor,
-                 sr: int = SAMPLE_RATE) -> None:
+                 sr: int = SAMPLE_RATE,
+                 dtype: Optional[Union[str, torch.dtype]] = None,
+                 offset: float = 0.0) -> None:
         """
         Initialize the AudioProcessor object.
 
         Args:
             waveform (torch.Tensor): The audio waveform tensor.
             sr (int, optional): The sample rate of the audio. Defaults to SAMPLE_RATE.
+            dtype (Optional[Union[str, torch.dtype]], optional): Storage dtype of
+                                the waveform, one of STORAGE_DTYPES. Defaults to None,
+                                which keeps the dtype of the given waveform.
+            offset (float, optional): Time in seconds of the first sample within
+                                the original file. Defaults to 0.0.
 
         Raises:
-            ValueError: If the provided sample rate is not of type int.
+            ValueError: If the provided sample rate is not of type int
+                        or the storage dtype is not supported.
         """
 
-        self.waveform = waveform
+        self.waveform = self._to_storage(waveform, dtype)
         self.sr = sr
+        self.decoder = None
+        self.offset = offset
 
         if not isinstance(self.sr, int):
             raise ValueError("Sample rate should be a single value of type int,"
                              f"not {len(self.sr)} and type {type(self.sr)}")
 
     @classmethod
-    def from_file(cls, file: str, *args, **kwargs) -> 'AudioProcessor':
+    def from_file(cls, file: str, *args,
+                  cache: Union[bool, 'AudioCache'] = False,
+                  dtype: Optional[Union[str, torch.dtype]] = None,
+                  start: Optional[float] = None,
+                  duration: Optional[float] = None,
+                  **kwargs) -> 'AudioProcessor':
         """
         Create an AudioProcessor instance from an audio file.
 
         Args:
             file (str): The audio file path.
+            cache (Union[bool, AudioCache], optional): If True, or an AudioCache
+                                instance, decoded audio is looked up in and stored
+                                to the on-disk cache. Defaults to False.
+            dtype (Optional[Union[str, torch.dtype]], optional): Storage dtype of
+                                the waveform, one of STORAGE_DTYPES. With int16, the
+                                file is decoded straight to int16 without a float32
+                                copy of the whole waveform, unless it is cached.
+                                Defaults to None.
+            start (Optional[float], optional): Start time in seconds of the range to
+                                decode. ffmpeg seeks in the input, so audio before it
+                                is not decoded. Defaults to None.
+            duration (Optional[float], optional): Duration in seconds of the range
+                                to decode. Defaults to None, which decodes to the end.
 
         Returns:
             AudioProcessor: An instance of the AudioProcessor class containing the loaded audio.
         """
+        partial = start is not None or duration is not None
+        # the cache stores float32, other files are decoded to int16 directly
+        decode_dtype = "int16" if dtype in ("int16", torch.int16) and not cache else "float32"
+
+        if cache:
+            if not isinstance(cache, AudioCache):
+                cache = AudioCache()
 
-        audio, sr = cls.load_audio(file, *args, **kwargs)
+            sr = kwargs.get("sr", args[0] if args else SAMPLE_RATE)
+            key = cache.key(file, sr)
+            audio = cache.load(key)
+
+            if audio is None and partial:
+                # only whole files are cached
+                audio, sr, decoder = cls.decode(file, *args, start=start,
+                                                duration=duration, **kwargs)
+            elif audio is None:
+                audio, sr, decoder = cls.decode(file, *args, **kwargs)
+                audio = cache.store(key, audio)
+            else:
+                decoder = "cache"
+                if partial:
+                    first = int(round((start or 0.0) * sr))
+                    last = first + int(round(duration * sr)) if duration is not None else None
+                    audio = audio[first:last]
+        else:
+            audio, sr, decoder = cls.decode(file, *args, start=start, duration=duration,
+                                            dtype=decode_dtype, **kwargs)
 
         audio = torch.from_numpy(audio)
 
-        return cls(audio, sr)
+        processor = cls(audio, sr, dtype=dtype, offset=float(start or 0.0))
+        processor.decoder = decoder
+
+        return processor
 
     def cut(self, start: float, end: float) -> torch.Tensor:
         """
@@ -88,26 +194,306 @@ class AudioProcessor:
             end (float): End time in seconds.
 
         Returns:
-            torch.Tensor: The cut waveform segment.
+            torch.Tensor: The cut waveform segment, empty if it lies outside
+                            the decoded audio.
         """
-
-        start = int(start * self.sr)
+        length = len(self.waveform)
+        start = min(max(int((start - self.offset) * self.sr), 0), length)
         if (isinstance(end, float) or isinstance(end, int)) and isinstance(self.sr, int):
-            end = int(np.ceil(end * self.sr))
+            end = int(np.ceil((end - self.offset) * self.sr))
         else:
-            end = int(torch.ceil(end * self.sr))
-        return self.waveform[start:end]
+            end = int(torch.ceil((end - self.offset) * self.sr))
+        # clamped like `cut_many`, a negative end would count from the end of the buffer
+        end = min(max(end, start), length)
+        return self._to_float(self.waveform[start:end])
+
+    def cut_many(self, segments: Union[np.ndarray, torch.Tensor, list],
+                 pad: bool = False
+                 ) -> Union[List[torch.Tensor], Tuple[torch.Tensor, torch.Tensor]]:
+        """
+        Cut several segments from the audio waveform at once.
+
+        Sample indices for all segments are computed in a single vectorized pass,
+        using the same rounding as `cut`.
+
+        Args:
+            segments (Union[np.ndarray, torch.Tensor, list]): Array of shape (N, 2)
+                                            holding start and end times in seconds.
+            pad (bool, optional): If True, return one zero-padded batch tensor
+                                  instead of a list of views. Defaults to False.
+
+        Returns:
+            Union[List[torch.Tensor], Tuple[torch.Tensor, torch.Tensor]]:
+                If pad is False, a list of views into the waveform without copies
+                (converted copies if the waveform is not stored as float32).
+                If pad is True, a tensor of shape (N, T) with T the longest segment
+                and a tensor of shape (N,) with the length of each segment in samples.
+
+        Raises:
+            ValueError: If segments is not of shape (N, 2).
+        """
+        if isinstance(segments, torch.Tensor):
+            segments = segments.detach().cpu().numpy()
+        segments = np.asarray(segments, dtype=np.float64)
+        if segments.size == 0:
+            segments = segments.reshape(0, 2)
+
+        if segments.ndim != 2 or segments.shape[1] != 2:
+            raise ValueError("Segments should be of shape (N, 2), "
+                             f"not {segments.shape}")
+
+        segments = segments - self.offset
+
+        bounds = np.empty(segments.shape, dtype=np.int64)
+        bounds[:, 0] = np.trunc(segments[:, 0] * self.sr)
+        bounds[:, 1] = np.ceil(segments[:, 1] * self.sr)
+        np.clip(bounds, 0, len(self.waveform), out=bounds)
+        bounds[:, 1] = np.maximum(bounds[:, 0], bounds[:, 1])
+
+        views = [self.waveform[start:end] for start, end in bounds.tolist()]
+
+        if not pad:
+            return [self._to_float(view) for view in views]
+
+        lengths = torch.from_numpy(bounds[:, 1] - bounds[:, 0])
+        if not views:
+            return self.waveform.new_zeros((0, 0), dtype=torch.float32), lengths
+
+        batch = torch.nn.utils.rnn.pad_sequence(views, batch_first=True)
+
+        return self._to_float(batch), lengths
+
+    def float_waveform(self) -> torch.Tensor:
+        """
+        Get the full waveform as float32, e.g. to hand it to a model.
+
+        Returns:
+            torch.Tensor: The waveform itself if it is stored as float32,
+                            otherwise a converted copy.
+        """
+        return self._to_float(self.waveform)
+
+    def detect_speech(self, frame_duration: float = 0.03,
+                      threshold_db: float = -60.0,
+                      margin_db: float = 12.0,
+                      zcr_threshold: float = 0.25,
+                      min_speech: float = 0.25,
+                      min_silence: float = 0.5,
+                      padding: float = 0.2) -> np.ndarray:
+        """
+        Find speech regions with an energy and zero-crossing rate voice activity detector.
+
+        Frames louder than the noise floor (10th percentile of the frame energies)
+        plus `margin_db` count as speech. Quieter frames with a high zero-crossing
+        rate count as speech too, to keep unvoiced consonants. Silences shorter than
+        `min_silence` are bridged, speech shorter than `min_speech` is dropped and
+        the remaining regions are padded on both sides.
+
+        Args:
+            frame_duration (float, optional): Frame length in seconds. Defaults to 0.03.
+            threshold_db (float, optional): Minimum frame energy of speech in dBFS.
+                                            Defaults to -60.0.
+            margin_db (float, optional): Margin above the noise floor in dB.
+                                         Defaults to 12.0.
+            zcr_threshold (float, optional): Zero-crossing rate above which quieter
+                                             frames count as speech. Defaults to 0.25.
+            min_speech (float, optional): Minimum duration of a speech region in
+                                          seconds. Defaults to 0.25.
+            min_silence (float, optional): Minimum duration of a skipped silence in
+                                           seconds. Defaults to 0.5.
+            padding (float, optional): Padding added around each speech region in
+                                       seconds. Defaults to 0.2.
+
+        Returns:
+            np.ndarray: Array of shape (K, 2) holding start and end times of
+                        the speech regions in seconds.
+        """
+        frame = max(2, int(frame_duration * self.sr))
+        n_frames = len(self.waveform) // frame
+        if n_frames == 0:
+            return np.empty((0, 2))
+
+        energy = np.empty(n_frames, dtype=np.float32)
+        zcr = np.empty(n_frames, dtype=np.float32)
+
+        step = max(1, CHUNK_SIZE // frame)
+        for i in range(0, n_frames, step):
+            j = min(i + step, n_frames)
+            x = self._to_float(self.waveform[i * frame:j * frame])
+            x = x.cpu().numpy().reshape(j - i, frame)
+            energy[i:j] = np.einsum("ij,ij->i", x, x) / frame
+            signs = np.signbit(x)
+            zcr[i:j] = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1)
+        zcr /= frame - 1
+
+        db = 10 * np.log10(energy + 1e-10)
+        threshold = max(threshold_db, float(np.percentile(db, 10)) + margin_db)
+        speech = (db > threshold) | ((db > threshold - margin_db / 2) & (zcr > zcr_threshold))
+
+        edges = np.diff(speech.astype(np.int8), prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1) * frame
+        ends = np.flatnonzero(edges == -1) * frame
+
+        starts, ends = self._merge_regions(starts, ends, int(min_silence * self.sr))
+        keep = ends - starts >= int(min_speech * self.sr)
+        starts, ends = starts[keep], ends[keep]
+
+        pad = int(padding * self.sr)
+        starts = np.maximum(starts - pad, 0)
+        ends = np.minimum(ends + pad, len(self.waveform))
+        starts, ends = self._merge_regions(starts, ends, 0)
+
+        return np.stack([starts, ends], axis=1) / self.sr + self.offset
+
+    def keep_regions(self, regions: np.ndarray) -> 'AudioProcessor':
+        """
+        Create a new AudioProcessor that only contains the given regions, joined
+        back to back. Use `map_segments` to map times on the new timeline back.
+
+        Args:
+            regions (np.ndarray): Array of shape (K, 2) holding sorted,
+                                  non-overlapping start and end times in seconds.
+
+        Returns:
+            AudioProcessor: The audio of the regions in the storage dtype.
+        """
+        regions = np.asarray(regions, dtype=np.float64) - self.offset
+        bounds = np.round(regions * self.sr).astype(np.int64)
+        np.clip(bounds, 0, len(self.waveform), out=bounds)
+
+        waveform = torch.cat([self.waveform[start:end] for start, end in bounds.tolist()]) \
+            if len(bounds) else self.waveform[:0]
+
+        return AudioProcessor(waveform, self.sr)
+
+    @staticmethod
+    def map_segments(segments: Union[np.ndarray, list],
+                     regions: np.ndarray) -> np.ndarray:
+        """
+        Map segments on the timeline of `keep_regions` back to the original timeline.
+
+        Args:
+            segments (Union[np.ndarray, list]): Array of shape (N, 2) holding start
+                                                and end times in seconds.
+            regions (np.ndarray): The regions passed to `keep_regions`.
+
+        Returns:
+            np.ndarray: Array of shape (N, 2) holding the original start and end times.
+        """
+        segments = np.asarray(segments, dtype=np.float64).reshape(-1, 2)
+        regions = np.asarray(regions, dtype=np.float64).reshape(-1, 2)
+        if len(regions) == 0:
+            return segments.copy()
+
+        durations = regions[:, 1] - regions[:, 0]
+        offsets = np.cumsum(durations) - durations
+        shift = regions[:, 0] - offsets
+
+        # a segment ending exactly at a join belongs to the region before it
+        first = np.searchsorted(offsets, segments[:, 0], side="right") - 1
+        last = np.searchsorted(offsets, segments[:, 1], side="left") - 1
+        first = np.clip(first, 0, len(regions) - 1)
+        last = np.clip(last, 0, len(regions) - 1)
+
+        return np.stack([segments[:, 0] + shift[first],
+                         segments[:, 1] + shift[last]], axis=1)
+
+    @staticmethod
+    def _merge_regions(starts: np.ndarray, ends: np.ndarray,
+                       min_gap: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Merge consecutive regions separated by gaps shorter than `min_gap`.
+        """
+        if len(starts) == 0:
+            return starts, ends
+
+        keep = starts[1:] - ends[:-1] >= max(min_gap, 1)
+        return starts[np.r_[True, keep]], ends[np.r_[keep, True]]
+
+    @staticmethod
+    def _to_float(waveform: torch.Tensor) -> torch.Tensor:
+        """
+        Convert a waveform in storage dtype to float32.
+
+        Args:
+            waveform (torch.Tensor): The waveform in storage dtype.
+
+        Returns:
+            torch.Tensor: The waveform in float32 dtype.
+        """
+        if waveform.dtype == torch.int16:
+            return waveform.to(torch.float32) / NORMALIZATION_FACTOR
+        if waveform.dtype != torch.float32 and waveform.is_floating_point():
+            return waveform.to(torch.float32)
+        return waveform
+
+    @staticmethod
+    def _to_storage(waveform: torch.Tensor,
+                    dtype: Optional[Union[str, torch.dtype]]) -> torch.Tensor:
+        """
+        Convert a float32 waveform to its storage dtype.
+
+        Conversion to int16 runs in chunks of CHUNK_SIZE samples, so no
+        full-size float32 temporary is created.
+
+        Args:
+            waveform (torch.Tensor): The waveform.
+            dtype (Optional[Union[str, torch.dtype]]): The storage dtype.
+
+        Returns:
+            torch.Tensor: The waveform in storage dtype.
+
+        Raises:
+            ValueError: If the storage dtype is not supported.
+        """
+        if dtype is None:
+            return waveform
+
+        if isinstance(dtype, str):
+            dtype = getattr(torch, dtype, None)
+        if dtype not in STORAGE_DTYPES:
+            raise ValueError(f"Storage dtype should be one of {STORAGE_DTYPES}, "
+                             f"not {dtype}")
+
+        if waveform.dtype == dtype:
+            return waveform
+        if dtype != torch.int16:
+            return AudioProcessor._to_float(waveform).to(dtype)
+
+        out = torch.empty(waveform.shape, dtype=torch.int16, device=waveform.device)
+        for i in range(0, len(waveform), CHUNK_SIZE):
+            chunk = waveform[i:i + CHUNK_SIZE] * NORMALIZATION_FACTOR
+            out[i:i + CHUNK_SIZE] = chunk.round_().clamp_(-NORMALIZATION_FACTOR,
+                                                          NORMALIZATION_FACTOR - 1)
+        return out
 
     @staticmethod
-    def load_audio(file: str, sr: int = SAMPLE_RATE):
+    def load_audio(file: str, sr: int = SAMPLE_RATE,
+                   stream: bool = False, chunk_size: int = CHUNK_SIZE,
+                   decoder: Optional[str] = None,
+                   start: Optional[float] = None,
+                   duration: Optional[float] = None):
         """
         Open an audio file and read it as a mono waveform, resampling if necessary.
-        This method ensures compatibility with pyannote.audio
-        and requires the ffmpeg CLI in PATH.
+        This method ensures compatibility with pyannote.audio.
+        Files that no in-process decoder can handle require the ffmpeg CLI in PATH.
 
         Args:
             file (str): The audio file to open.
             sr (int, optional): The desired sample rate. Defaults to SAMPLE_RATE.
+            stream (bool, optional): If True, ffmpeg's output is read in chunks
+                                     and converted in place into a single preallocated
+                                     float32 buffer, keeping peak memory close to
+                                     the size of the final waveform. Defaults to False.
+            chunk_size (int, optional): Number of samples per chunk when streaming.
+                                        Defaults to CHUNK_SIZE.
+            decoder (Optional[str], optional): Name of the decoder backend to use.
+                                        Defaults to None, which tries all
+                                        backends in AUDIO_DECODERS.
+            start (Optional[float], optional): Start time in seconds of the range
+                                        to decode. Defaults to None.
+            duration (Optional[float], optional): Duration in seconds of the range
+                                        to decode. Defaults to None.
 
         Returns:
             tuple: A NumPy array containing the audio waveform in float32 dtype
@@ -116,6 +502,255 @@ class AudioProcessor:
         Raises:
             RuntimeError: If failed to load audio.
         """
+        audio, sr, _ = AudioProcessor.decode(file, sr, stream=stream,
+                                             chunk_size=chunk_size, decoder=decoder,
+                                             start=start, duration=duration)
+
+        return audio, sr
+
+    @staticmethod
+    def decode(file: str, sr: int = SAMPLE_RATE,
+               stream: bool = False, chunk_size: int = CHUNK_SIZE,
+               decoder: Optional[str] = None,
+               start: Optional[float] = None,
+               duration: Optional[float] = None,
+               dtype: str = "float32") -> Tuple[np.ndarray, int, str]:
+        """
+        Decode an audio file with the first registered backend that can handle it.
+
+        Args:
+            file (str): The audio file to open.
+            sr (int, optional): The desired sample rate. Defaults to SAMPLE_RATE.
+            stream (bool, optional): Passed on to the ffmpeg backend, see `load_audio`.
+            chunk_size (int, optional): Number of samples per chunk.
+                                        Defaults to CHUNK_SIZE.
+            decoder (Optional[str], optional): Name of the decoder backend to use.
+                                        Defaults to None, which tries all
+                                        backends in AUDIO_DECODERS.
+            start (Optional[float], optional): Start time in seconds of the range
+                                        to decode. Defaults to None.
+            duration (Optional[float], optional): Duration in seconds of the range
+                                        to decode. Defaults to None.
+            dtype (str, optional): "float32", or "int16" to decode the 16-bit PCM
+                                        samples without converting them to float32.
+                                        Defaults to "float32".
+
+        Returns:
+            tuple: A NumPy array containing the audio waveform in `dtype`, or in
+                    float32 from a registered backend that does not support int16,
+                    the sample rate and the name of the backend that decoded it.
+
+        Raises:
+            ValueError: If the requested decoder is not registered.
+            RuntimeError: If failed to load audio.
+        """
+        if dtype not in ("float32", "int16"):
+            raise ValueError(f"Decoded dtype should be float32 or int16, not {dtype}.")
+
+        if decoder is not None:
+            if decoder not in AUDIO_DECODERS:
+                raise ValueError(f"Decoder {decoder} is not registered, expected "
+                                 f"one of {list(AUDIO_DECODERS)}.")
+            backends = {decoder: AUDIO_DECODERS[decoder]}
+        else:
+            backends = AUDIO_DECODERS
+
+        for name, backend in backends.items():
+            audio = backend(file, sr, stream=stream, chunk_size=chunk_size,
+                            start=start, duration=duration, dtype=dtype)
+            if audio is not None:
+                DECODER_STATS[name] += 1
+                return audio, sr, name
+
+        raise RuntimeError(f"Failed to load audio: no decoder could handle {file}.")
+
+    @staticmethod
+    def iter_audio(file: str, sr: int = SAMPLE_RATE,
+                   chunk_size: int = CHUNK_SIZE,
+                   start: Optional[float] = None,
+                   duration: Optional[float] = None) -> Iterator[np.ndarray]:
+        """
+        Decode an audio file chunk by chunk as a mono float32 waveform.
+
+        Chunks are yielded as soon as ffmpeg produces them, so downstream
+        processing can start before the whole file has been decoded.
+
+        Args:
+            file (str): The audio file to open.
+            sr (int, optional): The desired sample rate. Defaults to SAMPLE_RATE.
+            chunk_size (int, optional): Number of samples per chunk.
+                                        Defaults to CHUNK_SIZE.
+            start (Optional[float], optional): Start time in seconds of the range
+                                        to decode. Defaults to None.
+            duration (Optional[float], optional): Duration in seconds of the range
+                                        to decode. Defaults to None.
+
+        Yields:
+            np.ndarray: The next chunk of the waveform in float32 dtype.
+
+        Raises:
+            RuntimeError: If failed to load audio.
+        """
+        for pcm in AudioProcessor._iter_pcm(file, sr, chunk_size, start, duration):
+            yield np.divide(pcm, NORMALIZATION_FACTOR, dtype=np.float32)
+
+    @staticmethod
+    def _load_audio_streaming(file: str, sr: int, chunk_size: int,
+                              start: Optional[float] = None,
+                              duration: Optional[float] = None,
+                              dtype: str = "float32") -> np.ndarray:
+        """
+        Decode an audio file into a single preallocated float32 or int16 buffer.
+
+        The buffer is sized from the duration reported by ffprobe. If ffprobe
+        is not available or underestimates the length, the buffer grows.
+
+        Args:
+            file (str): The audio file to open.
+            sr (int): The desired sample rate.
+            chunk_size (int): Number of samples per chunk.
+            start (Optional[float], optional): Start time in seconds of the range
+                                               to decode. Defaults to None.
+            duration (Optional[float], optional): Duration in seconds of the range
+                                                  to decode. Defaults to None.
+            dtype (str, optional): "float32", or "int16" to keep the PCM samples.
+                                   Defaults to "float32".
+
+        Returns:
+            np.ndarray: The waveform in `dtype`.
+        """
+        if duration is not None:
+            num_samples = int(np.ceil(duration * sr)) + 1
+        else:
+            num_samples = AudioProcessor._probe_num_samples(file, sr)
+            if num_samples and start:
+                num_samples = max(num_samples - int(start * sr), 0)
+        out = np.empty(num_samples or chunk_size, dtype=dtype)
+
+        pos = 0
+        for pcm in AudioProcessor._iter_pcm(file, sr, chunk_size, start, duration):
+            n = len(pcm)
+            if pos + n > len(out):
+                grown = np.empty(max(pos + n, int(len(out) * 1.5)), dtype=dtype)
+                grown[:pos] = out[:pos]
+                out = grown
+            if dtype == "int16":
+                out[pos:pos + n] = pcm
+            else:
+                np.divide(pcm, NORMALIZATION_FACTOR,
+                          out=out[pos:pos + n], dtype=np.float32)
+            pos += n
+
+        return out[:pos]
+
+    @staticmethod
+    def _iter_pcm(file: str, sr: int, chunk_size: int,
+                  start: Optional[float] = None,
+                  duration: Optional[float] = None) -> Iterator[np.ndarray]:
+        """
+        Run ffmpeg and yield its int16 PCM output in chunks.
+
+        The yielded arrays are views into a reused buffer and are only valid
+        until the next chunk is requested.
+
+        Args:
+            file (str): The audio file to open.
+            sr (int): The desired sample rate.
+            chunk_size (int): Number of samples per chunk.
+            start (Optional[float], optional): Start time in seconds of the range
+                                               to decode. Defaults to None.
+            duration (Optional[float], optional): Duration in seconds of the range
+                                                  to decode. Defaults to None.
+
+        Yields:
+            np.ndarray: The next chunk of PCM samples in int16 dtype.
+
+        Raises:
+            RuntimeError: If failed to load audio.
+        """
+        cmd = AudioProcessor._ffmpeg_cmd(file, sr, start, duration)
+        buffer = bytearray(chunk_size * 2)
+        view = memoryview(buffer)
+        samples = np.frombuffer(buffer, np.int16)
+
+        # stderr goes to a file so ffmpeg never blocks on a full pipe
+        with TemporaryFile() as stderr, \
+                Popen(cmd, stdin=DEVNULL, stdout=PIPE, stderr=stderr) as proc:
+            try:
+                carry = 0
+                while True:
+                    read = proc.stdout.readinto(view[carry:])
+                    if not read:
+                        break
+                    filled = carry + read
+                    n = filled // 2
+                    if n:
+                        yield samples[:n]
+                    carry = filled - n * 2
+                    if carry:
+                        buffer[0] = buffer[n * 2]
+            finally:
+                proc.stdout.close()
+                returncode = proc.wait()
+
+            if returncode != 0:
+                stderr.seek(0)
+                raise RuntimeError(
+                    f"Failed to load audio: {stderr.read().decode()}")
+
+    @staticmethod
+    def _probe_num_samples(file: str, sr: int):
+        """
+        Estimate the number of samples ffmpeg will produce for a file.
+
+        Args:
+            file (str): The audio file to probe.
+            sr (int): The desired sample rate.
+
+        Returns:
+            Optional[int]: The estimated number of samples, or None if the
+                            duration could not be determined.
+        """
+        cmd = [
+            "ffprobe",
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            file
+        ]
+        try:
+            out = run(cmd, capture_output=True, check=True).stdout
+            duration = float(out.decode().strip())
+        except (CalledProcessError, FileNotFoundError, ValueError):
+            return None
+
+        return int(np.ceil(duration * sr)) + sr
+
+    @staticmethod
+    def _ffmpeg_cmd(file: str, sr: int,
+                    start: Optional[float] = None,
+                    duration: Optional[float] = None) -> list:
+        """
+        Build the ffmpeg command that decodes a file to mono int16 PCM on stdout.
+
+        Args:
+            file (str): The audio file to decode.
+            sr (int): The desired sample rate.
+            start (Optional[float], optional): Start time in seconds of the range
+                                               to decode. Defaults to None.
+            duration (Optional[float], optional): Duration in seconds of the range
+                                                  to decode. Defaults to None.
+
+        Returns:
+            list: The command line arguments.
+        """
+        # Input seeking (-ss/-t before -i) skips decoding outside the range.
+        seek = []
+        if start is not None:
+            seek += ["-ss", str(start)]
+        if duration is not None:
+            seek += ["-t", str(duration)]
+
         # This launches a subprocess to decode audio while down-mixing
         # and resampling as necessary.  Requires the ffmpeg CLI in PATH.
         # fmt: off
@@ -123,6 +758,7 @@ class AudioProcessor:
             "ffmpeg",
             "-nostdin",
             "-threads", "0",
+            *seek,
             "-i", file,
             "-f", "s16le",
             "-ac", "1",
@@ -131,16 +767,341 @@ class AudioProcessor:
             "-"
         ]
         # fmt: on
+        return cmd
+    
+    def __repr__(self) -> str:
+        return f'TorchAudioProcessor(waveform={len(self.waveform)}, sr={int(self.sr)})'
+
+
+def _decode_ffmpeg(file: str, sr: int, stream: bool = False,
+                   chunk_size: int = CHUNK_SIZE,
+                   start: Optional[float] = None,
+                   duration: Optional[float] = None,
+                   dtype: str = "float32",
+                   **kwargs) -> np.ndarray:
+    """
+    Decode any audio file ffmpeg understands. Requires the ffmpeg CLI in PATH.
+    ffmpeg emits 16-bit PCM, which is kept as is for int16.
+    """
+    if stream:
+        return AudioProcessor._load_audio_streaming(file, sr, chunk_size,
+                                                    start, duration, dtype)
+
+    cmd = AudioProcessor._ffmpeg_cmd(file, sr, start, duration)
+    try:
+        out = run(cmd, capture_output=True, check=True).stdout
+    except CalledProcessError as e:
+        raise RuntimeError(
+            f"Failed to load audio: {e.stderr.decode()}") from e
+
+    if dtype == "int16":
+        # a writable array without another copy of the samples
+        return np.frombuffer(bytearray(out), np.int16)
+
+    out = np.frombuffer(out, np.int16).flatten().astype(
+        np.float32) / NORMALIZATION_FACTOR
+
+    return out
+
+
+def _decode_wave(file: str, sr: int, chunk_size: int = CHUNK_SIZE,
+                 start: Optional[float] = None,
+                 duration: Optional[float] = None,
+                 dtype: str = "float32",
+                 **kwargs) -> Optional[np.ndarray]:
+    """
+    Decode uncompressed 16-bit PCM WAV files in process with the stdlib wave module.
+    The PCM samples are kept as is for int16.
+    """
+    try:
+        f = wave.open(file, "rb")
+    except (wave.Error, EOFError, OSError):
+        return None
+
+    with f:
+        if f.getsampwidth() != 2 or f.getcomptype() != "NONE":
+            return None
+        if f.getframerate() != sr and resample is None:
+            return None
+
+        channels = f.getnchannels()
+        first, count = _frame_range(f.getnframes(), f.getframerate(), start, duration)
+        f.setpos(first)
+        out = np.empty(count, dtype=dtype)
+
+        pos = 0
+        while pos < count and (frames := f.readframes(min(chunk_size, count - pos))):
+            pcm = np.frombuffer(frames, np.int16)
+            if channels > 1:
+                pcm = pcm.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+            n = len(pcm)
+            if dtype == "int16":
+                out[pos:pos + n] = np.round(pcm) if channels > 1 else pcm
+            else:
+                np.divide(pcm, NORMALIZATION_FACTOR, out=out[pos:pos + n],
+                          dtype=np.float32)
+            pos += n
+
+        return _resample(out[:pos], f.getframerate(), sr)
+
+
+def _decode_soundfile(file: str, sr: int, chunk_size: int = CHUNK_SIZE,
+                      start: Optional[float] = None,
+                      duration: Optional[float] = None,
+                      dtype: str = "float32",
+                      **kwargs) -> Optional[np.ndarray]:
+    """
+    Decode WAV/FLAC and other libsndfile formats in process with soundfile.
+    libsndfile reads int16 directly for int16.
+    """
+    try:
+        f = soundfile.SoundFile(file)
+    except (RuntimeError, OSError):
+        return None
+
+    with f:
+        if f.samplerate != sr and resample is None:
+            return None
+
+        first, count = _frame_range(f.frames, f.samplerate, start, duration)
+        f.seek(first)
+        out = np.empty(count, dtype=dtype)
+
+        pos = 0
+        for block in f.blocks(blocksize=chunk_size, frames=count,
+                              dtype=dtype, always_2d=True):
+            n = len(block)
+            if block.shape[1] > 1 and dtype == "int16":
+                out[pos:pos + n] = np.round(block.mean(axis=1, dtype=np.float32))
+            elif block.shape[1] > 1:
+                block.mean(axis=1, out=out[pos:pos + n])
+            else:
+                out[pos:pos + n] = block[:, 0]
+            pos += n
+
+        return _resample(out[:pos], f.samplerate, sr)
+
+
+def _frame_range(total: int, rate: int, start: Optional[float],
+                 duration: Optional[float]) -> Tuple[int, int]:
+    """
+    Convert a time range to the first frame and the number of frames to read.
+    """
+    first = min(int(round((start or 0.0) * rate)), total)
+    count = total - first
+    if duration is not None:
+        count = min(count, int(round(duration * rate)))
+    return first, count
+
+
+def _resample(audio: np.ndarray, orig_sr: int, sr: int) -> np.ndarray:
+    """
+    Resample a mono float32 or int16 waveform in process with torchaudio.
+    int16 waveforms are resampled in float32 and converted back.
+    """
+    if orig_sr == sr:
+        return audio
+
+    if audio.dtype == np.int16:
+        resampled = resample(AudioProcessor._to_float(torch.from_numpy(audio)), orig_sr, sr)
+        return AudioProcessor._to_storage(resampled, torch.int16).numpy()
+
+    return resample(torch.from_numpy(audio), orig_sr, sr).numpy()
+
+
+AUDIO_DECODERS = {}
+DECODER_STATS = Counter()
+
+
+def register_decoder(name: str, decoder: Callable[..., Optional[np.ndarray]]) -> None:
+    """
+    Register an audio decoder backend. Registered backends are tried before
+    the built-in ones.
+
+    Args:
+        name (str): Name of the backend, reported in `AudioProcessor.decoder`.
+        decoder (Callable): Function called as ``decoder(file, sr, **kwargs)``
+                            that returns the mono waveform in float32 dtype at
+                            sample rate ``sr``, or None if it cannot decode the file.
+                            The keyword arguments ``start`` and ``duration`` give
+                            the time range to decode and must be honoured. The
+                            keyword argument ``dtype`` may ask for int16, a decoder
+                            that ignores it returns float32.
+    """
+    AUDIO_DECODERS.pop(name, None)
+    backends = list(AUDIO_DECODERS.items())
+    AUDIO_DECODERS.clear()
+    AUDIO_DECODERS.update([(name, decoder)] + backends)
+
+
+if soundfile is not None:
+    AUDIO_DECODERS["soundfile"] = _decode_soundfile
+AUDIO_DECODERS["wave"] = _decode_wave
+AUDIO_DECODERS["ffmpeg"] = _decode_ffmpeg
+
+
+class AudioCache(DiskCache):
+    """
+    On-disk cache of decoded waveforms keyed by file content and sample rate.
+
+    Waveforms are stored as float32 ``.npy`` files and loaded through
+    ``np.memmap``, so repeated runs skip decoding and several processes
+    reading the same file share its pages. The cache is kept below a size
+    budget by evicting the least recently used entries, see DiskCache.
+
+    Attributes:
+        cache_dir: str
+            Directory holding the cached waveforms.
+        max_bytes: int
+            Size budget of the cache in bytes.
+    """
+
+    suffix = ".npy"
+
+    def __init__(self, cache_dir: str = AUDIO_CACHE_DIR,
+                 max_bytes: int = AUDIO_CACHE_MAX_BYTES) -> None:
+        """
+        Initialize the AudioCache object.
+
+        Args:
+            cache_dir (str, optional): Directory holding the cached waveforms.
+                                        Defaults to AUDIO_CACHE_DIR.
+            max_bytes (int, optional): Size budget of the cache in bytes.
+                                        Defaults to AUDIO_CACHE_MAX_BYTES.
+        """
+        super().__init__(cache_dir, max_bytes)
+
+    @staticmethod
+    def key(file: str, sr: int = SAMPLE_RATE) -> str:
+        """
+        Compute the cache key of an audio file from its content and sample rate.
+
+        Args:
+            file (str): The audio file path.
+            sr (int, optional): The sample rate of the decoded audio.
+                                Defaults to SAMPLE_RATE.
+
+        Returns:
+            str: The cache key.
+        """
+        digest = blake2b(digest_size=20)
+        with open(file, "rb") as f:
+            while block := f.read(1 << 20):
+                digest.update(block)
+
+        return f"{digest.hexdigest()}_{sr}"
+
+    def load(self, key: str) -> Optional[np.ndarray]:
+        """
+        Load a cached waveform as a memory map.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[np.ndarray]: The memory-mapped waveform, or None if the key
+                                    is not cached.
+        """
+        path = self.path(key)
         try:
-            out = run(cmd, capture_output=True, check=True).stdout
-        except CalledProcessError as e:
-            raise RuntimeError(
-                f"Failed to load audio: {e.stderr.decode()}") from e
+            audio = np.load(path, mmap_mode="c")
+            self.touch(path)
+        except (FileNotFoundError, ValueError):
+            return None
 
-        out = np.frombuffer(out, np.int16).flatten().astype(
-            np.float32) / NORMALIZATION_FACTOR
+        return audio
+
+    def store(self, key: str, audio: np.ndarray) -> np.ndarray:
+        """
+        Store a waveform in the cache and evict old entries if necessary.
+
+        Args:
+            key (str): The cache key.
+            audio (np.ndarray): The waveform to store.
+
+        Returns:
+            np.ndarray: The memory-mapped stored waveform.
+        """
+        path = self.path(key)
+        self.write(path, lambda f: np.save(f, np.asarray(audio, dtype=np.float32)))
+
+        # map it before evicting, the map stays valid if the entry is evicted
+        audio = np.load(path, mmap_mode="c")
+        self.evict()
+
+        return audio
+
+
+class AudioPrefetcher:
+    """
+    Iterates over audio files and yields them as AudioProcessor objects in order,
+    while the next files are decoded in a background thread pool.
+
+    Decoding runs in ffmpeg subprocesses or NumPy routines that release the GIL,
+    so threads keep the CPU busy without copying waveforms between processes.
+    At most `num_prefetch` files are decoded ahead of the consumer.
+
+    Attributes:
+        audio_files: Iterable
+            The audio files to load.
+        num_prefetch: int
+            Number of files decoded ahead. 0 disables prefetching.
+        loader: Callable
+            Function that turns one entry of `audio_files` into an AudioProcessor.
+    """
+
+    def __init__(self, audio_files: Iterable, num_prefetch: int = 2,
+                 loader: Optional[Callable[..., AudioProcessor]] = None,
+                 **kwargs) -> None:
+        """
+        Initialize the AudioPrefetcher object.
+
+        Args:
+            audio_files (Iterable): The audio files to load.
+            num_prefetch (int, optional): Number of files decoded ahead.
+                                          Defaults to 2.
+            loader (Optional[Callable], optional): Function that loads one file.
+                                          Defaults to AudioProcessor.from_file.
+            **kwargs: Additional keyword arguments for the loader.
+
+        Raises:
+            ValueError: If num_prefetch is negative.
+        """
+        if num_prefetch < 0:
+            raise ValueError("Number of prefetched files must not be negative, "
+                             f"{num_prefetch} was given")
+
+        self.audio_files = audio_files
+        self.num_prefetch = num_prefetch
+        self.loader = loader or AudioProcessor.from_file
+        self.kwargs = kwargs
+
+    def __iter__(self) -> Iterator[AudioProcessor]:
+        files = iter(self.audio_files)
+
+        if self.num_prefetch == 0:
+            for file in files:
+                yield self.loader(file, **self.kwargs)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.num_prefetch,
+                                      thread_name_prefix="scraibe-prefetch")
+        pending = deque()
+        try:
+            for file in files:
+                pending.append(executor.submit(self.loader, file, **self.kwargs))
+                if len(pending) == self.num_prefetch:
+                    break
+
+            while pending:
+                future = pending.popleft()
+                # keep the queue full while the consumer works on this file
+                for file in files:
+                    pending.append(executor.submit(self.loader, file, **self.kwargs))
+                    break
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
-        return out, sr
-    
     def __repr__(self) -> str:
-        return f'TorchAudioProcessor(waveform={len(self.waveform)}, sr={int(self.sr)})'
+        return f"AudioPrefetcher(num_prefetch={self.num_prefetch})"
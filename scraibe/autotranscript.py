@@ -24,28 +24,70 @@ Usage:
 """
 
 # Standard Library Imports
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from contextvars import Context, ContextVar, copy_context
+from functools import partial
 from glob import iglob
 from subprocess import run
-from typing import TypeVar, Union
+from time import perf_counter
+from typing import (AsyncIterator, Callable, Iterable, Iterator, List,
+                    Optional, Tuple, TypeVar, Union)
 from warnings import warn
 
 # Third-Party Imports
+import numpy as np
 import torch
 from numpy import ndarray
-from tqdm import trange
+from tqdm import tqdm
 
 # Application-Specific Imports
-from .audio import AudioProcessor
+from .audio import SAMPLE_RATE, AudioProcessor, AudioCache, AudioPrefetcher
 from .diarisation import Diariser
-from .transcriber import Transcriber, load_transcriber, whisper
+from .instrumentation import NULL_TIMER, StageTimer
+from .journal import Journal
+from .placement import LazyModel, ModelPlacement
+from .registry import MODEL_REGISTRY, ModelRegistry
+from .result_cache import ResultCache
+from .scheduler import SegmentScheduler
+from .transcriber import (FasterWhisperTranscriber, Transcriber, WhisperTranscriber,
+                          load_transcriber, whisper)
 from .transcript_exporter import Transcript
-from .misc import SCRAIBE_TORCH_DEVICE
+from .misc import PYANNOTE_DEFAULT_CONFIG, PYANNOTE_DEFAULT_PATH, SCRAIBE_TORCH_DEVICE
 
 
 DiarisationType = TypeVar('DiarisationType')
 
 
+class _PerCall:
+    """
+    Attribute of Scraibe that is kept per call of the async API, e.g. `verbose` and
+    the reports of a run. Each async call runs in its own context, so concurrent
+    calls do not overwrite the state of each other. Outside of an async call, and
+    once it is finished, the attribute is a plain instance attribute.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner: Optional[type] = None):
+        if instance is None:
+            return self
+        state = instance._call_state.get(None)
+        if state is not None and self.name in state:
+            return state[self.name]
+        return instance.__dict__.get(self.name)
+
+    def __set__(self, instance, value) -> None:
+        state = instance._call_state.get(None)
+        if state is None:
+            instance.__dict__[self.name] = value
+        else:
+            state[self.name] = value
+
+
 class Scraibe:
     """
     Scraibe is a class responsible for managing the transcription and diarization of audio files.
@@ -54,16 +96,25 @@ class Scraibe:
     allowing for comprehensive audio processing.
 
     Attributes:
-        transcriber (Transcriber): The transcriber object to handle transcription.
-        diariser (Diariser): The diariser object to handle diarization.
+        transcriber (Transcriber): The transcriber object to handle transcription,
+                    a LazyModel standing in for it if the model is given by name.
+        diariser (Diariser): The diariser object to handle diarization,
+                    a LazyModel standing in for it if the model is given by name.
 
     Methods:
         __init__: Initializes the Scraibe class with appropriate models.
         transcribe: Transcribes an audio file using the whisper model and pyannote diarization model.
+        aautotranscribe, adiarization, atranscribe: Asynchronous counterparts that run
+                                                    the models in an executor.
         remove_audio_file: Removes the original audio file to avoid disk space issues or ensure data privacy.
         get_audio_file: Gets an audio file as an AudioProcessor object.
     """
 
+    verbose = _PerCall()
+    vad_report = _PerCall()
+    schedule_report = _PerCall()
+    language_report = _PerCall()
+
     def __init__(self,
                  whisper_model: Union[bool, str, whisper] = None,
                  whisper_type: str = "whisper",
@@ -85,26 +136,101 @@ class Scraibe:
                     - verbose: If True, the class will print additional information.
                     - save_kwargs: If True, the keyword arguments will be saved
                                     for autotranscribe. So you can unload the class and reload it again.
+                    - audio_cache: If True, or an AudioCache instance, decoded audio
+                                    files are cached on disk and reused on later runs.
+                    - audio_dtype: Storage dtype of loaded audio, "float32", "float16"
+                                    or "int16". Compact dtypes halve resident memory.
+                    - result_cache: If True, or a ResultCache instance, diarisations and
+                                    transcripts are cached on disk and reused for the
+                                    same audio and settings.
+                    - observers: Callables notified with the wall time, CPU time and
+                                    audio seconds of every stage, e.g. a TimingCollector.
+                    - max_concurrency: Number of requests of the async API that use
+                                    the models at the same time. Each request keeps its
+                                    own reports, offload and report_memory require 1.
+                                    Defaults to 1.
+                    - offload: Offload policy of the models between stages, "none",
+                                    "cpu" or "unload", see `ModelPlacement`. With "unload"
+                                    the Whisper model is only loaded after diarisation.
+                                    Defaults to "none".
+                    - report_memory: If True, the resident memory of every stage is
+                                    reported in `memory_report`, also without offloading.
+                    - offline: If True, the diarisation model is only resolved from local
+                                    files and the cache, see `Diariser.load_model`.
+                                    Defaults to SCRAIBE_OFFLINE.
+                    - registry: True to share the models given by name with other
+                                    Scraibe instances through MODEL_REGISTRY, or a
+                                    ModelRegistry. Defaults to None, no sharing.
+                    - lazy: If True, models given by name are loaded by the first stage
+                                    that uses them, see `warmup` to load them up front.
+                                    Defaults to True.
         """
-
-        if whisper_model is None:
-            self.transcriber = load_transcriber(
-                "medium", whisper_type, **kwargs)
-        elif isinstance(whisper_model, str):
-            self.transcriber = load_transcriber(
-                whisper_model, whisper_type, **kwargs)
+        # state of the running async call, see `_PerCall`
+        self._call_state: ContextVar = ContextVar(f"scraibe_call_state_{id(self)}")
+        self.audio_cache: Union[bool, AudioCache] = kwargs.pop("audio_cache", False)
+        self.audio_dtype: Optional[str] = kwargs.pop("audio_dtype", None)
+        result_cache = kwargs.pop("result_cache", False)
+        self.result_cache: Optional[ResultCache] = \
+            ResultCache() if result_cache is True else (result_cache or None)
+        self.vad_report: Optional[dict] = None
+        self.schedule_report: Optional[dict] = None
+        self.language_report: Optional[dict] = None
+        self.observers: List[Callable] = list(kwargs.pop("observers", []))
+
+        # executor and semaphore of the async API, created on first use
+        self.max_concurrency: int = kwargs.pop("max_concurrency", 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        lazy = kwargs.pop("lazy", True)
+        offload = kwargs.pop("offload", None) or "none"
+        report_memory = kwargs.pop("report_memory", False)
+        if offload != "none" and self.max_concurrency > 1:
+            raise ValueError("Offloading models requires max_concurrency=1, as concurrent "
+                             "requests would offload the model of each other.")
+        if report_memory and self.max_concurrency > 1:
+            raise ValueError("report_memory requires max_concurrency=1, as the memory of "
+                             "concurrent requests cannot be told apart.")
+        registry = kwargs.pop("registry", None)
+        # an empty registry is falsy, so test for the class
+        self.registry: Optional[ModelRegistry] = MODEL_REGISTRY if registry is True else \
+            (registry if isinstance(registry, ModelRegistry) else None)
+        if self.registry is not None and offload == "cpu":
+            raise ValueError("Offloading models to the CPU would move the models shared "
+                             "through the registry, use offload='unload' instead.")
+        track_memory = offload != "none" or report_memory
+        self.placement: Optional[ModelPlacement] = ModelPlacement(
+            offload, kwargs.get("device", SCRAIBE_TORCH_DEVICE), track_memory=track_memory)
+        if track_memory:
+            self.observers.append(self.placement)
+
+        if whisper_model is None or isinstance(whisper_model, str):
+            self.transcriber, loader, release = self._named_model(
+                "transcriber", whisper_model or "medium", whisper_type, **kwargs)
+            self.placement.register("transcriber", self.transcriber, loader,
+                                    release=release)
+            # with "unload", Whisper is only loaded after diarisation
+            if not lazy and offload != "unload":
+                self.placement.load("transcriber")
         else:
             self.transcriber = whisper_model
-
-        if dia_model is None:
-            self.diariser = Diariser.load_model(**kwargs)
-        elif isinstance(dia_model, str):
-            self.diariser = Diariser.load_model(dia_model, **kwargs)
+            self.placement.register("transcriber", self.transcriber)
+
+        if dia_model is None or isinstance(dia_model, str):
+            self.diariser, loader, release = self._named_model(
+                "diariser", dia_model or PYANNOTE_DEFAULT_CONFIG, **kwargs)
+            self.placement.register("diariser", self.diariser, loader,
+                                    release=release)
+            if not lazy:
+                self.placement.load("diariser")
         else:
             self.diariser: Diariser = dia_model
+            self.placement.register("diariser", self.diariser)
 
         if kwargs.get("verbose"):
-            print("Scraibe initialized all models successfully loaded.")
+            print("Scraibe initialized all models successfully loaded."
+                  if not lazy else "Scraibe initialized, models are loaded on first use.")
             self.verbose = True
         else:
             self.verbose = False
@@ -122,6 +248,11 @@ class Scraibe:
 
     def autotranscribe(self, audio_file: Union[str, torch.Tensor, ndarray],
                        remove_original: bool = False,
+                       vad: Union[bool, dict] = False,
+                       batch_size: int = 1,
+                       single_pass: bool = False,
+                       coalesce: Union[bool, dict] = False,
+                       journal: Optional[Union[str, Journal]] = None,
                        **kwargs) -> Transcript:
         """
         Transcribes an audio file using the whisper model and pyannote diarization model.
@@ -131,68 +262,583 @@ class Scraibe:
                             Path to audio file or a tensor representing the audio.
             remove_original (bool, optional): If True, the original audio file will
                                                 be removed after transcription.
+            vad (Union[bool, dict], optional): If True, or a dict of keyword arguments
+                                                for `AudioProcessor.detect_speech`, silence is
+                                                removed before diarisation and transcription.
+                                                Timestamps still refer to the original audio,
+                                                and the skipped audio is reported in `vad_report`.
+            batch_size (int, optional): Number of diarisation segments transcribed
+                                        in a single forward pass. Segments longer than
+                                        30 seconds are always transcribed on their own.
+                                        Batched decoding has no temperature fallback,
+                                        so it is opt-in. Defaults to 1, the sequential
+                                        per-segment path.
+            single_pass (bool, optional): If True, the whole audio is transcribed once
+                                          with word timestamps while the diarisation
+                                          runs concurrently, and each word is assigned
+                                          to the speaker segment it overlaps most.
+            coalesce (Union[bool, dict], optional): If True, or a dict of keyword arguments
+                                                    for `SegmentScheduler`, short consecutive
+                                                    turns of a speaker and the short
+                                                    interjections between them are packed
+                                                    into windows of up to 30 seconds that
+                                                    are transcribed once.
+                                                    The text is split back to the turns by
+                                                    word timestamps, and the padding saved is
+                                                    reported in `schedule_report`.
+            journal (Optional[Union[str, Journal]], optional): Path of a journal file, or a
+                                                    Journal. The diarisation and each finished
+                                                    segment are appended to it, and a rerun with
+                                                    the same audio and settings continues from
+                                                    the first missing segment.
             *args: Additional positional arguments for diarization and transcription.
-            **kwargs: Additional keyword arguments for diarization and transcription.
+            **kwargs: Additional keyword arguments for diarization and transcription,
+                        e.g. `diarisation_window` to diarise long recordings in windows
+                        of that many seconds, see `Diariser.windowed_diarization`.
 
         Returns:
             Transcript: A Transcript object containing the transcription,
                         which can be exported to different formats.
         """
+        segments = dict(enumerate(self.iter_autotranscribe(audio_file,
+                                                                remove_original=remove_original,
+                                                                vad=vad,
+                                                                batch_size=batch_size,
+                                                                single_pass=single_pass,
+                                                                coalesce=coalesce,
+                                                                journal=journal,
+                                                                **kwargs)))
+
+        with self._stage("transcript"):
+            return Transcript(segments)
+
+    def iter_autotranscribe(self, audio_file: Union[str, torch.Tensor, ndarray],
+                            remove_original: bool = False,
+                            vad: Union[bool, dict] = False,
+                            batch_size: int = 1,
+                            single_pass: bool = False,
+                            coalesce: Union[bool, dict] = False,
+                            journal: Optional[Union[str, Journal]] = None,
+                            **kwargs) -> Iterator[dict]:
+        """
+        Transcribes an audio file like `autotranscribe`, but yields each segment
+        as soon as it is transcribed, so results can be consumed while the rest
+        of the file is still being processed.
+
+        Segments are yielded in order. Unlike `autotranscribe`, known hallucinations
+        and empty segments are not removed. The original audio file is only removed
+        once the generator is exhausted.
+
+        Args:
+            audio_file (Union[str, torch.Tensor, ndarray]): 
+                            Path to audio file or a tensor representing the audio.
+            remove_original (bool, optional): If True, the original audio file will
+                                                be removed after transcription.
+            vad, batch_size, single_pass, coalesce, journal: See `autotranscribe`.
+            **kwargs: Additional keyword arguments for diarization and transcription.
+
+        Yields:
+            dict: The "speakers", "segments" (start and end in seconds) and "text"
+                    of each segment, as in a Transcript.
+        """
         if kwargs.get("verbose"):
             self.verbose = kwargs.get("verbose")
+        self.language_report = None
+        if self.placement is not None:
+            self.placement.reset_report()
         # Get audio file as an AudioProcessor object
-        audio_file: AudioProcessor = self.get_audio_file(audio_file)
-
-        # Prepare waveform and sample rate for diarization
-        dia_audio = {
-            "waveform": audio_file.waveform.reshape(1, len(audio_file.waveform)).to(self.device),
-            "sample_rate": audio_file.sr
-        }
-        
-        if self.verbose:
-            print("Starting diarisation.")
+        audio_file: AudioProcessor = self._load_audio(audio_file)
+
+        regions = None
+        if vad:
+            with self._stage("vad", len(audio_file.waveform) / audio_file.sr):
+                regions, audio_file = self._remove_silence(
+                    audio_file, **(vad if isinstance(vad, dict) else {}))
+
+        dia_key = transcript_key = None
+        if self.result_cache is not None:
+            dia_key = self._diarisation_key(audio_file, **kwargs)
+            transcript_key = ResultCache.key(
+                "transcript", dia_key, **self._transcription_settings(**kwargs),
+                regions=regions.tolist() if regions is not None else None,
+                vad=vad, batched=batch_size > 1, single_pass=single_pass, coalesce=coalesce)
+
+            cached = self.result_cache.load(transcript_key)
+            if cached is not None:
+                yield from cached
+
+                if remove_original:
+                    self.remove_audio_file(audio_file, shred=kwargs.get("shred") is True)
+                return
+
+        state = {"diarisation": None, "language": None, "segments": {}}
+        if journal is not None:
+            journal = journal if isinstance(journal, Journal) else Journal(journal)
+            # the models and the effective whisper kwargs, so a run with other
+            # models starts the journal over instead of reusing stale results
+            settings = {k: v for k, v in kwargs.items() if k != "verbose"}
+            settings.update(self._transcription_settings(**kwargs))
+            key = Journal.key(audio_file.waveform, offset=audio_file.offset,
+                              diariser=self.diariser.config(), vad=vad,
+                              single_pass=single_pass, coalesce=coalesce, **settings)
+            state = journal.resume(key)
+
+            if state["diarisation"] is not None and self.verbose:
+                print(f"Resuming from {journal.path}, "
+                      f"{len(state['segments'])} segments already transcribed.")
+
+        if dia_key is not None and state["diarisation"] is None:
+            state["diarisation"] = self.result_cache.load(dia_key)
+
+        transcript = []
+        try:
+            for segment in self._iter_autotranscribe(audio_file, regions, state, journal,
+                                                     dia_key=dia_key,
+                                                     batch_size=batch_size,
+                                                     single_pass=single_pass,
+                                                     coalesce=coalesce, **kwargs):
+                if transcript_key is not None:
+                    transcript.append(segment)
+                yield segment
+        finally:
+            if journal is not None:
+                journal.close()
+
+        if transcript_key is not None:
+            self.result_cache.store(transcript_key, transcript)
 
-        diarisation = self.diariser.diarization(dia_audio, **kwargs)
+        # Remove original file if needed
+        if remove_original:
+            if kwargs.get("shred") is True:
+                self.remove_audio_file(audio_file, shred=True)
+            else:
+                self.remove_audio_file(audio_file, shred=False)
+
+    def _iter_autotranscribe(self, audio_file: AudioProcessor,
+                             regions: Optional[ndarray],
+                             state: dict,
+                             journal: Optional[Journal] = None,
+                             dia_key: Optional[str] = None,
+                             batch_size: int = 1,
+                             single_pass: bool = False,
+                             coalesce: Union[bool, dict] = False,
+                             **kwargs) -> Iterator[dict]:
+        """
+        Diarises and transcribes a loaded audio file for `iter_autotranscribe`.
+
+        Args:
+            audio_file (AudioProcessor): The audio, without silence if VAD is used.
+            regions (Optional[ndarray]): The speech regions kept by VAD, or None.
+            state (dict): The progress restored from the journal, see `Journal.resume`.
+            journal (Optional[Journal], optional): The journal progress is written to.
+            dia_key (Optional[str], optional): Key the diarisation is stored under
+                                                in the result cache.
+            batch_size, single_pass, coalesce: See `autotranscribe`.
+            **kwargs: Additional keyword arguments for diarization and transcription.
+
+        Yields:
+            dict: The "speakers", "segments" and "text" of each segment.
+        """
+        words = None
+        diarisation = state["diarisation"]
+        done = state["segments"]
+        seconds = len(audio_file.waveform) / audio_file.sr
+
+        if diarisation is not None:
+            if single_pass and len(done) < len(diarisation["segments"]):
+                words = self._timed("transcribe_words", seconds, self.transcriber.transcribe_words,
+                                    audio_file.float_waveform(), **kwargs)
+
+        else:
+            if self.verbose:
+                print("Starting diarisation.")
+
+            # Prepare waveform and sample rate for diarization
+            dia_audio = self._diarisation_audio(audio_file, **kwargs)
+
+            if single_pass:
+                # the transcription does not depend on the diarisation, so run both at once
+                with self._pinned(), ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(self._timed, "diarization", seconds,
+                                             self.diariser.diarization, dia_audio, **kwargs)
+                    words = self._timed("transcribe_words", seconds,
+                                        self.transcriber.transcribe_words,
+                                        audio_file.float_waveform(), **kwargs)
+                    diarisation = future.result()
+            else:
+                diarisation = self._timed("diarization", seconds,
+                                          self.diariser.diarization, dia_audio, **kwargs)
+
+            # the copy of the waveform for the diariser is not needed for the transcription
+            del dia_audio
+
+            diarisation = {"segments": [[float(start), float(end)]
+                                        for start, end in diarisation["segments"]],
+                           "speakers": [str(speaker) for speaker in diarisation["speakers"]]}
+
+            if journal is not None:
+                journal.write("diarisation", **diarisation)
+            if dia_key is not None:
+                self.result_cache.store(dia_key, diarisation)
 
         if not diarisation["segments"]:
             print("No segments found. Try to run transcription without diarisation.")
 
-            transcript = self.transcriber.transcribe(
-                audio_file.waveform, **kwargs)
-
-            final_transcript = {0: {"speakers": 'SPEAKER_01',
-                                    "segments": [0, len(audio_file.waveform)],
-                                    "text": transcript}}
+            if words is not None:
+                transcript = "".join(word for _, _, word in words)
+            else:
+                transcript = self._timed("transcribe", seconds, self.transcriber.transcribe,
+                                         audio_file.float_waveform(), **kwargs)
 
-            return Transcript(final_transcript)
+            yield {"speakers": 'SPEAKER_01',
+                   "segments": [0, len(audio_file.waveform)],
+                   "text": transcript}
+            return
 
         if self.verbose:
             print("Diarisation finished. Starting transcription.")
 
+        # diarisation times are relative to the waveform, map them to file time
+        segments = diarisation["segments"]
+        if regions is not None:
+            segments = AudioProcessor.map_segments(segments, regions).tolist()
+        elif audio_file.offset:
+            segments = [[start + audio_file.offset, end + audio_file.offset]
+                        for start, end in segments]
+
+        # detect the language once instead of once per segment
+        if single_pass or kwargs.get("language") is not None:
+            pass
+        elif state["language"] is not None:
+            kwargs["language"] = state["language"]
+        elif len(done) < len(segments):
+            kwargs["language"] = self.detect_language(audio_file, diarisation["segments"])
+            if journal is not None:
+                journal.write("language", language=kwargs["language"])
+
+        # Transcribe each segment and yield the results
+        if words is not None:
+            texts = ((i, done.get(i, text)) for i, text
+                     in enumerate(self.assign_words(words, diarisation["segments"])))
+        elif single_pass:
+            texts = sorted(done.items())
+        else:
+            texts = self._iter_transcribe_segments(
+                audio_file, diarisation, batch_size=batch_size,
+                coalesce=coalesce, done=done, **kwargs)
 
-        # Transcribe each segment and store the results
-        final_transcript = dict()
+        for i, text in texts:
+            if journal is not None and i not in done:
+                journal.write("segment", id=i, text=text)
 
-        for i in trange(len(diarisation["segments"]), desc="Transcribing", disable=not self.verbose):
+            yield {"speakers": diarisation["speakers"][i],
+                   "segments": segments[i],
+                   "text": text}
 
-            seg = diarisation["segments"][i]
+    def detect_language(self, audio_file: AudioProcessor,
+                        segments: Optional[List[List[float]]] = None,
+                        duration: float = 30.0) -> str:
+        """
+        Detects the language of an audio file once, so it can be pinned
+        for the transcription of all its segments.
 
-            audio = audio_file.cut(seg[0], seg[1])
+        The language is detected on the first `duration` seconds of the given
+        segments, e.g. the diarisation turns, so silence and short turns do not
+        affect the detection. The result is stored in `language_report`.
 
-            transcript = self.transcriber.transcribe(audio, **kwargs)
+        Args:
+            audio_file (AudioProcessor): The audio file.
+            segments (List[List[float]], optional): Start and end in seconds of the
+                                                    speech in the waveform. Defaults to
+                                                    the start of the waveform.
+            duration (float, optional): Seconds of speech used for the detection.
+                                        Defaults to 30.0.
 
-            final_transcript[i] = {"speakers": diarisation["speakers"][i],
-                                   "segments": seg,
-                                   "text": transcript}
+        Returns:
+            str: The language code.
+        """
+        if segments:
+            samples = int(duration * audio_file.sr)
+            sample, length = [], 0
+            for audio in audio_file.cut_many([[start + audio_file.offset, end + audio_file.offset]
+                                              for start, end in segments]):
+                sample.append(audio[:samples - length])
+                length += len(sample[-1])
+                if length >= samples:
+                    break
+            audio = torch.cat(sample)
+        else:
+            audio = audio_file.cut(audio_file.offset, audio_file.offset + duration)
 
-        # Remove original file if needed
-        if remove_original:
-            if kwargs.get("shred") is True:
-                self.remove_audio_file(audio_file, shred=True)
+        language, probability = self._timed("language_detection", len(audio) / audio_file.sr,
+                                            self.transcriber.detect_language, audio)
+        self.language_report = {"language": language, "probability": probability}
+
+        if self.verbose:
+            print(f"Detected language: {language} (probability {probability:.2f})")
+
+        return language
+
+    def _iter_transcribe_segments(self, audio_file: AudioProcessor,
+                                  diarisation: dict,
+                                  batch_size: int = 1,
+                                  coalesce: Union[bool, dict] = False,
+                                  done: Optional[dict] = None,
+                                  **kwargs) -> Iterator[Tuple[int, str]]:
+        """
+        Transcribes the turns of a diarisation and yields them in order.
+
+        Turns are transcribed in batches of `batch_size`. With `coalesce`, turns are
+        first packed into windows by a `SegmentScheduler`. Windows holding a single
+        turn are transcribed like turns, windows holding several turns are transcribed
+        with word timestamps, in batches of `batch_size` as well, and split back to
+        their turns with `assign_words`. Turns in `done` keep their text and are
+        not transcribed again, so a window is cut down to its remaining turns.
+
+        Args:
+            audio_file (AudioProcessor): The audio the diarisation was computed on.
+            diarisation (dict): The diarisation with "segments" and "speakers".
+            batch_size (int, optional): Number of turns or windows transcribed in a
+                                        single forward pass. Defaults to 1.
+            coalesce (Union[bool, dict], optional): If True, or a dict of keyword
+                                                    arguments for `SegmentScheduler`,
+                                                    turns are packed into windows.
+            done (Optional[dict], optional): Text of turns that are already transcribed,
+                                             e.g. restored from a journal.
+            **kwargs: Additional keyword arguments for the transcription.
+
+        Yields:
+            Tuple[int, str]: The index and the text of each turn.
+        """
+        turns = diarisation["segments"]
+
+        if coalesce:
+            scheduler = SegmentScheduler(**(coalesce if isinstance(coalesce, dict) else {}))
+            windows = scheduler.schedule(turns, diarisation["speakers"])
+            self.schedule_report = scheduler.stats
+        else:
+            windows = [[i] for i in range(len(turns))]
+
+        # group consecutive windows of the same kind into batches, keeping the order
+        done = done or {}
+        batch_size = max(1, batch_size)
+        jobs: List[Tuple[str, List[List[int]]]] = []
+        for window in windows:
+            todo = [i for i in window if i not in done]
+            if not todo:
+                kind = "done"
+            elif len(todo) > 1:
+                kind = "words"
             else:
-                self.remove_audio_file(audio_file, shred=False)
+                kind = "batch"
 
-        return Transcript(final_transcript)
+            if jobs and jobs[-1][0] == kind and (
+                    kind == "done" or len(jobs[-1][1]) < batch_size):
+                jobs[-1][1].append(window)
+            else:
+                jobs.append((kind, [window]))
+
+        for kind, job in tqdm(jobs, desc="Transcribing", disable=not self.verbose):
+
+            if kind == "done":
+                yield from ((i, done[i]) for window in job for i in window)
+                continue
+
+            todos = [[i for i in window if i not in done] for window in job]
+            bounds = [SegmentScheduler.window_bounds(turns, todo) for todo in todos]
+            audios = audio_file.cut_many([[start + audio_file.offset, end + audio_file.offset]
+                                          for start, end in bounds])
+            seconds = sum(len(audio) for audio in audios) / audio_file.sr
+
+            if kind == "words":
+                if batch_size == 1:
+                    words = [self._timed("transcribe_words", seconds,
+                                         self.transcriber.transcribe_words, audios[0], **kwargs)]
+                else:
+                    words = self._timed("transcribe_words_batch", seconds,
+                                        self.transcriber.transcribe_words_batch,
+                                        audios, batch_size=batch_size, **kwargs)
+
+                texts = {}
+                for todo, (window_start, _), window_words in zip(todos, bounds, words):
+                    window_words = [(start + window_start, end + window_start, word)
+                                    for start, end, word in window_words]
+                    texts.update(zip(todo, self.assign_words(window_words,
+                                                             [turns[i] for i in todo])))
+
+            elif batch_size == 1:
+                texts = {todos[0][0]: self._timed("transcribe", seconds,
+                                                  self.transcriber.transcribe,
+                                                  audios[0], **kwargs)}
+
+            else:
+                texts = dict(zip((todo[0] for todo in todos),
+                                 self._timed("transcribe_batch", seconds,
+                                             self.transcriber.transcribe_batch,
+                                             audios, batch_size=batch_size, **kwargs)))
+
+            yield from ((i, done[i] if i in done else texts[i]) for window in job for i in window)
+
+    @staticmethod
+    def assign_words(words: List[Tuple[float, float, str]],
+                     segments: List[List[float]]) -> List[str]:
+        """
+        Assigns words with timestamps to diarisation segments and joins
+        the words of each segment into its text.
+
+        Each word goes to the segment it overlaps most, also if segments overlap or
+        are nested, e.g. a backchannel inside a long turn; of equally overlapping
+        segments, the shortest wins. Words that fall in a gap between segments
+        go to the closest segment.
+
+        The join is vectorized: with the segments sorted by start and the running
+        maximum of their ends, the segments that can overlap a word are a contiguous
+        range, from the first segment whose running end passes the word start to the
+        last segment starting before the word end.
+
+        Args:
+            words (List[Tuple[float, float, str]]): Start, end and text of each word,
+                                                    e.g. from `Transcriber.transcribe_words`.
+            segments (List[List[float]]): Start and end of each diarisation segment.
+
+        Returns:
+            List[str]: The text of each segment, empty if no word was assigned to it.
+        """
+        texts = [""] * len(segments)
+        if not words or not segments:
+            return texts
+
+        bounds = np.asarray(segments, dtype=np.float64).reshape(-1, 2)
+        order = np.argsort(bounds[:, 0], kind="stable")
+        starts, ends = bounds[order, 0], bounds[order, 1]
+        count = len(starts)
+        run_end = np.maximum.accumulate(ends)
+        # the segment holding the running maximum of the ends
+        run_arg = np.maximum.accumulate(np.where(ends == run_end, np.arange(count), 0))
+
+        times = np.asarray([(start, end) for start, end, _ in words], dtype=np.float64)
+        word_start, word_end = times[:, 0], times[:, 1]
+
+        last = np.searchsorted(starts, word_end, side="left") - 1
+        first = np.searchsorted(run_end, word_start, side="right")
+        assigned = np.empty(len(words), dtype=np.int64)
+
+        # words overlapping no segment go to the closest one before or after them
+        gap = np.flatnonzero(first > last)
+        if len(gap):
+            before = np.where(last[gap] >= 0, run_arg[last[gap].clip(0)], -1)
+            after = last[gap] + 1
+            distance_before = np.where(before >= 0,
+                                       word_start[gap] - run_end[last[gap].clip(0)], np.inf)
+            distance_after = np.where(after < count,
+                                      starts[after.clip(max=count - 1)] - word_end[gap], np.inf)
+            assigned[gap] = np.where(distance_before <= distance_after, before, after)
+
+        # words overlapping segments go to the one they overlap most, in chunks
+        # of words to bound the size of the candidate matrix
+        joined = np.flatnonzero(first <= last)
+        for chunk in np.array_split(joined, max(1, len(joined) // 4096)):
+            if not len(chunk):
+                continue
+            width = int((last[chunk] - first[chunk]).max()) + 1
+            candidates = first[chunk, None] + np.arange(width)
+            valid = candidates <= last[chunk, None]
+            candidates = candidates.clip(max=count - 1)
+            overlap = (np.minimum(ends[candidates], word_end[chunk, None])
+                       - np.maximum(starts[candidates], word_start[chunk, None]))
+            overlap[~valid] = -np.inf
+            # a word inside a nested segment overlaps the enclosing one as much,
+            # ties go to the shortest, innermost segment
+            tied = overlap >= overlap.max(axis=1, keepdims=True)
+            length = np.where(tied, ends[candidates] - starts[candidates], np.inf)
+            assigned[chunk] = candidates[np.arange(len(chunk)), length.argmin(axis=1)]
+
+        for index, (_, _, word) in zip(order[assigned].tolist(), words):
+            texts[index] += word
+
+        return texts
+
+    def _remove_silence(self, audio_file: AudioProcessor,
+                        **kwargs) -> Tuple[Optional[ndarray], AudioProcessor]:
+        """
+        Removes silence from an audio file with `AudioProcessor.detect_speech`
+        and stores a report of the skipped audio in `vad_report`.
+
+        Args:
+            audio_file (AudioProcessor): The audio file.
+            **kwargs: Keyword arguments for `AudioProcessor.detect_speech`.
+
+        Returns:
+            tuple: The speech regions in seconds, or None if no speech was found,
+                    and the AudioProcessor containing only speech.
+        """
+        regions = audio_file.detect_speech(**kwargs)
+
+        duration = len(audio_file.waveform) / audio_file.sr
+        speech = float((regions[:, 1] - regions[:, 0]).sum())
+
+        self.vad_report = {"duration": duration,
+                           "speech": speech,
+                           "skipped": duration - speech,
+                           "skipped_ratio": (duration - speech) / duration if duration else 0.0,
+                           "regions": len(regions)}
+
+        if self.verbose:
+            print(f"Voice activity detection skipped {duration - speech:.1f} s "
+                  f"of {duration:.1f} s audio.")
+
+        if len(regions) == 0:
+            warn("No speech found. Processing the full audio instead.", RuntimeWarning)
+            self.vad_report.update(speech=duration, skipped=0.0, skipped_ratio=0.0)
+            return None, audio_file
+
+        return regions, audio_file.keep_regions(regions)
+
+    def autotranscribe_many(self, audio_files: Iterable[Union[str, torch.Tensor, ndarray]],
+                            num_prefetch: int = 2,
+                            **kwargs) -> Iterator[Transcript]:
+        """
+        Transcribes several audio files in order, decoding the next files in the
+        background while the current one is diarised and transcribed.
+
+        Args:
+            audio_files (Iterable[Union[str, torch.Tensor, ndarray]]):
+                            Paths to audio files or tensors representing the audio.
+            num_prefetch (int, optional): Number of files decoded ahead.
+                                            Defaults to 2.
+            **kwargs: Additional keyword arguments for autotranscribe.
+
+        Yields:
+            Transcript: A Transcript object for each audio file, in input order.
+        """
+        for audio_file in self.prefetch(audio_files, num_prefetch):
+            yield self.autotranscribe(audio_file, **kwargs)
+
+    def prefetch(self, audio_files: Iterable[Union[str, torch.Tensor, ndarray]],
+                 num_prefetch: int = 2,
+                 start: Optional[float] = None,
+                 duration: Optional[float] = None) -> AudioPrefetcher:
+        """
+        Loads audio files as AudioProcessor objects in order, decoding the next
+        files in a background thread pool while the current one is processed.
+        The decoding of each file is timed as the "load_audio" stage.
+
+        Args:
+            audio_files (Iterable[Union[str, torch.Tensor, ndarray]]):
+                            Paths to audio files or tensors representing the audio.
+            num_prefetch (int, optional): Number of files decoded ahead.
+                                            0 disables prefetching. Defaults to 2.
+            start (Optional[float], optional): Start time in seconds of the range
+                                            to decode from each file. Defaults to None.
+            duration (Optional[float], optional): Duration in seconds of the range
+                                            to decode from each file. Defaults to None.
+
+        Returns:
+            AudioPrefetcher: An iterable of AudioProcessor objects.
+        """
+        return AudioPrefetcher(audio_files, num_prefetch,
+                               loader=partial(self._load_audio, start=start, duration=duration,
+                                              background=True))
 
     def diarization(self, audio_file: Union[str, torch.Tensor, ndarray],
                     **kwargs) -> dict:
@@ -211,17 +857,27 @@ class Scraibe:
         """
 
         # Get audio file as an AudioProcessor object
-        audio_file: AudioProcessor = self.get_audio_file(audio_file)
+        audio_file: AudioProcessor = self._load_audio(audio_file)
 
-        # Prepare waveform and sample rate for diarization
-        dia_audio = {
-            "waveform": audio_file.waveform.reshape(1, len(audio_file.waveform)).to(self.device),
-            "sample_rate": audio_file.sr
-        }
+        dia_key = None
+        if self.result_cache is not None:
+            dia_key = self._diarisation_key(audio_file, **kwargs)
+            diarisation = self.result_cache.load(dia_key)
+        if dia_key is None or diarisation is None:
+            print("Starting diarisation.")
 
-        print("Starting diarisation.")
+            # Prepare waveform and sample rate for diarization
+            dia_audio = self._diarisation_audio(audio_file, **kwargs)
+            diarisation = self._timed("diarization", len(audio_file.waveform) / audio_file.sr,
+                                      self.diariser.diarization, dia_audio, **kwargs)
+            del dia_audio
 
-        diarisation = self.diariser.diarization(dia_audio, **kwargs)
+            if dia_key is not None:
+                self.result_cache.store(dia_key, diarisation)
+
+        if audio_file.offset:
+            diarisation["segments"] = [[start + audio_file.offset, end + audio_file.offset]
+                                       for start, end in diarisation["segments"]]
 
         return diarisation
 
@@ -240,9 +896,459 @@ class Scraibe:
                 str:
                     The transcribed text from the audio source.
         """
-        audio_file: AudioProcessor = self.get_audio_file(audio_file)
+        audio_file: AudioProcessor = self._load_audio(audio_file)
+
+        seconds = len(audio_file.waveform) / audio_file.sr
+
+        if self.result_cache is None:
+            return self._timed("transcribe", seconds, self.transcriber.transcribe,
+                               audio_file.float_waveform(), **kwargs)
+
+        key = ResultCache.key("transcription", ResultCache.audio_key(audio_file),
+                              **self._transcription_settings(**kwargs))
+        transcript = self.result_cache.load(key)
+        if transcript is None:
+            transcript = self._timed("transcribe", seconds, self.transcriber.transcribe,
+                                     audio_file.float_waveform(), **kwargs)
+            self.result_cache.store(key, transcript)
+
+        return transcript
+
+    def warmup(self, diarization: bool = True, transcription: bool = True,
+               duration: float = 1.0) -> dict:
+        """
+        Loads the models and runs them once on a short synthetic signal, so the first
+        request of a service does not pay for loading weights and initialising kernels.
+
+        Args:
+            diarization (bool, optional): Whether the diariser is warmed up. Defaults to True.
+            transcription (bool, optional): Whether the transcriber is warmed up.
+                                            Defaults to True.
+            duration (float, optional): Seconds of the synthetic signal. Defaults to 1.0.
+
+        Returns:
+            dict: Seconds of each warmed up stage, including loading its model.
+        """
+        # quiet deterministic noise, so the runs do not depend on any file
+        generator = torch.Generator().manual_seed(0)
+        waveform = 1e-3 * torch.randn(int(duration * SAMPLE_RATE), generator=generator)
+        seconds = {}
+
+        if diarization:
+            start = perf_counter()
+            self._timed("diarization", duration, self.diariser.diarization,
+                        {"waveform": waveform.reshape(1, -1).to(self.device),
+                         "sample_rate": SAMPLE_RATE})
+            seconds["diarization"] = perf_counter() - start
+
+        if transcription:
+            start = perf_counter()
+            self._timed("transcribe", duration, self.transcriber.transcribe,
+                        waveform, language="en")
+            seconds["transcribe"] = perf_counter() - start
+
+        if self.verbose:
+            print(f"Scraibe warmed up in {sum(seconds.values()):.1f} s.")
+
+        return seconds
+
+    def add_observer(self, observer: Callable[[str, float, float, float], None]) -> None:
+        """
+        Adds an observer that is called after every stage of a run, e.g. a
+        TimingCollector. See `scraibe.instrumentation` for the stages.
+
+        Args:
+            observer (Callable[[str, float, float, float], None]): Called with the name of
+                            the stage, its wall time and CPU time, and the seconds of audio.
+        """
+        self.observers.append(observer)
+
+    def remove_observer(self, observer: Callable[[str, float, float, float], None]) -> None:
+        """
+        Removes an observer added with `add_observer`.
+
+        Args:
+            observer (Callable[[str, float, float, float], None]): The observer to remove.
+        """
+        self.observers.remove(observer)
+
+    @contextmanager
+    def _stage(self, stage: str, audio_seconds: float = 0.0) -> Iterator[StageTimer]:
+        """
+        Times a stage for the observers. Without observers, nothing is timed.
+        The model placement is prepared inside the stage, so loading or moving
+        a model is timed with the stage that needs it.
+
+        Args:
+            stage (str): Name of the stage.
+            audio_seconds (float, optional): Seconds of audio processed by the stage.
+
+        Yields:
+            StageTimer: The timer of the stage, the shared NULL_TIMER without observers.
+        """
+        with (StageTimer(stage, audio_seconds, self.observers) if self.observers
+              else NULL_TIMER) as timer:
+            if self.placement is not None:
+                self.placement.activate(stage)
+            yield timer
+
+    def _pinned(self):
+        """
+        Keeps both models on the device while they run concurrently.
+
+        Returns:
+            A context manager.
+        """
+        return self.placement.pinned() if self.placement is not None else nullcontext()
+
+    @property
+    def memory_report(self) -> Optional[dict]:
+        """
+        Resident and peak resident memory in MiB after each stage of the last run,
+        and the number of model loads, or None without offloading or `report_memory`.
+        """
+        if self.placement is None or not self.placement.track_memory:
+            return None
+        return self.placement.report
+
+    def _named_model(self, role: str, name: str, whisper_type: str = "whisper",
+                     **kwargs) -> tuple:
+        """
+        A LazyModel standing in for a model given by name, with the loader and release
+        callback for the placement. With a registry, the loader acquires the wrapper
+        shared with other Scraibe instances and the callback releases it.
+
+        Args:
+            role (str): "transcriber" or "diariser".
+            name (str): Name or path of the model.
+            whisper_type (str, optional): Type of the whisper model. Defaults to "whisper".
+            **kwargs: Keyword arguments for loading the model.
+
+        Returns:
+            tuple: The LazyModel, the loader and the release callback or None.
+        """
+        if role == "transcriber":
+            wrapper = self._transcriber_class(whisper_type)(None, name)
+            loader = partial(load_transcriber, name, whisper_type, **kwargs)
+            settings = dict(whisper_type=whisper_type.lower(),
+                            compute_type=kwargs.get("compute_type"),
+                            download_root=kwargs.get("download_root"))
+        else:
+            wrapper = Diariser(None, model_name=str(name),
+                               source=dict(model=name,
+                                           cache_dir=kwargs.get("cache_dir", PYANNOTE_DEFAULT_PATH),
+                                           hparams_file=kwargs.get("hparams_file")))
+            loader = partial(Diariser.load_model, name, **kwargs)
+            settings = dict(hparams_file=kwargs.get("hparams_file"))
+
+        wrapper = LazyModel(wrapper)
+        if self.registry is None:
+            return wrapper, loader, None
+
+        key = ModelRegistry.key(role, model=name,
+                                device=kwargs.get("device", SCRAIBE_TORCH_DEVICE), **settings)
+        return (wrapper, partial(self.registry.acquire, key, loader),
+                partial(self.registry.release, key))
+
+    @staticmethod
+    def _transcriber_class(whisper_type: str) -> type:
+        """
+        The Transcriber subclass of a type of whisper model.
+        """
+        if whisper_type.lower() == 'whisper':
+            return WhisperTranscriber
+        elif whisper_type.lower() == 'faster-whisper':
+            return FasterWhisperTranscriber
+        raise ValueError(f'Model type not recognized, exptected "whisper" '
+                         f'or "faster-whisper", got {whisper_type}.')
+
+    def _timed(self, stage: str, audio_seconds: float, func: Callable, *args, **kwargs):
+        """
+        Calls a function as a timed stage, see `_stage`.
+
+        Returns:
+            The result of the function.
+        """
+        with self._stage(stage, audio_seconds):
+            return func(*args, **kwargs)
+
+    def _load_audio(self, audio_file: Union[str, torch.Tensor, ndarray],
+                    start: Optional[float] = None,
+                    duration: Optional[float] = None,
+                    background: bool = False) -> AudioProcessor:
+        """
+        Gets an audio file as an AudioProcessor object with the audio cache
+        and storage dtype of this instance, as a timed stage. Audio that is
+        already loaded, e.g. by `prefetch`, is not timed again.
+
+        Args:
+            audio_file (Union[str, torch.Tensor, ndarray]): Path to the audio file
+                            or the audio.
+            start, duration: See `get_audio_file`.
+            background (bool, optional): If True, the audio is decoded next to the other
+                            stages, e.g. by `prefetch`, so the decoding is only timed
+                            and the model placement is left alone. Defaults to False.
+
+        Returns:
+            AudioProcessor: The loaded audio.
+        """
+        if isinstance(audio_file, AudioProcessor):
+            return audio_file
+
+        timer = StageTimer("load_audio", observers=self.observers) if background \
+            else self._stage("load_audio")
+        with timer as stage:
+            audio_file = self.get_audio_file(audio_file, cache=self.audio_cache,
+                                             dtype=self.audio_dtype,
+                                             start=start, duration=duration)
+            # NULL_TIMER is shared, it must not hold the audio of this call
+            if stage is not NULL_TIMER:
+                stage.audio_seconds = len(audio_file.waveform) / audio_file.sr
+
+        return audio_file
+
+    def _diarisation_key(self, audio_file: AudioProcessor, **kwargs) -> str:
+        """
+        Key of the diarisation of an audio file in the result cache.
+
+        Args:
+            audio_file (AudioProcessor): The audio that is diarised.
+            **kwargs: Keyword arguments for the diarisation.
+
+        Returns:
+            str: The cache key, from the audio, the diariser config
+                    and the effective diarisation kwargs.
+        """
+        # a diariser given by name is described by its files, so it is not loaded here
+        return ResultCache.key("diarisation", ResultCache.audio_key(audio_file),
+                               diariser=self.diariser.config(),
+                               **Diariser._get_diarisation_kwargs(**kwargs),
+                               **Diariser._get_window_kwargs(**kwargs))
+
+    def _diarisation_audio(self, audio_file: AudioProcessor, **kwargs) -> dict:
+        """
+        The waveform and sample rate of an audio file for the diariser. The waveform
+        is moved to the device, unless it is diarised in windows, which are moved
+        one at a time by the pipeline. It is a float copy of the audio, so it is only
+        built when the diarisation actually runs, and dropped right after it.
+
+        Args:
+            audio_file (AudioProcessor): The audio to diarise.
+            **kwargs: Keyword arguments for the diarisation.
+
+        Returns:
+            dict: The "waveform" of shape (1, time) and the "sample_rate".
+        """
+        waveform = audio_file.float_waveform().reshape(1, len(audio_file.waveform))
+        if not kwargs.get("diarisation_window"):
+            waveform = waveform.to(self.device)
+
+        return {"waveform": waveform, "sample_rate": audio_file.sr}
+
+    def _transcription_settings(self, **kwargs) -> dict:
+        """
+        Settings a transcription depends on, for keys of the result cache and the journal.
+
+        Args:
+            **kwargs: Keyword arguments for the transcription.
+
+        Returns:
+            dict: The type and name of the model and the effective whisper kwargs.
+        """
+        whisper_kwargs = self.transcriber._get_whisper_kwargs(**kwargs)
+        whisper_kwargs.pop("verbose", None)
+
+        return dict(transcriber=self.transcriber.__class__.__name__,
+                    model=self.transcriber.model_name, **whisper_kwargs)
+
+    async def aautotranscribe(self, audio_file: Union[str, torch.Tensor, ndarray],
+                              **kwargs) -> Transcript:
+        """
+        Asynchronous counterpart of `autotranscribe`.
+
+        Decoding, diarisation and transcription run in the executor of this
+        instance, so the event loop is not blocked. Cancelling the task stops
+        the transcription after the segment that is currently processed.
+
+        Args:
+            audio_file (Union[str, torch.Tensor, ndarray]):
+                            Path to audio file or a tensor representing the audio.
+            **kwargs: Additional keyword arguments for autotranscribe.
+
+        Returns:
+            Transcript: A Transcript object containing the transcription,
+                        which can be exported to different formats.
+        """
+        segments = [segment async for segment in
+                    self.aiter_autotranscribe(audio_file, **kwargs)]
+
+        with self._stage("transcript"):
+            return Transcript(dict(enumerate(segments)))
+
+    async def aiter_autotranscribe(self, audio_file: Union[str, torch.Tensor, ndarray],
+                                   **kwargs) -> AsyncIterator[dict]:
+        """
+        Asynchronous counterpart of `iter_autotranscribe`.
+
+        Each segment is computed by a separate call in the executor, so the
+        transcription can be cancelled between segments. The models are held
+        until the generator is exhausted or closed.
+
+        The call runs in its own context, so `verbose` only applies to this call
+        and the reports of concurrent calls, e.g. `vad_report`, do not mix. They are
+        stored on the instance once the call is finished.
+
+        Args:
+            audio_file (Union[str, torch.Tensor, ndarray]):
+                            Path to audio file or a tensor representing the audio.
+            **kwargs: Additional keyword arguments for iter_autotranscribe.
+
+        Yields:
+            dict: The "speakers", "segments" and "text" of each segment.
+        """
+        executor, semaphore = self._get_async_executor()
+        context = self._call_context()
+        segments = self.iter_autotranscribe(audio_file, **kwargs)
+        done = object()
+        future = None
+
+        async with semaphore:
+            try:
+                while True:
+                    future = executor.submit(context.run, next, segments, done)
+                    segment = await asyncio.wrap_future(future)
+                    if segment is done:
+                        break
+                    yield segment
+            finally:
+                def finish(_=None) -> None:
+                    context.run(segments.close)
+                    self._store_reports(context)
+
+                if future is None:
+                    finish()
+                else:
+                    # the generator can only be closed, and the reports are only
+                    # complete, once its current step is finished, which runs
+                    # the callback right away if it is
+                    future.add_done_callback(finish)
+
+    async def adiarization(self, audio_file: Union[str, torch.Tensor, ndarray],
+                           **kwargs) -> dict:
+        """
+        Asynchronous counterpart of `diarization`, run in the executor of this instance.
+
+        Args:
+            audio_file (Union[str, torch.Tensor, ndarray]):
+                The audio source which can either be a path to the audio file or a tensor representation.
+            **kwargs: 
+                Additional keyword arguments for diarization.
+
+        Returns:
+            dict: 
+                A dictionary containing the results of the diarization process.
+        """
+        return await self._run_async(self.diarization, audio_file, **kwargs)
+
+    async def atranscribe(self, audio_file: Union[str, torch.Tensor, ndarray],
+                          **kwargs) -> str:
+        """
+        Asynchronous counterpart of `transcribe`, run in the executor of this instance.
+
+        Args:
+            audio_file (Union[str, torch.Tensor, ndarray]):
+                The audio source, which can either be a path or a tensor representation.
+            **kwargs: 
+                Additional keyword arguments for transcription.
+
+        Returns:
+            str:
+                The transcribed text from the audio source.
+        """
+        return await self._run_async(self.transcribe, audio_file, **kwargs)
+
+    async def _run_async(self, func: Callable, *args, **kwargs):
+        """
+        Runs a blocking method in the executor once a slot of the semaphore is free.
+
+        A cancelled call releases its slot immediately, the model call itself
+        cannot be interrupted and finishes in the background.
+
+        Args:
+            func (Callable): The method to run.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            The result of the method.
+        """
+        executor, semaphore = self._get_async_executor()
+        context = self._call_context()
+
+        async with semaphore:
+            future = executor.submit(context.run, func, *args, **kwargs)
+            # a cancelled call stores its reports once the method has finished
+            future.add_done_callback(lambda _: self._store_reports(context))
+            return await asyncio.wrap_future(future)
+
+    def _call_context(self) -> Context:
+        """
+        Creates the context of an async call, with its own state of the
+        attributes that are kept per call, see `_PerCall`.
+
+        Returns:
+            Context: The context to run the steps of the call in.
+        """
+        context = copy_context()
+        context.run(self._call_state.set, {})
+        return context
+
+    def _store_reports(self, context: Context) -> None:
+        """
+        Stores the reports of a finished async call on the instance,
+        so they can be read like after a synchronous call.
+
+        Args:
+            context (Context): The context of the call.
+        """
+        for name, value in context[self._call_state].items():
+            if name != "verbose":
+                setattr(self, name, value)
+
+    def _get_async_executor(self) -> Tuple[ThreadPoolExecutor, asyncio.Semaphore]:
+        """
+        Gets the executor and the semaphore of the async API, creating them on first use.
+
+        The semaphore allows `max_concurrency` requests to use the models at once,
+        further requests wait on the event loop. It is recreated if the instance
+        is used from another event loop.
+
+        Returns:
+            tuple: The executor and the semaphore for the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                thread_name_prefix="scraibe")
+
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+
+        return self._executor, self._semaphore
+
+    def close(self) -> None:
+        """
+        Shuts down the executor of the async API. It is created again on the next async call.
+        Models shared through the registry are released, they are acquired again on next use.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
 
-        return self.transcriber.transcribe(audio_file.waveform, **kwargs)
+        if self.placement is not None:
+            self.placement.release_all()
 
     def update_transcriber(self, whisper_model: Union[str, whisper], **kwargs) -> None:
         """
@@ -260,12 +1366,17 @@ class Scraibe:
         _old_model = self.transcriber.model_name
 
         if isinstance(whisper_model, str):
-            self.transcriber = load_transcriber(whisper_model, **kwargs)
+            transcriber, loader, release = self._named_model(
+                "transcriber", whisper_model, kwargs.pop("whisper_type", "whisper"), **kwargs)
+            self.placement.replace("transcriber", transcriber, loader, release=release)
+            self.transcriber = transcriber
         elif isinstance(whisper_model, Transcriber):
             self.transcriber = whisper_model
+            self.placement.register("transcriber", self.transcriber)
         else:
             warn(
                 f"Invalid model type. Please provide a valid model. Fallback to old {_old_model} Model.", RuntimeWarning)
+            return None
 
         return None
 
@@ -283,11 +1394,15 @@ class Scraibe:
                 None
         """
         if isinstance(dia_model, str):
-            self.diariser = Diariser.load_model(dia_model, **kwargs)
+            diariser, loader, release = self._named_model("diariser", dia_model, **kwargs)
+            self.placement.replace("diariser", diariser, loader, release=release)
+            self.diariser = diariser
         elif isinstance(dia_model, Diariser):
             self.diariser = dia_model
+            self.placement.register("diariser", self.diariser)
         else:
             warn("Invalid model type. Please provide a valid model. Fallback to old Model.", RuntimeWarning)
+            return None
 
         return None
 
@@ -325,12 +1440,23 @@ class Scraibe:
             print(f"Audiofile {audio_file} removed.")
 
     @staticmethod
-    def get_audio_file(audio_file: Union[str, torch.Tensor, ndarray]) -> AudioProcessor:
+    def get_audio_file(audio_file: Union[str, torch.Tensor, ndarray],
+                       cache: Union[bool, AudioCache] = False,
+                       dtype: Optional[str] = None,
+                       start: Optional[float] = None,
+                       duration: Optional[float] = None) -> AudioProcessor:
         """Gets an audio file as TorchAudioProcessor.
 
         Args:
             audio_file (Union[str, torch.Tensor, ndarray]): Path to the audio file or 
                                                         a tensor representing the audio.
+            cache (Union[bool, AudioCache], optional): Whether to use the on-disk
+                                                        audio cache for audio file paths.
+            dtype (Optional[str], optional): Storage dtype of the loaded waveform.
+            start (Optional[float], optional): Start time in seconds of the range
+                                                to decode from an audio file path.
+            duration (Optional[float], optional): Duration in seconds of the range
+                                                to decode from an audio file path.
             *args: Additional positional arguments.
             **kwargs: Additional keyword arguments.
 
@@ -340,13 +1466,14 @@ class Scraibe:
         """
 
         if isinstance(audio_file, str):
-            audio_file = AudioProcessor.from_file(audio_file)
+            audio_file = AudioProcessor.from_file(audio_file, cache=cache, dtype=dtype,
+                                                  start=start, duration=duration)
 
         elif isinstance(audio_file, torch.Tensor):
-            audio_file = AudioProcessor(audio_file[0], audio_file[1])
+            audio_file = AudioProcessor(audio_file[0], audio_file[1], dtype=dtype)
         elif isinstance(audio_file, ndarray):
             audio_file = AudioProcessor(torch.Tensor(audio_file[0]),
-                                        audio_file[1])
+                                        audio_file[1], dtype=dtype)
 
         if not isinstance(audio_file, AudioProcessor):
             raise ValueError(f'Audiofile must be of type AudioProcessor,'
@@ -7,10 +7,17 @@ output formats, and other options necessary for transcription.
 import os
 import json
 from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
-from whisper.tokenizer import LANGUAGES, TO_LANGUAGE_CODE
-from torch.cuda import is_available
-from .autotranscript import Scraibe
-from .misc import set_threads
+from multiprocessing import get_context
+from time import perf_counter
+from typing import TYPE_CHECKING, List, Optional
+from .instrumentation import TimingCollector
+from .misc import DIARISATION_OVERLAP, set_threads
+
+# torch, whisper and pyannote are imported once the arguments are parsed,
+# so --help does not wait for them
+if TYPE_CHECKING:
+    from .audio import AudioProcessor
+    from .autotranscript import Scraibe
 
 def cli():
     """
@@ -51,9 +58,13 @@ def cli():
     parser.add_argument("--hf-token", default=None, type=str,
                         help="HuggingFace token for private model download.")
 
-    parser.add_argument("--inference-device",
-                        default="cuda" if is_available() else "cpu",
-                        help="Device to use for PyTorch inference.")
+    parser.add_argument("--offline", action="store_true",
+                        help="Never access the network to resolve the diarisation model, "
+                             "fail if it is not cached. Also set by SCRAIBE_OFFLINE=1.")
+
+    parser.add_argument("--inference-device", default=None,
+                        help="Device to use for PyTorch inference; defaults to cuda "
+                             "if available, else cpu.")
 
     parser.add_argument("--num-threads", type=int, default=None,
                         help="Number of threads used by torch for CPU inference; '\
@@ -63,8 +74,10 @@ def cli():
                         help="Directory to save the transcription outputs.")
 
     parser.add_argument("--output-format", "-of", type=str, default="txt",
-                        choices=["txt", "json", "md", "html"],
-                        help="Format of the output file; defaults to txt.")
+                        choices=["txt", "json", "jsonl", "md", "html"],
+                        help="Format of the output file; defaults to txt. "
+                             "jsonl writes each segment as soon as it is transcribed "
+                             "(autotranscribe only).")
 
     parser.add_argument("--verbose-output", type=str2bool, default=True,
                         help="Enable or disable progress and debug messages.")
@@ -76,14 +89,110 @@ def cli():
                         If set to translate, the output will be translated to English.")
 
     parser.add_argument("--language", type=str, default=None,
-                        choices=sorted(
-                            LANGUAGES.keys()) + sorted([k.title() for k in TO_LANGUAGE_CODE.keys()]),
-                        help="Language spoken in the audio. Specify None to perform language detection.")
+                        help="Language spoken in the audio as code or name, e.g. 'en' or "
+                             "'English'. Specify None to perform language detection.")
     parser.add_argument("--num-speakers", type=int, default=2,
                         help="Number of speakers in the audio.")
+    parser.add_argument("--diarisation-window", type=float, default=None,
+                        help="Diarise long recordings in overlapping windows of this many "
+                             "seconds, so the memory does not grow with the length of the "
+                             "recording. Speakers are matched across windows by their "
+                             "embeddings. Defaults to the whole recording at once.")
+    parser.add_argument("--diarisation-overlap", type=float, default=DIARISATION_OVERLAP,
+                        help="Overlap of consecutive diarisation windows in seconds.")
+
+    parser.add_argument("--start", type=float, default=None,
+                        help="Start time in seconds of the range to process in each file. "
+                             "Timestamps in the output refer to the whole file.")
+
+    parser.add_argument("--duration", type=float, default=None,
+                        help="Duration in seconds of the range to process in each file.")
+
+    parser.add_argument("--vad", type=str2bool, default=False,
+                        help="Skip silence with an energy-based voice activity detector "
+                             "before diarisation and transcription.")
+
+    parser.add_argument("--prefetch", type=int, default=2,
+                        help="Number of audio files decoded in the background while "
+                             "the current file is processed. 0 disables prefetching.")
+
+    parser.add_argument("--audio-dtype", type=str, default="float32",
+                        choices=["float32", "float16", "int16"],
+                        help="Dtype used to keep the decoded audio in memory. "
+                             "float16 and int16 halve memory usage.")
+
+    parser.add_argument("--audio-cache", type=str2bool, default=False,
+                        help="Cache decoded audio on disk and reuse it for files "
+                             "that were processed before. The cache size is limited "
+                             "by SCRAIBE_AUDIO_CACHE_SIZE (bytes).")
+
+    parser.add_argument("--result-cache", type=str2bool, default=False,
+                        help="Cache diarisations and transcripts on disk and reuse them "
+                             "for the same audio and settings. The cache size is limited "
+                             "by SCRAIBE_RESULT_CACHE_SIZE (bytes).")
+
+    parser.add_argument("--offload", type=str, default="none",
+                        choices=["none", "cpu", "unload"],
+                        help="Keep only the model of the running stage on the device. "
+                             "'cpu' moves the idle model to the CPU, 'unload' releases it "
+                             "and reloads it when needed, which lowers the peak memory "
+                             "at the cost of reloading the models for every file.")
+
+    parser.add_argument("--journal", type=str2bool, default=False,
+                        help="Record the progress of autotranscribe in <name>.journal.jsonl "
+                             "next to the output, so an interrupted run continues where "
+                             "it stopped. The journal is removed once the output is saved.")
+
+    parser.add_argument("--timings", type=str2bool, default=False,
+                        help="Record wall time, CPU time and real-time factor of each stage "
+                             "and save them to timings.json in the output directory.")
+
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes, each with its own models. "
+                             "The threads are split evenly between the workers. "
+                             "A failing file does not stop the others, but the exit "
+                             "code is 1.")
+
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="Number of diarisation segments transcribed in a single "
+                             "forward pass. Batched decoding is faster but has no "
+                             "temperature fallback. 1 transcribes the segments one by one.")
+
+    parser.add_argument("--single-pass", type=str2bool, default=False,
+                        help="Transcribe each file once with word timestamps while the "
+                             "diarisation runs concurrently, and assign the words to "
+                             "the speakers afterwards.")
+
+    parser.add_argument("--coalesce", type=str2bool, default=False,
+                        help="Pack short consecutive diarisation turns into windows "
+                             "that are transcribed once.")
+
+    parser.add_argument("--max-window", type=float, default=30.0,
+                        help="Maximum length in seconds of a coalesced window.")
+
+    parser.add_argument("--max-gap", type=float, default=1.0,
+                        help="Maximum silence in seconds between two turns of a "
+                             "coalesced window.")
+
+    parser.add_argument("--cross-speaker", type=str2bool, default=False,
+                        help="Allow turns of different speakers in one coalesced window. "
+                             "The text is split back to the speakers by word timestamps.")
+
+    parser.add_argument("--max-interjection", type=float, default=1.0,
+                        help="Maximum length in seconds of a turn of another speaker, "
+                             "e.g. a backchannel, that joins a coalesced window. "
+                             "0 keeps speakers apart.")
 
     args = parser.parse_args()
 
+    from whisper.tokenizer import LANGUAGES, TO_LANGUAGE_CODE
+    from .autotranscript import Scraibe
+
+    languages = sorted(LANGUAGES.keys()) + sorted([k.title() for k in TO_LANGUAGE_CODE.keys()])
+    if args.language is not None and args.language not in languages:
+        parser.error(f"argument --language: invalid choice: '{args.language}' "
+                     f"(choose from {', '.join(languages)})")
+
     arg_dict = vars(args)
 
     # configure output
@@ -94,67 +203,297 @@ def cli():
 
     task = arg_dict.pop("task")
 
-    set_threads(arg_dict.pop("num_threads"))
+    num_threads = arg_dict.pop("num_threads")
+    workers = arg_dict.pop("workers")
+    timings = TimingCollector() if arg_dict.pop("timings") else None
 
     class_kwargs = {'whisper_model': arg_dict.pop("whisper_model_name"),
                     'whisper_type':arg_dict.pop("whisper_type"),
                     'dia_model': arg_dict.pop("diarization_directory"),
                     'use_auth_token': arg_dict.pop("hf_token"),
+                    'audio_cache': arg_dict.pop("audio_cache"),
+                    'audio_dtype': arg_dict.pop("audio_dtype"),
+                    'result_cache': arg_dict.pop("result_cache"),
+                    'offload': arg_dict.pop("offload"),
                     }
 
+    if arg_dict.pop("offline"):
+        class_kwargs["offline"] = True
+
     if arg_dict["whisper_model_directory"]:
         class_kwargs["download_root"] = arg_dict.pop("whisper_model_directory")
-        
-
-    model = Scraibe(**class_kwargs)
-
-    if arg_dict["audio_files"]:
-        audio_files = arg_dict.pop("audio_files")
-
-        if task == "autotranscribe" or task == "autotranscribe+translate":
-            for audio in audio_files:
-                if task == "autotranscribe+translate":
-                    task = "translate"
-                else:
-                    task = "transcribe"
-
-                out = model.autotranscribe(
-                        audio, 
-                        task=task, 
-                        language=arg_dict.pop("language"), 
-                        verbose=arg_dict.pop("verbose_output"),
-                        num_speakers=arg_dict.pop("num_speakers")
-                        )
-                basename = audio.split("/")[-1].split(".")[0]
-                print(f'Saving {basename}.{out_format} to {out_folder}')
-                out.save(os.path.join(
-                    out_folder, f"{basename}.{out_format}"))
-
-        elif task == "diarization":
-            for audio in audio_files:
-                if arg_dict.pop("verbose_output"):
-                    print("Verbose not implemented for diarization.")
-
-                out = model.diarization(audio)
-                basename = audio.split("/")[-1].split(".")[0]
-                path = os.path.join(out_folder, f"{basename}.{out_format}")
-
-                print(f'Saving {basename}.{out_format} to {out_folder}')
-
-                with open(path, "w") as f:
-                    json.dump(json.dumps(out, indent=1), f)
-
-        elif task == "transcribe" or task == "translate":
-
-            for audio in audio_files:
-
-                out = model.transcribe(audio, task=task,
-                                        language=arg_dict.pop("language"),
-                                        verbose=arg_dict.pop("verbose_output"))
-                basename = audio.split("/")[-1].split(".")[0]
-                path = os.path.join(out_folder, f"{basename}.{out_format}")
-                with open(path, "w") as f:
-                    f.write(out)
+
+    if not arg_dict["audio_files"]:
+        set_threads(num_threads)
+        # only downloads the models, so load them now
+        Scraibe(**class_kwargs, lazy=False)
+        return
+
+    audio_files = arg_dict.pop("audio_files")
+    language = arg_dict.pop("language")
+    verbose = arg_dict.pop("verbose_output")
+    num_prefetch = arg_dict.pop("prefetch")
+    load_kwargs = dict(start=arg_dict.pop("start"), duration=arg_dict.pop("duration"))
+    window_kwargs = dict(diarisation_window=arg_dict.pop("diarisation_window"),
+                         diarisation_overlap=arg_dict.pop("diarisation_overlap"))
+
+    if task == "autotranscribe" or task == "autotranscribe+translate":
+        options = dict(task="translate" if task == "autotranscribe+translate" else "transcribe",
+                       language=language,
+                       verbose=verbose,
+                       num_speakers=arg_dict.pop("num_speakers"),
+                       vad=arg_dict.pop("vad"),
+                       batch_size=arg_dict.pop("batch_size"),
+                       single_pass=arg_dict.pop("single_pass"),
+                       coalesce=dict(max_window=arg_dict.pop("max_window"),
+                                     max_gap=arg_dict.pop("max_gap"),
+                                     cross_speaker=arg_dict.pop("cross_speaker"),
+                                     max_interjection=arg_dict.pop("max_interjection")
+                                     ) if arg_dict.pop("coalesce") else False,
+                       journal=arg_dict.pop("journal"),
+                       **window_kwargs)
+        task = "autotranscribe"
+
+    elif task == "diarization":
+        options = dict(window_kwargs)
+        if verbose:
+            print("Verbose not implemented for diarization.")
+
+    else:
+        options = dict(task=task, language=language, verbose=verbose)
+
+    if workers > 1:
+        results = run_workers(audio_files, workers, class_kwargs, num_threads,
+                              task, options, load_kwargs, out_folder, out_format, timings)
+        if any(result["error"] for result in results):
+            raise SystemExit(1)
+        return
+
+    set_threads(num_threads)
+    model = Scraibe(**class_kwargs, observers=[timings] if timings else [])
+
+    prefetched = model.prefetch(audio_files, num_prefetch, **load_kwargs)
+
+    for audio, audio_file in zip(audio_files, prefetched):
+        process_file(model, audio, audio_file, task, options, out_folder, out_format)
+
+    if model.result_cache is not None and verbose:
+        print(f"Result cache: {model.result_cache.stats()}")
+
+    if timings is not None:
+        save_timings(timings, out_folder, verbose)
+
+
+def save_timings(timings: TimingCollector, out_folder: str, verbose: bool = False) -> None:
+    """
+    Saves the timings of a run to timings.json in the output directory.
+
+    Args:
+        timings (TimingCollector): The collected timings.
+        out_folder (str): Directory of the output files.
+        verbose (bool, optional): If True, the timings are printed as well.
+    """
+    path = os.path.join(out_folder, "timings.json")
+    print(f'Saving timings to {path}')
+    timings.to_json(path)
+
+    if verbose:
+        for stage, totals in timings.to_dict().items():
+            rtf = f", RTF {totals['rtf']:.3f}" if totals["rtf"] is not None else ""
+            print(f"  {stage}: {totals['calls']} calls, {totals['wall_time']:.2f} s wall, "
+                  f"{totals['cpu_time']:.2f} s CPU{rtf}")
+
+
+def process_file(model: 'Scraibe', audio: str, audio_file: 'AudioProcessor',
+                 task: str, options: dict, out_folder: str, out_format: str) -> None:
+    """
+    Runs a task of the CLI on one audio file and saves the output.
+
+    Args:
+        model (Scraibe): The model to use.
+        audio (str): Path of the audio file, used to name the output.
+        audio_file (AudioProcessor): The loaded audio.
+        task (str): "autotranscribe", "diarization", "transcribe" or "translate".
+        options (dict): Keyword arguments for the task.
+        out_folder (str): Directory of the output file.
+        out_format (str): Format of the output file.
+    """
+    basename = audio.split("/")[-1].split(".")[0]
+    path = os.path.join(out_folder, f"{basename}.{out_format}")
+
+    if task == "autotranscribe":
+        from .journal import Journal
+
+        journal = Journal(os.path.join(out_folder, f"{basename}.journal.jsonl")) \
+            if options["journal"] else None
+        options = dict(options, journal=journal)
+
+        if out_format == "jsonl":
+            print(f'Writing {basename}.{out_format} to {out_folder}')
+            with open(path, "w") as f:
+                for i, segment in enumerate(
+                        model.iter_autotranscribe(audio_file, **options)):
+                    f.write(json.dumps({"id": i, **segment}) + "\n")
+                    f.flush()
+        else:
+            out = model.autotranscribe(audio_file, **options)
+            print(f'Saving {basename}.{out_format} to {out_folder}')
+            out.save(path)
+
+        if journal is not None:
+            journal.remove()
+
+        if options["coalesce"] and options["verbose"]:
+            print(f"Coalesced turns: {model.schedule_report}")
+        if model.memory_report is not None and options["verbose"]:
+            print(f"Peak memory of {audio}: {model.memory_report['peak_rss_mb']} MiB "
+                  f"({model.memory_report['policy']} offloading)")
+        if options["language"] is None and model.language_report:
+            print(f"Detected language of {audio}: {model.language_report['language']} "
+                  f"(probability {model.language_report['probability']:.2f})")
+
+    elif task == "diarization":
+        out = model.diarization(audio_file, **options)
+
+        print(f'Saving {basename}.{out_format} to {out_folder}')
+
+        with open(path, "w") as f:
+            json.dump(json.dumps(out, indent=1), f)
+
+    else:
+        out = model.transcribe(audio_file, **options)
+        with open(path, "w") as f:
+            f.write(out)
+
+
+# model of a worker process of run_workers, or the error raised while loading it
+_WORKER_MODEL: Optional['Scraibe'] = None
+_WORKER_ERROR: Optional[str] = None
+
+
+def run_workers(audio_files: List[str], workers: int, class_kwargs: dict,
+                num_threads: Optional[int], task: str, options: dict,
+                load_kwargs: dict, out_folder: str, out_format: str,
+                timings: Optional[TimingCollector] = None) -> List[dict]:
+    """
+    Processes audio files with a pool of worker processes. Each worker loads
+    its own Scraibe instance and takes the next file once it is done, the
+    threads are split evenly between the workers. A failing file does not stop
+    the other files, a summary of all files and the throughput is printed at the end.
+
+    Args:
+        audio_files (List[str]): Paths of the audio files.
+        workers (int): Number of worker processes.
+        class_kwargs (dict): Keyword arguments for Scraibe.
+        num_threads (Optional[int]): Total number of threads, defaults to SCRAIBE_NUM_THREADS.
+        task (str): "autotranscribe", "diarization", "transcribe" or "translate".
+        options (dict): Keyword arguments for the task.
+        load_kwargs (dict): Keyword arguments for Scraibe.get_audio_file.
+        out_folder (str): Directory of the output files.
+        out_format (str): Format of the output files.
+        timings (Optional[TimingCollector], optional): Collects the timings of all workers.
+
+    Returns:
+        List[dict]: The result of each file, in the order they finished.
+    """
+    from .misc import SCRAIBE_NUM_THREADS
+
+    threads = max(1, (num_threads or SCRAIBE_NUM_THREADS) // workers)
+    jobs = [(audio, task, options, load_kwargs, out_folder, out_format)
+            for audio in audio_files]
+
+    start = perf_counter()
+    # spawn, as forked workers would share the torch thread pools of the parent
+    with get_context("spawn").Pool(workers, initializer=_init_worker,
+                                   initargs=(class_kwargs, threads,
+                                             timings is not None)) as pool:
+        results = []
+        for result in pool.imap_unordered(_run_worker, jobs):
+            if result["error"]:
+                print(f"Failed {result['file']}: {result['error']}")
+            if timings is not None and result["timings"]:
+                timings.merge(result["timings"])
+            results.append(result)
+    elapsed = perf_counter() - start
+
+    done = [result for result in results if not result["error"]]
+    audio_seconds = sum(result["audio_seconds"] for result in done)
+
+    print(f"Processed {len(done)}/{len(results)} files with {workers} workers "
+          f"and {threads} threads each in {elapsed:.1f} s.")
+    print(f"Throughput: {len(done) / elapsed * 60:.2f} files/min, "
+          f"{audio_seconds / elapsed:.2f} s of audio per second.")
+    for result in results:
+        if result["error"]:
+            print(f"  failed: {result['file']}")
+
+    if timings is not None:
+        save_timings(timings, out_folder, options.get("verbose", False))
+
+    return results
+
+
+def _init_worker(class_kwargs: dict, num_threads: int, timings: bool = False) -> None:
+    """
+    Loads the model of a worker process of run_workers.
+    """
+    global _WORKER_MODEL, _WORKER_ERROR
+    set_threads(num_threads)
+    try:
+        from .autotranscript import Scraibe
+
+        _WORKER_MODEL = Scraibe(**class_kwargs,
+                                observers=[TimingCollector()] if timings else [])
+    except Exception as e:
+        # an initializer that raises makes the pool restart the worker endlessly
+        _WORKER_ERROR = f"Loading the models failed: {type(e).__name__}: {e}"
+
+
+def _run_worker(job: tuple) -> dict:
+    """
+    Processes one audio file in a worker process of run_workers.
+
+    Returns:
+        dict: The file, the process id of the worker, the error message or None,
+                the processing time, the duration of the audio in seconds
+                and the timings of the stages.
+    """
+    audio, task, options, load_kwargs, out_folder, out_format = job
+    model = _WORKER_MODEL
+
+    start = perf_counter()
+    if model is None:
+        return {"file": audio, "worker": os.getpid(), "error": _WORKER_ERROR,
+                "seconds": 0.0, "audio_seconds": 0.0, "timings": None}
+
+    for observer in model.observers:
+        if isinstance(observer, TimingCollector):
+            observer.reset()
+
+    try:
+        audio_file = model._load_audio(audio, **load_kwargs)
+        process_file(model, audio, audio_file, task, options, out_folder, out_format)
+    except Exception as e:
+        return {"file": audio, "worker": os.getpid(), "error": f"{type(e).__name__}: {e}",
+                "seconds": perf_counter() - start, "audio_seconds": 0.0,
+                "timings": _worker_timings(model)}
+
+    return {"file": audio, "worker": os.getpid(), "error": None,
+            "seconds": perf_counter() - start,
+            "audio_seconds": len(audio_file.waveform) / audio_file.sr,
+            "timings": _worker_timings(model)}
+
+
+def _worker_timings(model: 'Scraibe') -> Optional[dict]:
+    """
+    Timings of the last file of a worker process, or None if they are not collected.
+    """
+    for observer in model.observers:
+        if isinstance(observer, TimingCollector):
+            return observer.to_dict()
+
+    return None
+
 
 if __name__ == "__main__":
     cli()
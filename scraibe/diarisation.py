@@ -14,11 +14,16 @@ Available Classes:
 - Diariser: Main class for performing speaker diarization. 
             Includes methods for loading models, processing audio files,
             and formatting the diarization output.
+- SpeakerStitcher: Reconciles the speakers of consecutive diarisation windows
+                   by their speaker embeddings.
 
 Constants:
 - TOKEN_PATH (str): Path to the Pyannote token.
 - PYANNOTE_DEFAULT_PATH (str): Default path to Pyannote models.
 - PYANNOTE_DEFAULT_CONFIG (str): Default configuration for Pyannote models.
+- PIPELINE_CONFIG_NAME (str): File name of a pipeline config in a repository.
+- MANIFEST_NAME (str): File name of the manifest of resolved models in the cache.
+- WINDOW_KWARGS (tuple): Keyword arguments of the sliding window diarisation.
 
 Usage:
     from .diarisation import Diariser
@@ -27,26 +32,34 @@ Usage:
     diarisation_output = model.diarization("path/to/audiofile.wav")
 """
 
+import json
 import warnings
 import os
 import yaml
+from contextlib import contextmanager
+from hashlib import blake2b
 from pathlib import Path
-from typing import TypeVar, Union
+from tempfile import mkstemp
+from typing import Iterator, Optional, TypeVar, Union
 
-from pyannote.audio import Pipeline
-from pyannote.audio.pipelines.speaker_diarization import SpeakerDiarization
+import numpy as np
 from torch import Tensor
 from torch import device as torch_device
 
-from huggingface_hub import HfApi
-from huggingface_hub.utils import RepositoryNotFoundError
-
-from .misc import PYANNOTE_DEFAULT_PATH, PYANNOTE_DEFAULT_CONFIG, SCRAIBE_TORCH_DEVICE
+from .misc import (DIARISATION_OVERLAP, PYANNOTE_DEFAULT_PATH, PYANNOTE_DEFAULT_CONFIG,
+                   SCRAIBE_OFFLINE, SCRAIBE_TORCH_DEVICE, SPEAKER_THRESHOLD)
 Annotation = TypeVar('Annotation')
 
 TOKEN_PATH = os.path.join(os.path.dirname(
     os.path.realpath(__file__)), '.pyannotetoken')
 
+# file names of a pipeline config and of the manifest of resolved models
+PIPELINE_CONFIG_NAME = "config.yaml"
+MANIFEST_NAME = "scraibe_manifest.json"
+
+# keyword arguments of the sliding window diarisation, see `Diariser.diarization`
+WINDOW_KWARGS = ("diarisation_window", "diarisation_overlap", "speaker_threshold")
+
 
 class Diariser:
     """
@@ -55,12 +68,21 @@ class Diariser:
 
     Args:
         model: The pretrained model to use for diarization.
+        model_name: The path or identifier the model was loaded from.
+        source: The arguments of `describe` for a model loaded by name, see `config`.
     """
 
-    def __init__(self, model) -> None:
+    def __init__(self, model, model_name: str = None, source: Optional[dict] = None) -> None:
 
         self.model = model
 
+        self.model_name = model_name
+
+        self.source = source
+
+        # hyperparameters of the pipeline, kept while it is unloaded
+        self._params = self._pipeline_params(model)
+
     def diarization(self, audiofile: Union[str, Tensor, dict],
                     *args, **kwargs) -> Annotation:
         """
@@ -68,25 +90,127 @@ class Diariser:
         effectively separating different speakers
         and providing a timestamp for each segment.
 
+        With `diarisation_window`, long recordings are diarised in overlapping
+        windows of that many seconds, see `windowed_diarization`, so the memory
+        does not grow with the length of the recording.
+
         Args:
             audiofile: The path to the audio file or a torch.Tensor
                         containing the audio data.
             args: Additional arguments for the diarization model.
-            kwargs: Additional keyword arguments for the diarization model.
+            kwargs: Additional keyword arguments for the diarization model,
+                    and the WINDOW_KWARGS of `windowed_diarization`.
 
         Returns:
             dict: A dictionary containing speaker names,
                     segments, and other information related
                     to the diarization process.
         """
+        window_kwargs = self._get_window_kwargs(**kwargs)
         kwargs = self._get_diarisation_kwargs(**kwargs)
 
-        diarization = self.model(audiofile, *args, **kwargs)
+        if window_kwargs.get("diarisation_window"):
+            diarization = self.windowed_diarization(audiofile, *args, **window_kwargs, **kwargs)
+        else:
+            diarization = self.model(audiofile, *args, **kwargs)
 
         out = self.format_diarization_output(diarization)
 
         return out
 
+    def windowed_diarization(self, audio: dict, *args,
+                             diarisation_window: float,
+                             diarisation_overlap: float = DIARISATION_OVERLAP,
+                             speaker_threshold: float = SPEAKER_THRESHOLD,
+                             **kwargs) -> Annotation:
+        """
+        Diarises a long recording in overlapping windows and reconciles the speakers
+        of the windows by their embeddings, see SpeakerStitcher.
+
+        Each window keeps the turns up to the middle of its overlaps with the
+        neighbouring windows, so turns crossing a window boundary are cut there and
+        joined again by `format_diarization_output` if both parts are assigned to
+        the same speaker. Recordings not longer than a window are diarised at once.
+
+        `num_speakers` and `max_speakers` bound the number of speakers of each window
+        and of the whole recording, the closest speakers are merged if the windows
+        yield more. `min_speakers` only applies to recordings diarised at once.
+
+        Args:
+            audio (dict): The "waveform" of shape (channel, time) and its "sample_rate".
+            *args: Additional arguments for the diarization model.
+            diarisation_window (float): Length of the windows in seconds.
+            diarisation_overlap (float, optional): Overlap of consecutive windows in
+                                        seconds. Defaults to DIARISATION_OVERLAP.
+            speaker_threshold (float, optional): Cosine distance up to which speakers of
+                                        different windows are the same speaker.
+                                        Defaults to SPEAKER_THRESHOLD.
+            **kwargs: Additional keyword arguments for the diarization model.
+
+        Returns:
+            Annotation: The diarisation of the whole recording.
+        """
+        from pyannote.core import Annotation, Segment
+
+        if not isinstance(audio, dict):
+            raise ValueError("The windowed diarisation needs the audio as a dict "
+                             "with the waveform and its sample rate.")
+        if not 0 <= diarisation_overlap < diarisation_window:
+            raise ValueError("The overlap must be shorter than the window, "
+                             f"got {diarisation_overlap} and {diarisation_window} seconds.")
+
+        waveform, sr = audio["waveform"], audio["sample_rate"]
+        waveform = waveform.reshape(1, -1) if waveform.ndim == 1 else waveform
+        duration = waveform.shape[-1] / sr
+
+        if duration <= diarisation_window:
+            return self.model(audio, *args, **kwargs)
+
+        max_speakers = kwargs.pop("num_speakers", None) or kwargs.get("max_speakers")
+        kwargs.pop("min_speakers", None)
+        if max_speakers:
+            kwargs["max_speakers"] = max_speakers
+
+        step = diarisation_window - diarisation_overlap
+        starts = [0.0]
+        while starts[-1] + diarisation_window < duration:
+            starts.append(starts[-1] + step)
+
+        stitcher = SpeakerStitcher(speaker_threshold)
+        turns = []
+        for i, start in enumerate(starts):
+            end = min(start + diarisation_window, duration)
+            chunk = {"waveform": waveform[:, int(start * sr):int(end * sr)], "sample_rate": sr}
+
+            try:
+                annotation, centroids = self.model(chunk, *args, return_embeddings=True,
+                                                   **kwargs)
+            except TypeError as error:
+                raise ValueError("The windowed diarisation needs a pipeline that returns "
+                                 "speaker embeddings.") from error
+
+            labels = annotation.labels()
+            speakers = stitcher.assign(centroids if centroids is not None else
+                                       np.zeros((len(labels), 0)),
+                                       [annotation.label_duration(label) for label in labels])
+            speakers = dict(zip(labels, speakers))
+
+            # this window covers the audio up to the middle of its overlaps
+            keep_start = start + diarisation_overlap / 2 if i > 0 else 0.0
+            keep_end = end - diarisation_overlap / 2 if i < len(starts) - 1 else duration
+            keep = Segment(keep_start - start, keep_end - start)
+            for segment, _, label in annotation.crop(keep).itertracks(yield_label=True):
+                turns.append((segment.start + start, segment.end + start, speakers[label]))
+
+        merged = stitcher.merge(max_speakers) if max_speakers else {}
+        names = stitcher.names(merged)
+
+        diarization = Annotation(uri=audio.get("uri"))
+        for i, (start, end, speaker) in enumerate(sorted(turns)):
+            diarization[Segment(start, end), i] = names[merged.get(speaker, speaker)]
+
+        return diarization
+
     @staticmethod
     def format_diarization_output(dia: Annotation) -> dict:
         """
@@ -191,11 +315,17 @@ class Diariser:
                    cache_dir: Union[Path, str] = PYANNOTE_DEFAULT_PATH,
                    hparams_file: Union[str, Path] = None,
                    device: str = SCRAIBE_TORCH_DEVICE,
-                   ) -> Pipeline:
+                   offline: bool = SCRAIBE_OFFLINE,
+                   ) -> 'Diariser':
         """
         Loads a pretrained model from pyannote.audio, 
         either from a local cache or some online repository.
 
+        Local sources are tried first and loaded without any network access:
+        a config file, the manifest of models resolved before, and the
+        Hugging Face cache in `cache_dir`. Only if none of them holds the model,
+        the repositories are tried online in order.
+
         Args:
             model: Path or identifier for the pyannote model.
                 default: '/home/[user]/.cache/torch/models/pyannote/config.yaml'
@@ -205,78 +335,57 @@ class Diariser:
             cache_dir: Directory for caching models.
             hparams_file: Path to a YAML file containing hyperparameters.
             device: Device to load the model on.
-            args: Additional arguments only to avoid errors.
-            kwargs: Additional keyword arguments only to avoid errors.
+            offline: If True, the network is never used and a FileNotFoundError
+                is raised if the model is not available locally.
+                Defaults to SCRAIBE_OFFLINE.
 
         Returns:
-            Pipeline: A pyannote.audio Pipeline object, encapsulating the loaded model.
-        """
-        if isinstance(model, str) and os.path.exists(model):
-            # check if model can be found locally nearby the config file
-            with open(model, 'r') as file:
-                config = yaml.safe_load(file)
-
-            path_to_model = config['pipeline']['params']['segmentation']
-
-            if not os.path.exists(path_to_model):
-                warnings.warn(f"Model not found at {path_to_model}. "
-                              "Trying to find it nearby the config file.")
-
-                pwd = model.split("/")[:-1]
-                pwd = "/".join(pwd)
-
-                path_to_model = os.path.join(pwd, "pytorch_model.bin")
-
-                if not os.path.exists(path_to_model):
-                    warnings.warn(f"Model not found at {path_to_model}. \
-                        'Trying to find it nearby .bin files instead.")
-                    warnings.warn(
-                        'Searching for nearby files in a folder path is '
-                        'deprecated and will be removed in future versions.',
-                        category=DeprecationWarning)
-                    # list elementes with the ending .bin
-                    bin_files = [f for f in os.listdir(
-                        pwd) if f.endswith(".bin")]
-                    if len(bin_files) == 1:
-                        path_to_model = os.path.join(pwd, bin_files[0])
-                    else:
-                        warnings.warn("Found more than one .bin file. "
-                                      "or none. Please specify the path to the model "
-                                      "or setup a huggingface token.")
-                        raise FileNotFoundError
-
-                warnings.warn(
-                    f"Found model at {path_to_model} overwriting config file.")
-
-                config['pipeline']['params']['segmentation'] = path_to_model
-
-                with open(model, 'w') as file:
-                    yaml.dump(config, file)
+            Diariser: A Diariser wrapping the loaded pyannote.audio Pipeline.
+        """
+        # pyannote.audio takes seconds to import, so it is only imported to load a model
+        from pyannote.audio import Pipeline
+
+        source = dict(model=model, cache_dir=cache_dir, hparams_file=hparams_file)
+
+        if isinstance(model, (str, Path)) and os.path.exists(model):
+            model = str(model)
+            with cls._resolved_config(model) as config_file:
+                _model = cls._from_pretrained(config_file, hparams_file, use_auth_token,
+                                              cache_dir, offline)
         elif isinstance(model, tuple):
-            try:
-                _model = model[0]
-                HfApi().model_info(_model)
-                model = _model
-                use_auth_token = None
-            except RepositoryNotFoundError:
-                print(f'{model[0]} not found on Huggingface, \
-                      trying {model[1]}')
-                _model = model[1]
-                HfApi().model_info(_model)
-                model = _model
-                if cache_token and use_auth_token is not None:
-                    cls._save_token(use_auth_token)
-
-                if use_auth_token is None:
-                    use_auth_token = cls._get_token()
+            repo_id, config_file = cls.resolve_cached(model, cache_dir)
+            _model = None
+            if config_file is not None:
+                # a model the cached config references may still have to be downloaded
+                _model = cls._from_pretrained(config_file, hparams_file, use_auth_token,
+                                              cache_dir, offline)
+            if _model is None and offline:
+                raise FileNotFoundError(
+                    f"None of {', '.join(model)} is in the cache at {cache_dir} "
+                    "and offline mode is enabled. Load the model once with network "
+                    "access or pass the path to a config file.")
+
+            # the first repository is public, the others may need a token
+            for i, _repo_id in enumerate(model if _model is None else ()):
+                token = None
+                if i > 0:
+                    if cache_token and use_auth_token is not None:
+                        cls._save_token(use_auth_token)
+                    token = use_auth_token if use_auth_token is not None else cls._get_token()
+                _model = Pipeline.from_pretrained(_repo_id, use_auth_token=token,
+                                                  cache_dir=cache_dir,
+                                                  hparams_file=hparams_file)
+                if _model is not None:
+                    repo_id = _repo_id
+                    cls._update_manifest(model, repo_id, cache_dir)
+                    break
+                print(f'{_repo_id} not found on Huggingface'
+                      + (f', trying {model[i + 1]}' if i + 1 < len(model) else ''))
+            model = repo_id
         else:
             raise FileNotFoundError(
                 f'No local model or directory found at {model}.')
 
-        _model = Pipeline.from_pretrained(model,
-                                          use_auth_token=use_auth_token,
-                                          cache_dir=cache_dir,
-                                          hparams_file=hparams_file,)
         if _model is None:
             raise ValueError('Unable to load model either from local cache'
                              'or from huggingface.co models. Please check your token'
@@ -285,7 +394,281 @@ class Diariser:
         # torch_device is renamed from torch.device to avoid name conflict
         _model = _model.to(torch_device(device))
 
-        return cls(_model)
+        return cls(_model, model_name=str(model), source=source)
+
+    @classmethod
+    def describe(cls, model: Union[str, Path, tuple] = PYANNOTE_DEFAULT_CONFIG,
+                 cache_dir: Union[Path, str] = PYANNOTE_DEFAULT_PATH,
+                 hparams_file: Union[str, Path] = None) -> dict:
+        """
+        Describes a model given like to `load_model` without loading it, e.g. to tell
+        cached diarisations apart before the pipeline is needed. Repositories are
+        resolved from the manifest and the cache only, without network access.
+
+        Args:
+            model (Union[str, Path, tuple], optional): Path of a config file or repository
+                        identifiers in order of preference. Defaults to PYANNOTE_DEFAULT_CONFIG.
+            cache_dir (Union[Path, str], optional): Directory for caching models.
+                                                    Defaults to PYANNOTE_DEFAULT_PATH.
+            hparams_file (Union[str, Path], optional): Path to a YAML file containing
+                                                       hyperparameters. Defaults to None.
+
+        Returns:
+            dict: The model name, the resolved repository if it is cached, and
+                    digests of the config file and the hyperparameter file.
+        """
+        config_file = None
+        if isinstance(model, tuple):
+            repo_id, config_file = cls.resolve_cached(model, cache_dir)
+            model_name = repo_id or cls._manifest_key(model)
+        else:
+            model_name = config_file = str(model)
+
+        return {"model_name": model_name,
+                "config": cls._file_digest(config_file),
+                "hparams": cls._file_digest(hparams_file)}
+
+    @staticmethod
+    def _file_digest(path: Optional[Union[str, Path]]) -> Optional[str]:
+        """
+        Digest of the content of a file, or None if there is no such file.
+        """
+        if path is None or not os.path.isfile(path):
+            return None
+
+        digest = blake2b(digest_size=16)
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+
+        return digest.hexdigest()
+
+    @classmethod
+    def resolve_cached(cls, model: tuple,
+                       cache_dir: Union[Path, str] = PYANNOTE_DEFAULT_PATH) -> tuple:
+        """
+        Finds the first of several repositories that is available locally, without
+        network access. The manifest of models resolved before is checked first,
+        then the Hugging Face cache.
+
+        Args:
+            model (tuple): Repository identifiers in order of preference.
+            cache_dir (Union[Path, str], optional): Directory for caching models.
+                                                    Defaults to PYANNOTE_DEFAULT_PATH.
+
+        Returns:
+            tuple: The repository identifier and the path of its cached config file,
+                    or None and None.
+        """
+        from huggingface_hub import try_to_load_from_cache
+
+        entry = cls._read_manifest(cache_dir).get(cls._manifest_key(model))
+        if entry is not None and os.path.isfile(entry["config"]):
+            return entry["repo_id"], entry["config"]
+
+        for repo_id in model:
+            config_file = try_to_load_from_cache(repo_id, PIPELINE_CONFIG_NAME,
+                                                 cache_dir=str(cache_dir))
+            if isinstance(config_file, str):
+                return repo_id, config_file
+
+        return None, None
+
+    @classmethod
+    def _from_pretrained(cls, config_file: str, hparams_file: Union[str, Path],
+                         use_auth_token: Optional[str], cache_dir: Union[Path, str],
+                         offline: bool):
+        """
+        Loads a pipeline from a local config file without network access, so the
+        models it references are taken from the cache. Unless offline, it is
+        loaded again with network access if a referenced model is not cached.
+
+        Returns:
+            Optional[Pipeline]: The pipeline, or None if it could not be loaded.
+        """
+        from pyannote.audio import Pipeline
+
+        try:
+            with cls._hub_offline():
+                return Pipeline.from_pretrained(config_file, use_auth_token=use_auth_token,
+                                                cache_dir=cache_dir, hparams_file=hparams_file)
+        except (OSError, ValueError) as error:
+            if offline:
+                raise FileNotFoundError(
+                    f"A model referenced by {config_file} is not in the cache "
+                    "and offline mode is enabled.") from error
+
+        warnings.warn(f"A model referenced by {config_file} is not cached, downloading it.")
+        return Pipeline.from_pretrained(config_file, use_auth_token=use_auth_token,
+                                        cache_dir=cache_dir, hparams_file=hparams_file)
+
+    @staticmethod
+    @contextmanager
+    def _hub_offline() -> Iterator[None]:
+        """
+        Disables requests to the Hugging Face Hub, files are only read from the cache.
+        This is a process-wide setting of huggingface_hub, it is restored on exit.
+        """
+        from huggingface_hub import constants
+        from huggingface_hub.utils import reset_sessions
+
+        offline = constants.HF_HUB_OFFLINE
+        constants.HF_HUB_OFFLINE = True
+        # the HTTP sessions are cached with the setting they were created with
+        reset_sessions()
+        try:
+            yield
+        finally:
+            constants.HF_HUB_OFFLINE = offline
+            reset_sessions()
+
+    @staticmethod
+    @contextmanager
+    def _resolved_config(config_file: str) -> Iterator[str]:
+        """
+        Resolves the segmentation model of a config file. If it is not found at the
+        configured path, it is searched nearby the config file, and a resolved copy
+        of the config is used for loading. The config file itself is never changed.
+
+        Args:
+            config_file (str): Path to the config file.
+
+        Yields:
+            str: Path of the config file to load.
+
+        Raises:
+            FileNotFoundError: If the segmentation model is not found.
+        """
+        with open(config_file, 'r') as file:
+            config = yaml.safe_load(file)
+
+        path_to_model = config['pipeline']['params']['segmentation']
+
+        if os.path.exists(path_to_model):
+            yield config_file
+            return
+
+        warnings.warn(f"Model not found at {path_to_model}. "
+                      "Trying to find it nearby the config file.")
+
+        pwd = os.path.dirname(os.path.abspath(config_file))
+        path_to_model = os.path.join(pwd, "pytorch_model.bin")
+
+        if not os.path.exists(path_to_model):
+            warnings.warn(f"Model not found at {path_to_model}. "
+                          "Trying to find it nearby .bin files instead.")
+            warnings.warn(
+                'Searching for nearby files in a folder path is '
+                'deprecated and will be removed in future versions.',
+                category=DeprecationWarning)
+            # list elementes with the ending .bin
+            bin_files = [f for f in os.listdir(pwd) if f.endswith(".bin")]
+            if len(bin_files) == 1:
+                path_to_model = os.path.join(pwd, bin_files[0])
+            else:
+                warnings.warn("Found more than one .bin file. "
+                              "or none. Please specify the path to the model "
+                              "or setup a huggingface token.")
+                raise FileNotFoundError(
+                    f"Segmentation model of {config_file} not found.")
+
+        warnings.warn(f"Found model at {path_to_model}, "
+                      f"consider updating the config file {config_file}.")
+
+        config['pipeline']['params']['segmentation'] = path_to_model
+
+        fd, resolved = mkstemp(suffix=".yaml")
+        try:
+            with os.fdopen(fd, 'w') as file:
+                yaml.safe_dump(config, file)
+            yield resolved
+        finally:
+            os.remove(resolved)
+
+    @staticmethod
+    def _manifest_key(model: tuple) -> str:
+        return "|".join(model)
+
+    @staticmethod
+    def _read_manifest(cache_dir: Union[Path, str]) -> dict:
+        """
+        Reads the manifest of models resolved before, an empty dict if there is none.
+        """
+        try:
+            with open(os.path.join(cache_dir, MANIFEST_NAME), 'r', encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _update_manifest(cls, model: tuple, repo_id: str,
+                         cache_dir: Union[Path, str]) -> None:
+        """
+        Records the repository and cached config file a tuple of repositories
+        resolved to, so the next load finds it without network access.
+        """
+        from huggingface_hub import try_to_load_from_cache
+
+        config_file = try_to_load_from_cache(repo_id, PIPELINE_CONFIG_NAME,
+                                             cache_dir=str(cache_dir))
+        if not isinstance(config_file, str):
+            return
+
+        manifest = cls._read_manifest(cache_dir)
+        manifest[cls._manifest_key(model)] = {"repo_id": repo_id, "config": config_file}
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding="utf-8") as file:
+                json.dump(manifest, file, indent=2)
+            os.replace(tmp_path, os.path.join(cache_dir, MANIFEST_NAME))
+        except OSError as error:
+            warnings.warn(f"Could not update the model manifest in {cache_dir}: {error}")
+
+    def to(self, device: Union[str, torch_device]) -> 'Diariser':
+        """
+        Move the pipeline to a device, e.g. to the CPU while it is not used.
+
+        Args:
+            device (Union[str, torch.device]): The device to move the pipeline to.
+
+        Returns:
+            Diariser: The diariser itself.
+        """
+        self.model.to(torch_device(device))
+
+        return self
+
+    def config(self) -> dict:
+        """
+        Describes the model, e.g. to tell cached diarisations apart.
+
+        A model loaded by name is described by its files, see `describe`, so the
+        description is the same before and after the pipeline is loaded. Other
+        models are described by the instantiated hyperparameters of the pipeline.
+
+        Returns:
+            dict: The description of the model.
+        """
+        if self.source is not None:
+            return self.describe(**self.source)
+
+        if self.model is not None:
+            self._params = self._pipeline_params(self.model)
+
+        return {"model_name": self.model_name, "params": self._params}
+
+    @staticmethod
+    def _pipeline_params(model) -> Optional[dict]:
+        """
+        The instantiated hyperparameters of a pipeline, or None if there are none.
+        """
+        if model is None:
+            return None
+        try:
+            return model.parameters(instantiated=True)
+        except Exception:
+            return None
 
     @staticmethod
     def _get_diarisation_kwargs(**kwargs) -> dict:
@@ -298,6 +681,8 @@ class Diariser:
         Returns:
             dict: A dictionary containing the validated keyword arguments.
         """
+        from pyannote.audio.pipelines.speaker_diarization import SpeakerDiarization
+
         _possible_kwargs = SpeakerDiarization.apply.__code__.co_varnames
 
         diarisation_kwargs = {k: v for k,
@@ -305,5 +690,157 @@ class Diariser:
 
         return diarisation_kwargs
 
+    @staticmethod
+    def _get_window_kwargs(**kwargs) -> dict:
+        """
+        Extracts the keyword arguments of the windowed diarisation, see WINDOW_KWARGS.
+
+        Returns:
+            dict: The given WINDOW_KWARGS that are not None.
+        """
+        return {k: v for k, v in kwargs.items() if k in WINDOW_KWARGS and v is not None}
+
     def __repr__(self):
         return f"Diarisation(model={self.model})"
+
+
+class SpeakerStitcher:
+    """
+    Reconciles the speakers of consecutive diarisation windows.
+
+    Every window yields its own speakers with a centroid embedding each. A speaker
+    of a window is assigned to the known speaker with the closest centroid, if their
+    cosine distance is at most the threshold, otherwise it is a new speaker. Speakers
+    of the same window are never assigned to the same known speaker. The centroid of
+    a known speaker is the mean of its window centroids, weighted by speech duration.
+
+    Attributes:
+        threshold (float): Cosine distance up to which two speakers are the same.
+        centroids (list): Unit centroid of each known speaker, None without embedding.
+        durations (list): Speech duration in seconds of each known speaker.
+    """
+
+    def __init__(self, threshold: float = SPEAKER_THRESHOLD) -> None:
+        """
+        Initialize the SpeakerStitcher.
+
+        Args:
+            threshold (float, optional): Cosine distance up to which two speakers
+                                         are the same. Defaults to SPEAKER_THRESHOLD.
+        """
+        self.threshold = threshold
+        self.centroids: list = []
+        self.durations: list = []
+
+    def assign(self, centroids: np.ndarray, durations: list) -> list:
+        """
+        Assigns the speakers of a window to known or new speakers.
+
+        Args:
+            centroids (np.ndarray): Centroid embedding of each speaker of the window,
+                                    of shape (speakers, dimension). Rows of zeros or
+                                    without dimension mark speakers without embedding.
+            durations (list): Speech duration of each speaker of the window in seconds.
+
+        Returns:
+            list: The index of the known speaker of each speaker of the window.
+        """
+        if not durations:
+            return []
+
+        centroids = self._normalize(np.asarray(centroids, dtype=np.float64)
+                                    .reshape(len(durations), -1))
+        valid = [centroid.size > 0 and not np.isnan(centroid).any() for centroid in centroids]
+        rows = [row for row in range(len(durations)) if valid[row]]
+        known = [i for i, centroid in enumerate(self.centroids) if centroid is not None]
+        assigned = [None] * len(durations)
+
+        if rows and known:
+            distance = 1 - centroids[rows] @ np.stack([self.centroids[i] for i in known]).T
+            # closest pairs first, each known speaker at most once per window
+            taken = set()
+            for row, col in zip(*np.unravel_index(np.argsort(distance, axis=None),
+                                                  distance.shape)):
+                if distance[row, col] > self.threshold:
+                    break
+                if assigned[rows[row]] is None and col not in taken:
+                    assigned[rows[row]] = known[col]
+                    taken.add(col)
+
+        for row, duration in enumerate(durations):
+            centroid = centroids[row] if valid[row] else None
+            if assigned[row] is None:
+                assigned[row] = len(self.centroids)
+                self.centroids.append(centroid)
+                self.durations.append(duration)
+            else:
+                self._update(assigned[row], centroid, duration)
+
+        return assigned
+
+    def merge(self, max_speakers: int) -> dict:
+        """
+        Merges the closest speakers until at most `max_speakers` remain.
+
+        Args:
+            max_speakers (int): The maximum number of speakers.
+
+        Returns:
+            dict: The speaker each merged speaker was merged into.
+        """
+        merged = {}
+        alive = [i for i, centroid in enumerate(self.centroids) if centroid is not None]
+
+        while len(self.centroids) - len(merged) > max_speakers and len(alive) > 1:
+            stacked = np.stack([self.centroids[i] for i in alive])
+            distance = 1 - stacked @ stacked.T
+            np.fill_diagonal(distance, np.inf)
+            row, col = np.unravel_index(np.argmin(distance), distance.shape)
+            # keep the speaker with more speech
+            keep, drop = sorted((alive[row], alive[col]), key=lambda i: -self.durations[i])
+            self._update(keep, self.centroids[drop], self.durations[drop])
+            merged[drop] = keep
+            alive.remove(drop)
+
+        # speakers merged into a speaker that was merged later
+        for drop in merged:
+            while merged[drop] in merged:
+                merged[drop] = merged[merged[drop]]
+
+        return merged
+
+    def names(self, merged: dict = None) -> dict:
+        """
+        Names the speakers SPEAKER_00, SPEAKER_01, ... in order of their first window.
+
+        Args:
+            merged (dict, optional): The result of `merge`. Defaults to None.
+
+        Returns:
+            dict: The name of each speaker that was not merged.
+        """
+        merged = merged or {}
+        speakers = [i for i in range(len(self.centroids)) if i not in merged]
+        return {speaker: f"SPEAKER_{i:02d}" for i, speaker in enumerate(speakers)}
+
+    def _update(self, speaker: int, centroid: Optional[np.ndarray], duration: float) -> None:
+        """
+        Adds the centroid of a window to a known speaker.
+        """
+        total = self.durations[speaker] + duration
+        if centroid is not None and self.centroids[speaker] is not None and total > 0:
+            mean = (self.durations[speaker] * self.centroids[speaker]
+                    + duration * centroid) / total
+            self.centroids[speaker] = self._normalize(mean[None])[0]
+        elif centroid is not None:
+            self.centroids[speaker] = centroid
+        self.durations[speaker] = total
+
+    @staticmethod
+    def _normalize(centroids: np.ndarray) -> np.ndarray:
+        """
+        Scales centroids to unit length, centroids of zero length become NaN.
+        """
+        norms = np.linalg.norm(centroids, axis=-1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(norms > 0, centroids / norms, np.nan)
@@ -0,0 +1,140 @@
+"""
+Disk Cache Module
+=================
+
+This module provides the DiskCache class, the on-disk storage shared by the caches
+of ScrAIbe, e.g. the cache of decoded audio and the cache of results. Each entry is
+one file in the cache directory, named by its key.
+
+Entries are written to a temporary file first and then moved into place, so
+concurrent readers never see a partially written entry. Reading an entry marks
+it as recently used, and the least recently used entries are evicted once the
+entries exceed the size budget.
+
+Available Classes:
+- DiskCache: Atomic writes, LRU eviction and clearing of the files of a cache.
+
+Usage:
+    from .disk_cache import DiskCache
+
+    class TextCache(DiskCache):
+        suffix = ".txt"
+
+    cache = TextCache("/tmp/text_cache", max_bytes=1 << 20)
+    cache.write(cache.path(key), lambda f: f.write(text), mode="w")
+    cache.evict()
+"""
+
+import os
+from contextlib import suppress
+from tempfile import mkstemp
+from typing import IO, Callable
+
+
+class DiskCache:
+    """
+    Stores the entries of a cache as files of a directory, within a size budget.
+
+    Subclasses set the file `suffix` of their entries and serialise the entries
+    themselves, through `write` and `path`.
+
+    Attributes:
+        suffix (str): File suffix of the entries, e.g. ".npy".
+        cache_dir (str): Directory holding the entries.
+        max_bytes (int): Size budget of the cache in bytes.
+    """
+
+    suffix = ""
+
+    def __init__(self, cache_dir: str, max_bytes: int) -> None:
+        """
+        Initialize the DiskCache object.
+
+        Args:
+            cache_dir (str): Directory holding the entries.
+            max_bytes (int): Size budget of the cache in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        """
+        The path of the entry of a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str: The path of the entry.
+        """
+        return os.path.join(self.cache_dir, f"{key}{self.suffix}")
+
+    def write(self, path: str, write: Callable[[IO], None], mode: str = "wb") -> None:
+        """
+        Writes an entry atomically: it is written to a temporary file first and
+        then moved to `path`, so concurrent readers never see a partially written
+        entry. Call `evict` afterwards, e.g. once the entry is memory-mapped.
+
+        Args:
+            path (str): The path of the entry, see `path`.
+            write (Callable[[IO], None]): Writes the entry to an open file.
+            mode (str, optional): Mode the file is opened with. Defaults to "wb".
+        """
+        fd, tmp_path = mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode, **({} if "b" in mode else {"encoding": "utf-8"})) as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            # do not hide the original error if the temporary file is already gone
+            with suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def touch(path: str) -> None:
+        """
+        Marks an entry as recently used for eviction.
+
+        Args:
+            path (str): The path of the entry.
+        """
+        os.utime(path)
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits its size budget.
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self.suffix):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(self.suffix):
+                with suppress(FileNotFoundError):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(cache_dir={self.cache_dir}, max_bytes={self.max_bytes})"
@@ -0,0 +1,194 @@
+"""
+Instrumentation Module
+======================
+
+This module provides hooks to measure where time goes in a Scraibe run.
+Scraibe reports every stage it runs, e.g. decoding, diarisation, each call
+to the transcriber and the construction of the Transcript, to its observers.
+
+An observer is any callable taking the name of the stage, the wall time and CPU
+time in seconds and the seconds of audio processed. TimingCollector is a built-in
+observer that aggregates these per stage and computes real-time factors.
+
+Without observers, stages are not timed at all.
+
+Available Classes:
+- StageObserver: Base class of observers.
+- TimingCollector: Aggregates wall time, CPU time and audio seconds per stage.
+- StageTimer: Context manager that times a stage and reports it to observers.
+
+Usage:
+    from scraibe import Scraibe, TimingCollector
+
+    timings = TimingCollector()
+    model = Scraibe(observers=[timings])
+    model.autotranscribe("path/to/audiofile.wav")
+    print(timings.to_json())
+
+Constants:
+- STAGES (tuple): Names of the stages reported by Scraibe.
+"""
+
+import json
+from threading import Lock
+from time import perf_counter, process_time
+from typing import Callable, Iterable, Optional
+
+STAGES = ("load_audio", "vad", "diarization", "language_detection",
+          "transcribe", "transcribe_batch", "transcribe_words", "transcribe_words_batch",
+          "transcript")
+
+
+class StageObserver:
+    """
+    Base class of observers of Scraibe stages. Subclasses implement `on_stage`,
+    plain functions with the same signature can be used as observers as well.
+    """
+
+    def on_stage(self, stage: str, wall_time: float, cpu_time: float,
+                 audio_seconds: float) -> None:
+        """
+        Called when a stage is finished.
+
+        Args:
+            stage (str): Name of the stage, one of STAGES.
+            wall_time (float): Elapsed wall time in seconds.
+            cpu_time (float): CPU time of the process in seconds, summed over all threads.
+            audio_seconds (float): Seconds of audio processed by the stage.
+        """
+        pass
+
+    def __call__(self, stage: str, wall_time: float, cpu_time: float,
+                 audio_seconds: float) -> None:
+        self.on_stage(stage, wall_time, cpu_time, audio_seconds)
+
+
+class TimingCollector(StageObserver):
+    """
+    Observer that aggregates the timings of each stage.
+
+    The collector can be shared between threads, e.g. by the async API.
+
+    Attributes:
+        stages (dict): Number of calls, wall time, CPU time and audio seconds per stage.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the TimingCollector.
+        """
+        self.stages: dict = {}
+        self._lock = Lock()
+
+    def on_stage(self, stage: str, wall_time: float, cpu_time: float,
+                 audio_seconds: float) -> None:
+        with self._lock:
+            totals = self.stages.setdefault(
+                stage, {"calls": 0, "wall_time": 0.0, "cpu_time": 0.0, "audio_seconds": 0.0})
+            totals["calls"] += 1
+            totals["wall_time"] += wall_time
+            totals["cpu_time"] += cpu_time
+            totals["audio_seconds"] += audio_seconds
+
+    def to_dict(self) -> dict:
+        """
+        Get the timings of each stage with its real-time factor, the wall time
+        divided by the seconds of audio, which is None for stages without audio.
+
+        Returns:
+            dict: The timings per stage in the order the stages first ran.
+        """
+        with self._lock:
+            return {stage: {**totals,
+                            "rtf": (totals["wall_time"] / totals["audio_seconds"]
+                                    if totals["audio_seconds"] else None)}
+                    for stage, totals in self.stages.items()}
+
+    def to_json(self, path: Optional[str] = None, **kwargs) -> str:
+        """
+        Get the timings as JSON and optionally save them to a file.
+
+        Args:
+            path (Optional[str], optional): Path of the JSON file. Defaults to None.
+            **kwargs: Keyword arguments for `json.dumps`.
+
+        Returns:
+            str: The timings as JSON string.
+        """
+        if "indent" not in kwargs:
+            kwargs["indent"] = 2
+
+        timings = json.dumps(self.to_dict(), **kwargs)
+
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(timings)
+
+        return timings
+
+    def merge(self, timings: dict) -> None:
+        """
+        Adds timings from another collector, e.g. of a worker process.
+
+        Args:
+            timings (dict): Timings as returned by `to_dict`.
+        """
+        with self._lock:
+            for stage, other in timings.items():
+                totals = self.stages.setdefault(
+                    stage, {"calls": 0, "wall_time": 0.0, "cpu_time": 0.0, "audio_seconds": 0.0})
+                for name in totals:
+                    totals[name] += other[name]
+
+    def reset(self) -> None:
+        """
+        Remove all collected timings.
+        """
+        with self._lock:
+            self.stages = {}
+
+    def __repr__(self) -> str:
+        return f"TimingCollector(stages={list(self.stages)})"
+
+
+class StageTimer:
+    """
+    Context manager that times a stage and reports it to the observers on exit.
+
+    The seconds of audio can be set inside the block, e.g. once the audio is loaded.
+    A timer without observers does nothing.
+    """
+
+    __slots__ = ("stage", "audio_seconds", "observers", "_wall", "_cpu")
+
+    def __init__(self, stage: str, audio_seconds: float = 0.0,
+                 observers: Iterable[Callable] = ()) -> None:
+        """
+        Initialize the StageTimer.
+
+        Args:
+            stage (str): Name of the stage.
+            audio_seconds (float, optional): Seconds of audio processed. Defaults to 0.0.
+            observers (Iterable[Callable], optional): Observers to report to.
+        """
+        self.stage = stage
+        self.audio_seconds = audio_seconds
+        self.observers = observers
+
+    def __enter__(self) -> "StageTimer":
+        if self.observers:
+            self._wall = perf_counter()
+            self._cpu = process_time()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        if self.observers:
+            wall_time = perf_counter() - self._wall
+            cpu_time = process_time() - self._cpu
+            for observer in self.observers:
+                observer(self.stage, wall_time, cpu_time, self.audio_seconds)
+        return False
+
+
+# shared timer used when there are no observers
+NULL_TIMER = StageTimer("")
@@ -0,0 +1,180 @@
+"""
+Journal Module
+==============
+
+This module provides the Journal class, an append-only JSONL file that records
+the progress of a long `Scraibe.autotranscribe` run. The diarisation, the detected
+language and each finished segment are written as soon as they are available,
+so a run that crashed or was pre-empted can continue where it stopped.
+
+Each journal starts with a header holding a key of the input audio and the
+settings of the run. A journal with a different key belongs to another run
+and is started over.
+
+Available Classes:
+- Journal: Records and restores the progress of a transcription.
+
+Usage:
+    from .journal import Journal
+
+    journal = Journal("path/to/output.journal.jsonl")
+    state = journal.resume(key)
+    journal.write("segment", id=0, text=" Hello.")
+"""
+
+import json
+import os
+from hashlib import blake2b
+
+import numpy as np
+import torch
+
+
+class Journal:
+    """
+    Append-only JSONL journal of a transcription run.
+
+    Every record is a JSON object with a "type" field: "header", "diarisation",
+    "language" or "segment". Records are flushed and synced to disk as they are
+    written. A line that was cut off by a crash is ignored when the journal is read.
+
+    Attributes:
+        path (str): Path of the journal file.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the Journal.
+
+        Args:
+            path (str): Path of the journal file. It is created if it does not exist.
+        """
+        self.path = path
+        self._file = None
+
+    @staticmethod
+    def key(waveform: torch.Tensor, **settings) -> str:
+        """
+        Key of a run, from the audio and the settings that affect the result.
+
+        Args:
+            waveform (torch.Tensor): The audio of the run.
+            **settings: Settings of the run. Values that are not JSON serializable
+                        are represented by their `str`.
+
+        Returns:
+            str: A hex digest of the audio and the settings.
+        """
+        digest = blake2b(digest_size=16)
+        # hash the samples in place, tobytes would copy the whole waveform
+        digest.update(memoryview(np.ascontiguousarray(waveform.cpu().numpy())))
+        digest.update(json.dumps(settings, sort_keys=True, default=str).encode())
+
+        return digest.hexdigest()
+
+    def resume(self, key: str) -> dict:
+        """
+        Reads the progress of a previous run with the same key and opens
+        the journal for appending. A journal of another run is started over.
+
+        Args:
+            key (str): Key of the run, see `Journal.key`.
+
+        Returns:
+            dict: The "diarisation" and "language" of the previous run or None,
+                    and its finished "segments" as a dict of segment id to text.
+        """
+        state = {"diarisation": None, "language": None, "segments": {}}
+        records = self._read()
+
+        if records and records[0].get("type") == "header" and records[0].get("key") == key:
+            for record in records[1:]:
+                if record.get("type") == "diarisation":
+                    state["diarisation"] = {"segments": record["segments"],
+                                            "speakers": record["speakers"]}
+                elif record.get("type") == "language":
+                    state["language"] = record["language"]
+                elif record.get("type") == "segment":
+                    state["segments"][record["id"]] = record["text"]
+
+            self._open("a")
+        else:
+            self._open("w")
+            self.write("header", key=key)
+
+        return state
+
+    def write(self, type: str, **record) -> None:
+        """
+        Appends a record to the journal and syncs it to disk.
+
+        Args:
+            type (str): Type of the record.
+            **record: Fields of the record.
+        """
+        if self._file is None:
+            self._open("a")
+
+        self._file.write(json.dumps({"type": type, **record}) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """
+        Closes the journal file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """
+        Closes and deletes the journal file, e.g. once the output is saved.
+        """
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _open(self, mode: str) -> None:
+        self.close()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, mode, encoding="utf-8")
+
+    def _read(self) -> list:
+        """
+        Reads all complete records of the journal, and cuts off an incomplete
+        last line, so records can be appended again.
+
+        Returns:
+            list: The records in the order they were written.
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        records, valid = [], 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete line")
+                    records.append(json.loads(line))
+                except ValueError:
+                    # the last line of a crashed run may be incomplete
+                    break
+                valid += len(line)
+
+        if valid < os.path.getsize(self.path):
+            os.truncate(self.path, valid)
+
+        return records
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"Journal(path={self.path})"
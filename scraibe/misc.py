@@ -2,8 +2,6 @@ import os
 import yaml
 from argparse import Action
 from ast import literal_eval
-from torch.cuda import is_available
-from torch import get_num_threads, set_num_threads
 
 CACHE_DIR = os.getenv(
     "AUTOT_CACHE",
@@ -20,9 +18,54 @@ PYANNOTE_DEFAULT_CONFIG = os.path.join(PYANNOTE_DEFAULT_PATH, "config.yaml") \
     if os.path.exists(os.path.join(PYANNOTE_DEFAULT_PATH, "config.yaml")) \
     else ('Jaikinator/ScrAIbe', 'pyannote/speaker-diarization-3.1')
 
-SCRAIBE_TORCH_DEVICE =  os.getenv("SCRAIBE_TORCH_DEVICE", "cuda" if is_available() else "cpu")
+AUDIO_CACHE_DIR = os.getenv(
+    "SCRAIBE_AUDIO_CACHE_DIR",
+    os.path.join(CACHE_DIR, "audio"),
+)
+AUDIO_CACHE_MAX_BYTES = int(os.getenv("SCRAIBE_AUDIO_CACHE_SIZE", 10 * 1024 ** 3))
+
+RESULT_CACHE_DIR = os.getenv(
+    "SCRAIBE_RESULT_CACHE_DIR",
+    os.path.join(CACHE_DIR, "results"),
+)
+RESULT_CACHE_MAX_BYTES = int(os.getenv("SCRAIBE_RESULT_CACHE_SIZE", 1024 ** 3))
+
+# sliding window diarisation: overlap of the windows in seconds, and the cosine
+# distance up to which speakers of different windows are the same speaker,
+# close to the clustering threshold of pyannote/speaker-diarization-3.1
+DIARISATION_OVERLAP = 30.0
+SPEAKER_THRESHOLD = 0.7
+
+# never access the network to resolve models, also set by the Hugging Face variable
+SCRAIBE_OFFLINE = (os.getenv("SCRAIBE_OFFLINE") or os.getenv("HF_HUB_OFFLINE") or "0") \
+    .lower() in ("1", "true", "yes", "on")
+
+# memory budget of loaded models without references, 0 keeps only models in use
+MODEL_REGISTRY_MAX_BYTES = int(os.getenv("SCRAIBE_MODEL_REGISTRY_SIZE", 0))
+
+
+def __getattr__(name: str):
+    """
+    Resolves SCRAIBE_TORCH_DEVICE and SCRAIBE_NUM_THREADS on first access,
+    so importing this module does not import torch.
+    """
+    if name == "SCRAIBE_TORCH_DEVICE":
+        value = os.getenv("SCRAIBE_TORCH_DEVICE")
+        if value is None:
+            from torch.cuda import is_available
+            value = "cuda" if is_available() else "cpu"
+    elif name == "SCRAIBE_NUM_THREADS":
+        value = os.getenv("SCRAIBE_NUM_THREADS")
+        if value is None:
+            from torch import get_num_threads
+            value = min(8, get_num_threads())
+        value = int(value)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
 
-SCRAIBE_NUM_THREADS = os.getenv("SCRAIBE_NUM_THREADS", min(8, get_num_threads()))
 
 def config_diarization_yaml(file_path: str, path_to_segmentation: str = None) -> None:
     """Configure diarization pipeline from a YAML file.
@@ -62,6 +105,7 @@ def set_threads(parse_threads=None,
         elif parse_threads < 1:
             raise ValueError(f"Number of threads must be a positive integer, {parse_threads} was given")
         else:
+            from torch import set_num_threads
             set_num_threads(parse_threads)
             SCRAIBE_NUM_THREADS = parse_threads
     elif yaml_threads is not None:
@@ -70,6 +114,7 @@ def set_threads(parse_threads=None,
         elif yaml_threads < 1:
             raise ValueError(f"Number of threads must be a positive integer, {yaml_threads} was given")
         else:
+            from torch import set_num_threads
             set_num_threads(yaml_threads)
             SCRAIBE_NUM_THREADS = yaml_threads
 
@@ -0,0 +1,439 @@
+"""
+Model Placement Module
+======================
+
+This module provides the ModelPlacement class, which decides where the models of
+Scraibe live while `autotranscribe` runs. The diariser and the transcriber are used
+strictly one after the other, so keeping both resident on the device is only
+needed for speed. With an offload policy, only the model of the running stage is
+kept on the device:
+
+- "none": Both models stay resident on the device, the default.
+- "cpu": The idle model is moved to the CPU. This frees GPU memory, but does
+         not reduce the resident memory of the process.
+- "unload": The idle model is released and loaded again when its next stage
+            starts. The transcriber is not loaded before the first transcription.
+            This lowers the peak memory on CPU nodes at the cost of reloading the
+            models for every file.
+
+Models that can be unloaded are registered as a LazyModel, which stands in for
+the loaded model wrapper. Models registered without weights are loaded by the
+first stage that uses them, whatever the policy, so Scraibe only loads the models
+a run actually needs. With
+memory tracking, the peak resident memory of every stage is measured, so the
+trade-off is visible.
+
+Available Classes:
+- LazyModel: Stands in for a model wrapper that is loaded on first use and may
+             be unloaded again.
+- ModelPlacement: Moves, unloads and reloads the models between stages and
+                  reports the memory of each stage.
+
+Available Functions:
+- current_rss_mb: Current resident memory of the process.
+- peak_rss_mb: Peak resident memory of the process.
+- reset_peak_rss: Resets the peak resident memory where the OS supports it.
+
+Usage:
+    from .placement import ModelPlacement
+
+    placement = ModelPlacement("unload")
+    diariser = LazyModel(Diariser(None, model_name="pyannote"))
+    placement.register("diariser", diariser, loader=load_diariser)
+    placement.activate("diarization")
+    print(placement.report)
+
+Constants:
+- OFFLOAD_POLICIES (tuple): Available offload policies.
+- STAGE_MODELS (dict): The model used by each stage of Scraibe.
+"""
+
+import gc
+import sys
+from contextlib import contextmanager
+from functools import partial
+from inspect import getattr_static
+from threading import RLock
+from typing import Any, Callable, Iterator, Optional
+
+from torch import cuda
+
+from .instrumentation import StageObserver
+from .misc import SCRAIBE_TORCH_DEVICE
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+OFFLOAD_POLICIES = ("none", "cpu", "unload")
+
+STAGE_MODELS = {"diarization": "diariser",
+                "language_detection": "transcriber",
+                "transcribe": "transcriber",
+                "transcribe_batch": "transcriber",
+                "transcribe_words": "transcriber",
+                "transcribe_words_batch": "transcriber"}
+
+
+def current_rss_mb() -> Optional[float]:
+    """
+    Current resident memory of the process in MiB, or None if it cannot be measured.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    return None
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Peak resident memory of the process in MiB since it started or since the
+    last `reset_peak_rss`, or None if it cannot be measured.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def reset_peak_rss() -> bool:
+    """
+    Resets the peak resident memory to the current one. Only supported on Linux.
+
+    Returns:
+        bool: True if the peak was reset, False if `peak_rss_mb` keeps
+                reporting the peak since the start of the process.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+
+    return True
+
+
+class LazyModel:
+    """
+    Stands in for a model wrapper that is loaded on first use and may be unloaded
+    again, e.g. a Transcriber or Diariser given by name.
+
+    Attribute access is forwarded to the loaded wrapper, or, while the weights are
+    not loaded, to the unloaded wrapper. Using `model` or calling a method that needs
+    the weights loads the model through the placement it is registered with, so the
+    wrapper can be used directly, outside of the stages of Scraibe. The placement sets
+    and clears `instance`, so a wrapper shared through a ModelRegistry is used as
+    is, and other references to the LazyModel stay valid across reloads.
+
+    Attributes:
+        instance (Optional[Any]): The loaded model wrapper, or None.
+    """
+
+    # methods of the wrappers that do not need the weights, besides static and class methods
+    WEIGHTLESS_METHODS = ("config",)
+
+    def __init__(self, unloaded: Any) -> None:
+        """
+        Initialize the LazyModel.
+
+        Args:
+            unloaded (Any): A wrapper without weights, of the class of the loaded
+                            wrapper, e.g. `WhisperTranscriber(None, "medium")`.
+        """
+        self._unloaded = unloaded
+        self._load: Optional[Callable[[], None]] = None
+        self.instance: Optional[Any] = None
+
+    @property
+    def __class__(self) -> type:
+        # isinstance checks see the class of the wrapper
+        return type(self._target())
+
+    def _target(self) -> Any:
+        return self.instance if self.instance is not None else self._unloaded
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ("_unloaded", "_load", "instance"):
+            raise AttributeError(name)
+        if self.instance is None:
+            if name == "model":
+                self._ensure_loaded()
+            elif callable(getattr(self._unloaded, name)) and not self._weightless(name):
+                # a method taken before the model is loaded, e.g. by the stage timer
+                # that loads it, is looked up on the loaded wrapper when it is called
+                return partial(self._call, name)
+        return getattr(self._target(), name)
+
+    def _call(self, name: str, *args, **kwargs) -> Any:
+        self._ensure_loaded()
+        return getattr(self._target(), name)(*args, **kwargs)
+
+    def _ensure_loaded(self) -> None:
+        if self.instance is None and self._load is not None:
+            self._load()
+
+    def _weightless(self, name: str) -> bool:
+        method = getattr_static(type(self._unloaded), name, None)
+        return name in self.WEIGHTLESS_METHODS or isinstance(method, (staticmethod, classmethod))
+
+    def __repr__(self) -> str:
+        return f"LazyModel({self._target()!r}, loaded={self.instance is not None})"
+
+
+class ModelPlacement(StageObserver):
+    """
+    Keeps only the model of the running stage on the device, following an offload
+    policy, and records the resident memory of every stage.
+
+    Models are registered by role, "diariser" or "transcriber", together with an
+    optional loader. Models with a loader are registered as a LazyModel, whose
+    loaded wrapper the placement replaces. Models without a loader cannot be
+    reloaded, so they are moved to the CPU instead of being unloaded, which does
+    nothing on a CPU device.
+
+    Attributes:
+        policy (str): The offload policy, one of OFFLOAD_POLICIES.
+        device (str): The device of the active model.
+        models (dict): The registered models by role.
+        track_memory (bool): Whether the peak resident memory of each stage is measured.
+        report (dict): Resident and peak resident memory in MiB after each stage,
+                        and the number of loads of each model.
+    """
+
+    def __init__(self, policy: str = "none",
+                 device: str = SCRAIBE_TORCH_DEVICE,
+                 track_memory: bool = True) -> None:
+        """
+        Initialize the ModelPlacement.
+
+        Args:
+            policy (str, optional): The offload policy, one of OFFLOAD_POLICIES.
+                                    Defaults to "none".
+            device (str, optional): The device of the active model.
+                                    Defaults to SCRAIBE_TORCH_DEVICE.
+            track_memory (bool, optional): Whether the peak resident memory of each
+                                    stage is measured. Defaults to True.
+        """
+        if policy not in OFFLOAD_POLICIES:
+            raise ValueError(f"Unknown offload policy {policy}, "
+                             f"expected one of {OFFLOAD_POLICIES}.")
+
+        self.policy = policy
+        self.device = str(device)
+        self.track_memory = track_memory
+        self.models: dict = {}
+        self.report: dict = {}
+        self._loaders: dict = {}
+        self._releases: dict = {}
+        self._state: dict = {}
+        self._loaded: set = set()
+        self._pinned = 0
+        self._lock = RLock()
+        self.reset_report()
+
+    def register(self, role: str, model, loader: Optional[Callable] = None,
+                 release: Optional[Callable] = None) -> None:
+        """
+        Register the model of a role. A loaded model previously registered for the
+        role is released.
+
+        Args:
+            role (str): The role of the model, "diariser" or "transcriber".
+            model (Union[Transcriber, Diariser, LazyModel]): The model wrapper, a
+                                    LazyModel if it has a loader. It is loaded if it
+                                    has no loader or its `instance` is set.
+            loader (Optional[Callable], optional): Returns the loaded model wrapper,
+                                    which becomes the `instance` of `model`.
+                                    Defaults to None.
+            release (Optional[Callable], optional): Called when the weights are
+                                    unloaded, e.g. to drop a reference in a
+                                    ModelRegistry. Defaults to None.
+        """
+        if loader is not None and not isinstance(model, LazyModel):
+            raise TypeError("Models with a loader must be registered as a LazyModel.")
+        loaded = loader is None or model.instance is not None
+
+        with self._lock:
+            if role in self.models:
+                self.release(role)
+                if isinstance(self.models[role], LazyModel):
+                    self.models[role]._load = None
+            self.models[role] = model
+            if isinstance(model, LazyModel):
+                model._load = partial(self.load, role)
+            self._loaders[role] = loader
+            self._releases[role] = release
+            self._state[role] = "resident" if loaded else "unloaded"
+            if loaded:
+                self._loaded.add(role)
+            else:
+                self._loaded.discard(role)
+
+    def replace(self, role: str, model: LazyModel, loader: Callable,
+                release: Optional[Callable] = None) -> None:
+        """
+        Loads a model and registers it in place of the model of a role. The old
+        model is only released once the new one is loaded, so it is kept if
+        loading fails.
+
+        Args:
+            role (str): The role of the model, "diariser" or "transcriber".
+            model (LazyModel): The new model, see `register`.
+            loader (Callable): Returns the loaded model wrapper.
+            release (Optional[Callable], optional): See `register`. Defaults to None.
+        """
+        with self._lock:
+            model.instance = loader()
+            self.register(role, model, loader, release=release)
+            self.report["loads"][role] = self.report["loads"].get(role, 0) + 1
+
+    def was_loaded(self, role: str) -> bool:
+        """
+        Whether the model of a role was loaded at least once, so the attributes
+        its loader sets, e.g. the hyperparameters of a pipeline, are known.
+
+        Args:
+            role (str): The role of the model.
+
+        Returns:
+            bool: True if the model was registered loaded or was loaded since.
+        """
+        return role in self._loaded
+
+    def activate(self, stage: str) -> None:
+        """
+        Prepares a stage: the idle models are offloaded and the model of the stage
+        is brought to the device, loading it on first use. With memory tracking, the
+        peak resident memory is reset, so the report holds the peak of each stage.
+
+        Args:
+            stage (str): Name of the stage, see `instrumentation.STAGES`.
+        """
+        if self.track_memory:
+            reset_peak_rss()
+        role = STAGE_MODELS.get(stage)
+        if role is None or role not in self.models:
+            return
+
+        with self._lock:
+            if self.policy != "none" and not self._pinned:
+                for other in self.models:
+                    if other != role:
+                        self.offload(other)
+            self.load(role)
+
+    def load(self, role: str) -> None:
+        """
+        Brings a model to the device, loading it if it was unloaded.
+
+        Args:
+            role (str): The role of the model.
+        """
+        with self._lock:
+            state = self._state[role]
+            if state == "unloaded":
+                self.models[role].instance = self._loaders[role]()
+                self._loaded.add(role)
+                self.report["loads"][role] = self.report["loads"].get(role, 0) + 1
+            elif state == "offloaded":
+                self.models[role].to(self.device)
+            self._state[role] = "resident"
+
+    def offload(self, role: str) -> None:
+        """
+        Offloads a model following the policy.
+
+        Args:
+            role (str): The role of the model.
+        """
+        with self._lock:
+            if self._state[role] != "resident":
+                return
+
+            if self.policy == "unload" and self._releases[role] is not None:
+                self.release(role)
+            elif self.policy == "unload" and self._loaders[role] is not None:
+                self.models[role].instance = None
+                self._state[role] = "unloaded"
+                self._free()
+            elif self.device != "cpu":
+                self.models[role].to("cpu")
+                self._state[role] = "offloaded"
+                self._free()
+
+    def release(self, role: str) -> None:
+        """
+        Unloads a model that has a release callback and calls the callback.
+        It is loaded again by the next stage that uses it.
+
+        Args:
+            role (str): The role of the model.
+        """
+        with self._lock:
+            release = self._releases.get(role)
+            if release is None or self._state[role] == "unloaded":
+                return
+            self.models[role].instance = None
+            self._state[role] = "unloaded"
+            release()
+
+    def release_all(self) -> None:
+        """
+        Releases all models that have a release callback, see `release`.
+        """
+        with self._lock:
+            for role in self.models:
+                self.release(role)
+
+    @contextmanager
+    def pinned(self) -> Iterator[None]:
+        """
+        Keeps all models on the device while the models run concurrently,
+        e.g. in the single-pass mode of `autotranscribe`.
+        """
+        with self._lock:
+            self._pinned += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pinned -= 1
+
+    def on_stage(self, stage: str, wall_time: float, cpu_time: float,
+                 audio_seconds: float) -> None:
+        self.report["stages"][stage] = {"rss_mb": current_rss_mb(),
+                                        "peak_rss_mb": peak_rss_mb()}
+        peaks = [report["peak_rss_mb"] for report in self.report["stages"].values()
+                 if report["peak_rss_mb"] is not None]
+        self.report["peak_rss_mb"] = max(peaks) if peaks else None
+
+    def reset_report(self) -> None:
+        """
+        Starts a new report, e.g. for the next file.
+        """
+        self.report = {"policy": self.policy, "peak_rss_mb": None,
+                       "stages": {}, "loads": {}}
+
+    @staticmethod
+    def _free() -> None:
+        gc.collect()
+        if cuda.is_available():
+            cuda.empty_cache()
+
+    def __repr__(self) -> str:
+        return f"ModelPlacement(policy={self.policy}, device={self.device})"
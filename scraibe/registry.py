@@ -0,0 +1,257 @@
+"""
+Model Registry Module
+=====================
+
+This module provides the ModelRegistry class, a process-wide store of loaded
+models. Scraibe instances that use the same model, e.g. the instances of several
+tenants of a service, share one copy of its weights instead of loading their own.
+
+Models are keyed by their kind, name and the settings that change the loaded
+weights, e.g. the device and compute type. Every Scraibe instance holds a reference
+to the models it has loaded. Models without references stay resident while the
+registry is below its memory budget, so a later instance reuses them; the least
+recently used of them are evicted first. Referenced models are never evicted.
+
+Available Classes:
+- ModelRegistry: Shares loaded models between Scraibe instances with reference
+                 counting and LRU eviction under a memory budget.
+
+Usage:
+    from .registry import MODEL_REGISTRY, ModelRegistry
+
+    key = ModelRegistry.key("transcriber", model="medium", device="cpu")
+    transcriber = MODEL_REGISTRY.acquire(key, partial(load_transcriber, "medium"))
+    ...
+    MODEL_REGISTRY.release(key)
+    print(MODEL_REGISTRY.report())
+
+Constants:
+- MODEL_REGISTRY (ModelRegistry): The registry shared by the whole process.
+"""
+
+from collections import Counter, OrderedDict
+from threading import Lock, RLock
+from typing import Any, Callable, Optional
+
+from .misc import MODEL_REGISTRY_MAX_BYTES
+from .placement import ModelPlacement, current_rss_mb
+
+
+class ModelRegistry:
+    """
+    Shares loaded models between Scraibe instances.
+
+    Each model is loaded once per key. `acquire` returns the loaded model wrapper
+    and increments its reference count, `release` decrements it. Models without
+    references are kept, in least recently used order, as long as the resident
+    models fit into the memory budget.
+
+    Attributes:
+        max_bytes: Optional[int]
+            Memory budget of the registry in bytes. 0 keeps only referenced models,
+            None keeps every model until `clear`.
+        hits: Counter
+            Number of acquisitions of an already loaded model, per kind.
+        loads: Counter
+            Number of models loaded, per kind.
+        evictions: int
+            Number of models evicted to stay within the budget.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = MODEL_REGISTRY_MAX_BYTES) -> None:
+        """
+        Initialize the ModelRegistry.
+
+        Args:
+            max_bytes (Optional[int], optional): Memory budget in bytes.
+                        Defaults to MODEL_REGISTRY_MAX_BYTES.
+        """
+        self.max_bytes = max_bytes
+        self.hits: Counter = Counter()
+        self.loads: Counter = Counter()
+        self.evictions = 0
+        # key -> {"model", "refs", "nbytes"}, least recently used first
+        self._entries: OrderedDict = OrderedDict()
+        self._loading: dict = {}
+        self._lock = RLock()
+
+    @staticmethod
+    def key(kind: str, **settings: Any) -> tuple:
+        """
+        Builds the key of a model.
+
+        Args:
+            kind (str): Kind of the model, "transcriber" or "diariser".
+            **settings: The name of the model and every setting that changes the
+                        loaded weights, e.g. the device and the compute type.
+
+        Returns:
+            tuple: A hashable key, independent of the order of the settings.
+        """
+        return (kind,) + tuple(sorted((name, str(value)) for name, value in settings.items()
+                                      if value is not None))
+
+    def acquire(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        """
+        Returns the model of a key, loading it if it is not resident,
+        and adds a reference to it.
+
+        Concurrent acquisitions of the same key load the model only once.
+
+        Args:
+            key (tuple): The key of the model, see `key`.
+            loader (Callable[[], Any]): Loads the model if it is not resident.
+
+        Returns:
+            Any: The shared model.
+        """
+        with self._lock:
+            model = self._reuse(key)
+            if model is not None:
+                return model
+            loading = self._loading.setdefault(key, Lock())
+
+        with loading:
+            with self._lock:
+                model = self._reuse(key)
+                if model is not None:
+                    return model
+
+            try:
+                rss = current_rss_mb()
+                model = loader()
+                nbytes = self.model_nbytes(model, rss)
+
+                with self._lock:
+                    self._entries[key] = {"model": model, "refs": 1, "nbytes": nbytes}
+                    self.loads[key[0]] += 1
+                    self._evict()
+            finally:
+                # a failed load must not leave its lock behind for the next acquisition
+                with self._lock:
+                    self._loading.pop(key, None)
+
+        return model
+
+    def release(self, key: tuple) -> None:
+        """
+        Removes a reference to the model of a key. Models without references
+        are evicted once they no longer fit into the budget.
+
+        Args:
+            key (tuple): The key of the model.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["refs"] == 0:
+                return
+            entry["refs"] -= 1
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Evicts all models without references.
+        """
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if not entry["refs"]]:
+                del self._entries[key]
+                self.evictions += 1
+        ModelPlacement._free()
+
+    def resident_bytes(self) -> int:
+        """
+        Estimated memory of the resident models in bytes.
+        """
+        with self._lock:
+            return sum(entry["nbytes"] for entry in self._entries.values())
+
+    def report(self) -> dict:
+        """
+        Describes the resident models, least recently used first.
+
+        Returns:
+            dict: The budget and the estimated memory of the resident models in MiB,
+                    the hits, loads and evictions, and the key, references and
+                    estimated memory of every resident model with the settings of its key.
+        """
+        with self._lock:
+            models = [{"kind": key[0], **dict(key[1:]), "refs": entry["refs"],
+                       "mb": entry["nbytes"] / 1024 ** 2}
+                      for key, entry in self._entries.items()]
+            return {"max_mb": self.max_bytes / 1024 ** 2 if self.max_bytes is not None else None,
+                    "resident_mb": self.resident_bytes() / 1024 ** 2,
+                    "hits": dict(self.hits),
+                    "loads": dict(self.loads),
+                    "evictions": self.evictions,
+                    "models": models}
+
+    @staticmethod
+    def model_nbytes(model: Any, rss_before: Optional[float] = None) -> int:
+        """
+        Estimates the memory of a loaded model wrapper.
+
+        Torch modules are measured by their parameters and buffers. Other models,
+        e.g. CTranslate2 models or pyannote pipelines, by the growth of the resident
+        memory while they were loaded.
+
+        Args:
+            model (Any): The model wrapper, with the weights in `model.model`.
+            rss_before (Optional[float], optional): Resident memory in MiB before
+                        loading the model. Defaults to None.
+
+        Returns:
+            int: The estimated size in bytes, 0 if it cannot be estimated.
+        """
+        weights = getattr(model, "model", model)
+        if hasattr(weights, "buffers") and hasattr(weights, "named_parameters"):
+            tensors = list(weights.parameters()) + list(weights.buffers())
+            return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+        rss_after = current_rss_mb()
+        if rss_before is None or rss_after is None:
+            return 0
+        return max(0, int((rss_after - rss_before) * 1024 ** 2))
+
+    def _reuse(self, key: tuple) -> Any:
+        """
+        Adds a reference to a resident model and marks it as recently used.
+        The lock must be held.
+
+        Returns:
+            Any: The model, or None if it is not resident.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry["refs"] += 1
+        self._entries.move_to_end(key)
+        self.hits[key[0]] += 1
+        return entry["model"]
+
+    def _evict(self) -> None:
+        """
+        Evicts the least recently used models without references until the
+        resident models fit into the budget. The lock must be held.
+        """
+        if self.max_bytes is None:
+            return
+
+        evicted = False
+        for key in [key for key, entry in self._entries.items() if not entry["refs"]]:
+            if self.max_bytes and self.resident_bytes() <= self.max_bytes:
+                break
+            del self._entries[key]
+            self.evictions += 1
+            evicted = True
+
+        if evicted:
+            ModelPlacement._free()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ModelRegistry(max_bytes={self.max_bytes}, models={len(self)})"
+
+
+MODEL_REGISTRY = ModelRegistry()
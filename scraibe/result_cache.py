@@ -0,0 +1,170 @@
+"""
+Result Cache Module
+===================
+
+This module provides the ResultCache class, an on-disk cache of diarisations and
+transcripts. Re-running the same audio with unchanged settings, e.g. to export
+another format or after a restart of a pipeline, reads the results from the cache
+instead of running the models again.
+
+Entries are addressed by the content of the audio, the model and the effective
+keyword arguments of each stage. Diarisations and transcripts are stored separately,
+so changing only the Whisper model still reuses the cached diarisation.
+
+Available Classes:
+- ResultCache: On-disk JSON cache of diarisations and transcripts with a size budget.
+
+Usage:
+    from .result_cache import ResultCache
+
+    cache = ResultCache()
+    audio_key = ResultCache.audio_key(audio_file)
+    key = ResultCache.key("diarisation", audio_key, model="pyannote/speaker-diarization-3.1")
+    if (diarisation := cache.load(key)) is None:
+        diarisation = diariser.diarization(audio)
+        cache.store(key, diarisation)
+
+Constants:
+- RESULT_KINDS (tuple): Kinds of results stored in the cache.
+"""
+
+import json
+from collections import Counter
+from hashlib import blake2b
+from typing import Any, Optional
+
+import numpy as np
+
+from .audio import AudioProcessor
+from .disk_cache import DiskCache
+from .misc import RESULT_CACHE_DIR, RESULT_CACHE_MAX_BYTES
+
+RESULT_KINDS = ("diarisation", "transcript", "transcription")
+
+
+class ResultCache(DiskCache):
+    """
+    On-disk cache of diarisations and transcripts keyed by audio content,
+    model and settings.
+
+    Results are stored as JSON files. The cache is kept below a size budget by
+    evicting the least recently used entries, see DiskCache, and hits and misses
+    are counted per kind of result.
+
+    Attributes:
+        cache_dir: str
+            Directory holding the cached results.
+        max_bytes: int
+            Size budget of the cache in bytes.
+        hits: Counter
+            Number of cache hits per kind of result.
+        misses: Counter
+            Number of cache misses per kind of result.
+    """
+
+    suffix = ".json"
+
+    def __init__(self, cache_dir: str = RESULT_CACHE_DIR,
+                 max_bytes: int = RESULT_CACHE_MAX_BYTES) -> None:
+        """
+        Initialize the ResultCache object.
+
+        Args:
+            cache_dir (str, optional): Directory holding the cached results.
+                                        Defaults to RESULT_CACHE_DIR.
+            max_bytes (int, optional): Size budget of the cache in bytes.
+                                        Defaults to RESULT_CACHE_MAX_BYTES.
+        """
+        super().__init__(cache_dir, max_bytes)
+        self.hits = Counter()
+        self.misses = Counter()
+
+    @staticmethod
+    def audio_key(audio_file: AudioProcessor) -> str:
+        """
+        Compute the key of loaded audio from its samples, sample rate and offset.
+
+        Args:
+            audio_file (AudioProcessor): The loaded audio.
+
+        Returns:
+            str: The key of the audio.
+        """
+        digest = blake2b(digest_size=20)
+        # hash the samples in place, tobytes would copy the whole waveform
+        digest.update(memoryview(np.ascontiguousarray(audio_file.waveform.cpu().numpy())))
+        digest.update(f"{audio_file.waveform.dtype}_{audio_file.sr}_{audio_file.offset}".encode())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(kind: str, audio_key: str, **settings) -> str:
+        """
+        Compute the cache key of a result.
+
+        Args:
+            kind (str): Kind of the result, one of RESULT_KINDS.
+            audio_key (str): Key of the audio, see `audio_key`, or of the
+                                result this one depends on.
+            **settings: Model and keyword arguments the result depends on.
+                        Values that are not JSON serializable are represented by their `str`.
+
+        Returns:
+            str: The cache key.
+        """
+        if kind not in RESULT_KINDS:
+            raise ValueError(f"Unknown kind of result {kind}, expected one of {RESULT_KINDS}.")
+
+        digest = blake2b(digest_size=20)
+        digest.update(audio_key.encode())
+        digest.update(json.dumps(settings, sort_keys=True, default=str).encode())
+
+        return f"{kind}_{digest.hexdigest()}"
+
+    def load(self, key: str) -> Optional[Any]:
+        """
+        Load a cached result.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The result, or None if the key is not cached.
+        """
+        kind = key.split("_")[0]
+        path = self.path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+            self.touch(path)
+        except (FileNotFoundError, ValueError):
+            self.misses[kind] += 1
+            return None
+
+        self.hits[kind] += 1
+
+        return result
+
+    def store(self, key: str, result: Any) -> None:
+        """
+        Store a result in the cache and evict old entries if necessary.
+
+        Args:
+            key (str): The cache key.
+            result (Any): The JSON serializable result.
+        """
+        self.write(self.path(key), lambda f: json.dump(result, f), mode="w")
+        self.evict()
+
+    def stats(self) -> dict:
+        """
+        Get the hit and miss counters of the cache.
+
+        Returns:
+            dict: Hits and misses per kind of result, and the overall hit rate.
+        """
+        hits, misses = sum(self.hits.values()), sum(self.misses.values())
+
+        return {"hits": dict(self.hits),
+                "misses": dict(self.misses),
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0}
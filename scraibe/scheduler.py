@@ -0,0 +1,174 @@
+"""
+Segment Scheduler Module
+========================
+
+This module provides the SegmentScheduler class, which sits between diarisation
+and transcription. Whisper pads every input to a 30 second window, while the
+turns of a diarisation are often only a few seconds long. Transcribing every turn
+on its own therefore spends most of the encoder compute on padding.
+
+The scheduler packs consecutive turns into windows of up to `max_window` seconds,
+so each window is transcribed once. The text of a window that holds several turns
+is attributed back to the turns with word timestamps. Consecutive turns of one
+speaker are already merged by the diariser, so a window of one speaker also takes
+the short interjections of other speakers, e.g. backchannels, that split its turns.
+
+Available Classes:
+- SegmentScheduler: Packs diarisation turns into ASR windows and reports
+                    the padding saved by doing so.
+
+Usage:
+    from .scheduler import SegmentScheduler
+
+    scheduler = SegmentScheduler(max_window=30.0, max_gap=1.0)
+    windows = scheduler.schedule(diarisation["segments"], diarisation["speakers"])
+    print(scheduler.stats)
+
+Constants:
+- WHISPER_WINDOW (float): Length in seconds of the input window of Whisper models.
+"""
+
+from math import ceil
+from typing import List, Optional
+
+WHISPER_WINDOW = 30.0
+
+
+class SegmentScheduler:
+    """
+    Packs consecutive diarisation turns into windows for transcription.
+
+    Turns are added to the current window in order, until the window would exceed
+    `max_window` seconds, the silence to the next turn exceeds `max_gap` seconds,
+    or, unless `cross_speaker` is set, the speaker changes to a turn longer than
+    `max_interjection` seconds. Turns longer than `max_window` are always scheduled
+    on their own.
+
+    Attributes:
+        max_window (float): Maximum length of a window in seconds.
+        max_gap (float): Maximum silence in seconds between two turns of a window.
+        cross_speaker (bool): If True, turns of different speakers share a window.
+        max_interjection (float): Maximum length in seconds of a turn of another
+                                  speaker that still joins a window.
+        stats (dict): Report of the last call to `schedule`.
+    """
+
+    def __init__(self, max_window: float = WHISPER_WINDOW,
+                 max_gap: float = 1.0,
+                 cross_speaker: bool = False,
+                 max_interjection: float = 1.0) -> None:
+        """
+        Initialize the SegmentScheduler.
+
+        Args:
+            max_window (float, optional): Maximum length of a window in seconds.
+                                          Defaults to the 30 second Whisper window.
+            max_gap (float, optional): Maximum silence in seconds between two
+                                       turns of a window. Defaults to 1.0.
+            cross_speaker (bool, optional): If True, turns of different speakers
+                                            are packed into the same window and split
+                                            back by word timestamps. Defaults to False.
+            max_interjection (float, optional): Maximum length in seconds of a turn
+                                            of another speaker that joins the window
+                                            of the current speaker, e.g. a backchannel.
+                                            0 keeps speakers apart. Defaults to 1.0.
+        """
+        if max_window <= 0:
+            raise ValueError(f"max_window must be positive, not {max_window}.")
+        if max_gap < 0:
+            raise ValueError(f"max_gap must not be negative, not {max_gap}.")
+        if max_interjection < 0:
+            raise ValueError(f"max_interjection must not be negative, not {max_interjection}.")
+
+        self.max_window = max_window
+        self.max_gap = max_gap
+        self.cross_speaker = cross_speaker
+        self.max_interjection = max_interjection
+        self.stats: dict = {}
+
+    def schedule(self, segments: List[List[float]],
+                 speakers: Optional[List[str]] = None) -> List[List[int]]:
+        """
+        Packs turns into windows.
+
+        Args:
+            segments (List[List[float]]): Start and end of each turn in seconds,
+                                          sorted by start.
+            speakers (List[str], optional): Speaker of each turn. Required unless
+                                            `cross_speaker` is set.
+
+        Returns:
+            List[List[int]]: The indices of the turns in each window.
+        """
+        if speakers is None and not self.cross_speaker:
+            raise ValueError("speakers are required unless cross_speaker is set.")
+
+        windows: List[List[int]] = []
+        window_start = window_end = 0.0
+
+        for i, (start, end) in enumerate(segments):
+            if windows and (end - window_start <= self.max_window
+                            and start - window_end <= self.max_gap
+                            and (self.cross_speaker
+                                 or speakers[i] == speakers[windows[-1][0]]
+                                 or end - start <= self.max_interjection)):
+                windows[-1].append(i)
+                window_end = max(window_end, end)
+            else:
+                windows.append([i])
+                window_start, window_end = start, end
+
+        self.stats = self.report(segments, windows)
+
+        return windows
+
+    @staticmethod
+    def window_bounds(segments: List[List[float]],
+                      window: List[int]) -> List[float]:
+        """
+        Start and end of a window in seconds.
+
+        Args:
+            segments (List[List[float]]): Start and end of each turn in seconds.
+            window (List[int]): The indices of the turns in the window.
+
+        Returns:
+            List[float]: Start and end of the window.
+        """
+        return [min(segments[i][0] for i in window),
+                max(segments[i][1] for i in window)]
+
+    @classmethod
+    def report(cls, segments: List[List[float]],
+               windows: List[List[int]]) -> dict:
+        """
+        Compares the padded audio of transcribing each turn separately with
+        transcribing each window.
+
+        Args:
+            segments (List[List[float]]): Start and end of each turn in seconds.
+            windows (List[List[int]]): The indices of the turns in each window.
+
+        Returns:
+            dict: Number of turns and windows, the padding in seconds for both,
+                    and the padding saved in seconds and as a ratio.
+        """
+        def padding(duration: float) -> float:
+            return max(1, ceil(duration / WHISPER_WINDOW)) * WHISPER_WINDOW - duration
+
+        padding_turns = sum(padding(end - start) for start, end in segments)
+        padding_windows = sum(padding(end - start) for start, end in
+                              (cls.window_bounds(segments, window) for window in windows))
+
+        return {"turns": len(segments),
+                "windows": len(windows),
+                "padding_turns": padding_turns,
+                "padding_windows": padding_windows,
+                "padding_saved": padding_turns - padding_windows,
+                "padding_saved_ratio": ((padding_turns - padding_windows) / padding_turns
+                                        if padding_turns else 0.0)}
+
+    def __repr__(self) -> str:
+        return (f"SegmentScheduler(max_window={self.max_window}, "
+                f"max_gap={self.max_gap}, cross_speaker={self.cross_speaker}, "
+                f"max_interjection={self.max_interjection})")
@@ -16,6 +16,8 @@ Main Features:
     
 Constants:
     WHISPER_DEFAULT_PATH: Default path for downloading and loading Whisper models.
+    N_FRAMES, N_SAMPLES, TO_LANGUAGE_CODE: Constants of Whisper, imported from
+        whisper on first access, so importing this module does not import whisper.
 
 Usage:
     >>> from your_package import Transcriber
@@ -24,16 +26,14 @@ Usage:
     >>> transcriber.save_transcript(transcript, "path/to/save.txt")
 """
 
-from whisper import Whisper
-from whisper import load_model as whisper_load_model
-from whisper.tokenizer import TO_LANGUAGE_CODE
-from faster_whisper import WhisperModel as FasterWhisperModel
-from faster_whisper.tokenizer import _LANGUAGE_CODES as FASTER_WHISPER_LANGUAGE_CODES
-from typing import TypeVar, Union, Optional
-from torch import Tensor, device
+from typing import List, Tuple, TypeVar, Union, Optional
+from dataclasses import fields
+from torch import Tensor, device, stack
+import numpy as np
 from numpy import ndarray
 from inspect import signature
 from abc import abstractmethod
+from importlib import import_module
 import warnings
 
 from .misc import WHISPER_DEFAULT_PATH, SCRAIBE_TORCH_DEVICE, SCRAIBE_NUM_THREADS
@@ -55,6 +55,10 @@ class Transcriber:
 
     Methods:
         transcribe: Transcribes the given audio file.
+        transcribe_batch: Transcribes several short audio segments in batches.
+        transcribe_words: Transcribes an audio file with word-level timestamps.
+        transcribe_words_batch: Transcribes several audio segments with word-level timestamps.
+        detect_language: Detects the spoken language of an audio file.
         save_transcript: Saves the transcript to a file.
         load_model: Loads a specific Whisper model.
         _get_whisper_kwargs: Private method to get valid keyword arguments for the whisper model.
@@ -99,6 +103,128 @@ class Transcriber:
         """
         pass
 
+    def transcribe_batch(self, audios: List[Union[Tensor, ndarray]],
+                         batch_size: int = 8,
+                         *args, **kwargs) -> List[str]:
+        """
+        Transcribe several audio segments, e.g. the turns of a diarisation.
+
+        The base implementation transcribes the segments one after another.
+        Subclasses run segments of up to 30 seconds through the model in
+        batches of `batch_size`.
+
+        Args:
+            audios (List[Union[Tensor, nparray]]): The audio segments to transcribe.
+            batch_size (int, optional): Number of segments per model call.
+                                        Defaults to 8.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments, 
+                        such as the language of the audio file.
+
+        Returns:
+            List[str]: The transcript of each segment.
+        """
+        return [self.transcribe(audio, *args, **kwargs) for audio in audios]
+
+    @abstractmethod
+    def transcribe_words(self, audio: Union[Tensor, ndarray],
+                         *args, **kwargs) -> List[Tuple[float, float, str]]:
+        """
+        Transcribe an audio file with word-level timestamps.
+
+        Args:
+            audio (Union[Tensor, nparray]): The audio file to transcribe.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments, 
+                        such as the language of the audio file.
+
+        Returns:
+            List[Tuple[float, float, str]]: The start and end time in seconds
+                                            and the text of each word.
+        """
+        pass
+
+    def transcribe_words_batch(self, audios: List[Union[Tensor, ndarray]],
+                               batch_size: int = 8,
+                               *args, **kwargs) -> List[List[Tuple[float, float, str]]]:
+        """
+        Transcribe several audio segments with word-level timestamps,
+        e.g. the coalesced windows of a diarisation.
+
+        The base implementation transcribes the segments one after another.
+        Subclasses may decode segments of up to 30 seconds in batches of
+        `batch_size` and align the words of each segment afterwards.
+
+        Args:
+            audios (List[Union[Tensor, nparray]]): The audio segments to transcribe.
+            batch_size (int, optional): Number of segments per model call.
+                                        Defaults to 8.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments, 
+                        such as the language of the audio file.
+
+        Returns:
+            List[List[Tuple[float, float, str]]]: The start and end time in seconds,
+                                                  relative to its segment, and the text
+                                                  of each word of each segment.
+        """
+        return [self.transcribe_words(audio, *args, **kwargs) for audio in audios]
+
+    @abstractmethod
+    def detect_language(self, audio: Union[Tensor, ndarray],
+                        *args, **kwargs) -> Tuple[str, float]:
+        """
+        Detect the spoken language of an audio file with the loaded model.
+
+        Only the first 30 seconds of the audio are used, so pass a sample of
+        speech, e.g. the first diarisation turns of a file.
+
+        Args:
+            audio (Union[Tensor, nparray]): The audio to detect the language of.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Tuple[str, float]: The language code and its probability.
+        """
+        pass
+
+    @staticmethod
+    def _split_batches(audios: List[Union[Tensor, ndarray]],
+                       batch_size: int, n_samples: int) -> tuple:
+        """
+        Split segments into batches of segments that fit into one 30 second window
+        and a list of longer segments that need sequential transcription.
+
+        Args:
+            audios (List[Union[Tensor, nparray]]): The audio segments.
+            batch_size (int): Number of segments per batch.
+            n_samples (int): Number of samples of the window of the model.
+
+        Returns:
+            tuple: A list of batches of segment indices and a list of
+                    indices of longer segments.
+        """
+        short = [i for i, audio in enumerate(audios) if len(audio) <= n_samples]
+        long = [i for i, audio in enumerate(audios) if len(audio) > n_samples]
+        batches = [short[i:i + batch_size] for i in range(0, len(short), batch_size)]
+
+        return batches, long
+
+    def to(self, device: Union[str, device]) -> 'Transcriber':
+        """
+        Move the model to a device, e.g. to the CPU while it is not used.
+
+        Args:
+            device (Union[str, torch.device]): The device to move the model to.
+
+        Returns:
+            Transcriber: The transcriber itself.
+        """
+        self.model.to(device)
+
+        return self
+
     @staticmethod
     def save_transcript(transcript: str, save_path: str) -> None:
         """
@@ -201,6 +327,223 @@ class WhisperTranscriber(Transcriber):
         result = self.model.transcribe(audio, *args, **kwargs)
         return result["text"]
 
+    def transcribe_words(self, audio: Union[Tensor, ndarray],
+                         *args, **kwargs) -> List[Tuple[float, float, str]]:
+        """
+        Transcribe an audio file with word-level timestamps.
+
+        Args:
+            audio (Union[Tensor, nparray]): The audio file to transcribe.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments, 
+                        such as the language of the audio file.
+
+        Returns:
+            List[Tuple[float, float, str]]: The start and end time in seconds
+                                            and the text of each word.
+        """
+        kwargs = self._get_whisper_kwargs(**kwargs)
+        kwargs["word_timestamps"] = True
+
+        if not kwargs.get("verbose"):
+            kwargs["verbose"] = None
+
+        result = self.model.transcribe(audio, *args, **kwargs)
+
+        return [(word["start"], word["end"], word["word"])
+                for seg in result["segments"] for word in seg.get("words", [])]
+
+    def transcribe_batch(self, audios: List[Union[Tensor, ndarray]],
+                         batch_size: int = 8,
+                         *args, **kwargs) -> List[str]:
+        """
+        Transcribe several audio segments in batches.
+
+        Segments of up to 30 seconds are stacked into one mel spectrogram batch
+        and decoded in a single `whisper.decode` call. Unlike `transcribe`,
+        this uses a single decoding pass without temperature fallback.
+        Longer segments are transcribed with `transcribe`.
+
+        Args:
+            audios (List[Union[Tensor, nparray]]): The audio segments to transcribe.
+            batch_size (int, optional): Number of segments per model call.
+                                        Defaults to 8.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments, 
+                        such as the language of the audio file.
+
+        Returns:
+            List[str]: The transcript of each segment.
+        """
+        if batch_size <= 1:
+            return super().transcribe_batch(audios, batch_size, *args, **kwargs)
+
+        from whisper.audio import N_SAMPLES
+
+        options = self._get_decoding_options(**kwargs)
+        no_speech_threshold = kwargs.get("no_speech_threshold", 0.6)
+        logprob_threshold = kwargs.get("logprob_threshold", -1.0)
+
+        texts = [""] * len(audios)
+        batches, long = self._split_batches(audios, batch_size, N_SAMPLES)
+
+        for i in long:
+            texts[i] = self.transcribe(audios[i], *args, **kwargs)
+
+        for batch in batches:
+            _, results = self._decode_batch(audios, batch, options)
+
+            for i, result in zip(batch, results):
+                if no_speech_threshold is not None and logprob_threshold is not None \
+                        and result.no_speech_prob > no_speech_threshold \
+                        and result.avg_logprob < logprob_threshold:
+                    continue
+                # transcribe keeps the leading space of the first token
+                texts[i] = f" {result.text}" if result.text else ""
+
+        return texts
+
+    def transcribe_words_batch(self, audios: List[Union[Tensor, ndarray]],
+                               batch_size: int = 8,
+                               *args, **kwargs) -> List[List[Tuple[float, float, str]]]:
+        """
+        Transcribe several audio segments with word-level timestamps in batches.
+
+        Segments of up to 30 seconds are decoded in a single `whisper.decode` call
+        per batch, like in `transcribe_batch`, and the words of each segment are
+        aligned afterwards with the cross attention of the model, like
+        `transcribe` does with `word_timestamps`. Longer segments are transcribed
+        with `transcribe_words`.
+
+        Args:
+            audios (List[Union[Tensor, nparray]]): The audio segments to transcribe.
+            batch_size (int, optional): Number of segments per model call.
+                                        Defaults to 8.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments, 
+                        such as the language of the audio file.
+
+        Returns:
+            List[List[Tuple[float, float, str]]]: The start and end time in seconds,
+                                                  relative to its segment, and the text
+                                                  of each word of each segment.
+        """
+        if batch_size <= 1:
+            return super().transcribe_words_batch(audios, batch_size, *args, **kwargs)
+
+        from whisper.audio import HOP_LENGTH, N_SAMPLES, SAMPLE_RATE
+        from whisper.timing import add_word_timestamps
+        from whisper.tokenizer import get_tokenizer
+
+        options = self._get_decoding_options(**kwargs)
+        no_speech_threshold = kwargs.get("no_speech_threshold", 0.6)
+        logprob_threshold = kwargs.get("logprob_threshold", -1.0)
+
+        words: List[List[Tuple[float, float, str]]] = [[] for _ in audios]
+        batches, long = self._split_batches(audios, batch_size, N_SAMPLES)
+
+        for i in long:
+            words[i] = self.transcribe_words(audios[i], *args, **kwargs)
+
+        for batch in batches:
+            mel, results = self._decode_batch(audios, batch, options)
+
+            for i, segment_mel, result in zip(batch, mel, results):
+                if not result.tokens or (no_speech_threshold is not None
+                                         and logprob_threshold is not None
+                                         and result.no_speech_prob > no_speech_threshold
+                                         and result.avg_logprob < logprob_threshold):
+                    continue
+
+                tokenizer = get_tokenizer(self.model.is_multilingual,
+                                          num_languages=self.model.num_languages,
+                                          language=result.language, task=options.task)
+                segment = {"seek": 0, "start": 0.0, "end": len(audios[i]) / SAMPLE_RATE,
+                           "tokens": result.tokens}
+                add_word_timestamps(segments=[segment], model=self.model, tokenizer=tokenizer,
+                                    mel=segment_mel, num_frames=len(audios[i]) // HOP_LENGTH,
+                                    last_speech_timestamp=0.0)
+
+                words[i] = [(word["start"], word["end"], word["word"])
+                            for word in segment["words"]]
+
+        return words
+
+    def detect_language(self, audio: Union[Tensor, ndarray],
+                        *args, **kwargs) -> Tuple[str, float]:
+        """
+        Detect the spoken language of an audio file with the loaded model.
+
+        Only the first 30 seconds of the audio are used, so pass a sample of
+        speech, e.g. the first diarisation turns of a file.
+
+        Args:
+            audio (Union[Tensor, nparray]): The audio to detect the language of.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Tuple[str, float]: The language code and its probability.
+        """
+        from whisper.audio import N_FRAMES, N_SAMPLES, log_mel_spectrogram, pad_or_trim
+
+        if not self.model.is_multilingual:
+            return "en", 1.0
+
+        mel = pad_or_trim(log_mel_spectrogram(audio[:N_SAMPLES], self.model.dims.n_mels,
+                                              padding=N_SAMPLES, device=self.model.device),
+                          N_FRAMES)
+        _, probs = self.model.detect_language(mel)
+
+        language = max(probs, key=probs.get)
+        return language, float(probs[language])
+
+    def _decode_batch(self, audios: List[Union[Tensor, ndarray]],
+                      batch: List[int], options: "DecodingOptions") -> tuple:
+        """
+        Decode a batch of segments of up to 30 seconds in a single `whisper.decode` call.
+
+        Args:
+            audios (List[Union[Tensor, nparray]]): The audio segments.
+            batch (List[int]): The indices of the segments in the batch.
+            options (DecodingOptions): Options for `whisper.decode`.
+
+        Returns:
+            tuple: The padded mel spectrograms and the decoding results of the batch.
+        """
+        from whisper import decode as whisper_decode
+        from whisper.audio import N_FRAMES, N_SAMPLES, log_mel_spectrogram, pad_or_trim
+
+        # mel spectrograms are normalised per segment, so compute them one by one
+        mel = stack([pad_or_trim(log_mel_spectrogram(audios[i], self.model.dims.n_mels,
+                                                     padding=N_SAMPLES,
+                                                     device=self.model.device),
+                                 N_FRAMES)
+                     for i in batch])
+
+        return mel, whisper_decode(self.model, mel, options)
+
+    def _get_decoding_options(self, **kwargs) -> "DecodingOptions":
+        """
+        Get decoding options for batched decoding from the transcription kwargs.
+
+        Returns:
+            DecodingOptions: Options for `whisper.decode`.
+        """
+        from whisper import DecodingOptions
+
+        _possible_kwargs = {f.name for f in fields(DecodingOptions)}
+
+        options = {k: v for k, v in kwargs.items() if k in _possible_kwargs}
+
+        if isinstance(options.get("temperature"), (list, tuple)):
+            options["temperature"] = options["temperature"][0]
+
+        options["fp16"] = options.get("fp16", True) and self.model.device.type != "cpu"
+        options["without_timestamps"] = True
+
+        return DecodingOptions(**options)
+
     @classmethod
     def load_model(cls,
                    model: str = "medium",
@@ -240,6 +583,7 @@ class WhisperTranscriber(Transcriber):
         Returns:
             Transcriber: A Transcriber object initialized with the specified model.
         """
+        from whisper import load_model as whisper_load_model
 
         _model = whisper_load_model(model, download_root=download_root,
                                     device=device, in_memory=in_memory)
@@ -254,6 +598,8 @@ class WhisperTranscriber(Transcriber):
         Returns:
             dict: Keyword arguments for whisper model.
         """
+        from whisper import Whisper
+
         # _possible_kwargs = WhisperModel.transcribe.__code__.co_varnames
         _possible_kwargs = signature(Whisper.transcribe).parameters.keys()
 
@@ -300,13 +646,203 @@ class FasterWhisperTranscriber(Transcriber):
             text += seg.text
         return text
 
+    def transcribe_words(self, audio: Union[Tensor, ndarray],
+                         *args, **kwargs) -> List[Tuple[float, float, str]]:
+        """
+        Transcribe an audio file with word-level timestamps.
+
+        Args:
+            audio (Union[Tensor, nparray]): The audio file to transcribe.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments, 
+                        such as the language of the audio file.
+
+        Returns:
+            List[Tuple[float, float, str]]: The start and end time in seconds
+                                            and the text of each word.
+        """
+        kwargs = self._get_whisper_kwargs(**kwargs)
+        kwargs["word_timestamps"] = True
+
+        if isinstance(audio, Tensor):
+            audio = audio.cpu().numpy()
+        result, _ = self.model.transcribe(audio, *args, **kwargs)
+
+        return [(word.start, word.end, word.word)
+                for seg in result for word in (seg.words or [])]
+
+    def transcribe_batch(self, audios: List[Union[Tensor, ndarray]],
+                         batch_size: int = 8,
+                         *args, **kwargs) -> List[str]:
+        """
+        Transcribe several audio segments in batches.
+
+        Segments of up to 30 seconds are encoded and decoded in a single
+        CTranslate2 call per batch. Unlike `transcribe`, this uses a single
+        decoding pass without temperature fallback. Longer segments are
+        transcribed with `transcribe`.
+
+        Args:
+            audios (List[Union[Tensor, nparray]]): The audio segments to transcribe.
+            batch_size (int, optional): Number of segments per model call.
+                                        Defaults to 8.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments, 
+                        such as the language of the audio file.
+
+        Returns:
+            List[str]: The transcript of each segment.
+        """
+        if batch_size <= 1:
+            return super().transcribe_batch(audios, batch_size, *args, **kwargs)
+
+        from faster_whisper.audio import pad_or_trim
+        from faster_whisper.tokenizer import Tokenizer as FasterWhisperTokenizer
+        from faster_whisper.transcribe import get_ctranslate2_storage, get_suppressed_tokens
+
+        whisper_kwargs = self._get_whisper_kwargs(**kwargs)
+        task = whisper_kwargs.get("task", "transcribe")
+        language = whisper_kwargs.get("language")
+        no_speech_threshold = whisper_kwargs.get("no_speech_threshold", 0.6)
+        log_prob_threshold = whisper_kwargs.get("log_prob_threshold", -1.0)
+        length_penalty = whisper_kwargs.get("length_penalty", 1)
+
+        model = self.model.model
+        feature_extractor = self.model.feature_extractor
+        # see faster_whisper.WhisperModel.encode
+        to_cpu = model.device == "cuda" and len(model.device_index) > 1
+
+        if not model.is_multilingual:
+            language = "en"
+
+        tokenizers = {}
+        texts = [""] * len(audios)
+        batches, long = self._split_batches(audios, batch_size, feature_extractor.n_samples)
+
+        for i in long:
+            texts[i] = self.transcribe(audios[i], *args, **kwargs)
+
+        for batch in batches:
+            features = np.stack([
+                pad_or_trim(feature_extractor(self._to_numpy(audios[i])),
+                            feature_extractor.nb_max_frames)
+                for i in batch])
+            encoder_output = model.encode(get_ctranslate2_storage(features), to_cpu=to_cpu)
+
+            if language is None:
+                languages = [result[0][0][2:-2]
+                             for result in model.detect_language(encoder_output)]
+            else:
+                languages = [language] * len(batch)
+
+            # the suppressed tokens depend on the tokenizer, so the segments are
+            # generated in groups with the same suppressed tokens
+            groups = {}
+            for k, lang in enumerate(languages):
+                if lang not in tokenizers:
+                    tokenizers[lang] = FasterWhisperTokenizer(
+                        self.model.hf_tokenizer, model.is_multilingual,
+                        task=task, language=lang)
+                suppress_tokens = get_suppressed_tokens(
+                    tokenizers[lang], whisper_kwargs.get("suppress_tokens", [-1]))
+                key = tuple(suppress_tokens) if suppress_tokens is not None else None
+                groups.setdefault(key, []).append(k)
+
+            for suppress_tokens, positions in groups.items():
+                group_output = encoder_output if len(groups) == 1 else model.encode(
+                    get_ctranslate2_storage(features[positions]), to_cpu=to_cpu)
+                prompts = [tokenizers[languages[k]].sot_sequence
+                           + [tokenizers[languages[k]].no_timestamps] for k in positions]
+
+                results = model.generate(
+                    group_output,
+                    prompts,
+                    beam_size=whisper_kwargs.get("beam_size", 5),
+                    patience=whisper_kwargs.get("patience", 1),
+                    length_penalty=length_penalty,
+                    max_length=self.model.max_length,
+                    return_scores=True,
+                    return_no_speech_prob=True,
+                    suppress_blank=whisper_kwargs.get("suppress_blank", True),
+                    suppress_tokens=list(suppress_tokens) if suppress_tokens is not None
+                    else None,
+                )
+
+                for k, result in zip(positions, results):
+                    tokens = result.sequences_ids[0]
+                    # see faster_whisper.WhisperModel.generate_with_fallback
+                    avg_logprob = result.scores[0] * (len(tokens) ** length_penalty) \
+                        / (len(tokens) + 1)
+                    if no_speech_threshold is not None and log_prob_threshold is not None \
+                            and result.no_speech_prob > no_speech_threshold \
+                            and avg_logprob < log_prob_threshold:
+                        continue
+                    texts[batch[k]] = tokenizers[languages[k]].decode(tokens)
+
+        return texts
+
+    def detect_language(self, audio: Union[Tensor, ndarray],
+                        *args, **kwargs) -> Tuple[str, float]:
+        """
+        Detect the spoken language of an audio file with the loaded model.
+
+        Only the first 30 seconds of the audio are used, so pass a sample of
+        speech, e.g. the first diarisation turns of a file.
+
+        Args:
+            audio (Union[Tensor, nparray]): The audio to detect the language of.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Tuple[str, float]: The language code and its probability.
+        """
+        from faster_whisper.audio import pad_or_trim
+
+        model = self.model.model
+        if not model.is_multilingual:
+            return "en", 1.0
+
+        feature_extractor = self.model.feature_extractor
+        samples = self._to_numpy(audio)[:feature_extractor.n_samples]
+        features = pad_or_trim(feature_extractor(samples), feature_extractor.nb_max_frames)
+        encoder_output = self.model.encode(features)
+
+        token, probability = model.detect_language(encoder_output)[0][0]
+        return token[2:-2], float(probability)
+
+    def to(self, device: Union[str, device]) -> 'FasterWhisperTranscriber':
+        """
+        Move the model to the CPU memory, or back to the device it was loaded on.
+        CTranslate2 models cannot be moved to any other device.
+
+        Args:
+            device (Union[str, torch.device]): "cpu" or the device the model was loaded on.
+
+        Returns:
+            FasterWhisperTranscriber: The transcriber itself.
+        """
+        model = self.model.model
+        if str(device).split(":")[0] == "cpu" and model.device != "cpu":
+            model.unload_model(to_cpu=True)
+        elif not model.model_is_loaded:
+            model.load_model()
+
+        return self
+
+    @staticmethod
+    def _to_numpy(audio: Union[Tensor, ndarray]) -> ndarray:
+        if isinstance(audio, Tensor):
+            audio = audio.cpu().numpy()
+        return audio
+
     @classmethod
     def load_model(cls,
                    model: str = "medium",
                    download_root: str = WHISPER_DEFAULT_PATH,
                    device: Optional[Union[str, device]] = SCRAIBE_TORCH_DEVICE,
                    *args, **kwargs
-                   ) -> 'FasterWhisperModel':
+                   ) -> 'FasterWhisperTranscriber':
         """
         Load whisper model.
 
@@ -339,6 +875,8 @@ class FasterWhisperTranscriber(Transcriber):
             Transcriber: A Transcriber object initialized with the specified model.
         """
 
+        from faster_whisper import WhisperModel as FasterWhisperModel
+
         if not isinstance(device, str):
             device = str(device)
             
@@ -361,6 +899,8 @@ class FasterWhisperTranscriber(Transcriber):
         Returns:
             dict: Keyword arguments for whisper model.
         """
+        from faster_whisper import WhisperModel as FasterWhisperModel
+
         # _possible_kwargs = WhisperModel.transcribe.__code__.co_varnames
         _possible_kwargs = signature(FasterWhisperModel.transcribe).parameters.keys()
 
@@ -387,7 +927,9 @@ class FasterWhisperTranscriber(Transcriber):
         Returns:
             language (str) code of language 
         """
-        
+        from faster_whisper.tokenizer import _LANGUAGE_CODES as FASTER_WHISPER_LANGUAGE_CODES
+        from whisper.tokenizer import TO_LANGUAGE_CODE
+
         # If the input is already in FASTER_WHISPER_LANGUAGE_CODES, return it directly
         if lang in FASTER_WHISPER_LANGUAGE_CODES:
             return lang
@@ -459,3 +1001,20 @@ def load_transcriber(model: str = "medium",
     else:
         raise ValueError(f'Model type not recognized, exptected "whisper" '
                          f'or "faster-whisper", got {whisper_type}.')
+
+
+# constants re-exported from whisper, imported on first access so that
+# importing this module does not import whisper
+_WHISPER_ATTRIBUTES = {"N_FRAMES": "whisper.audio",
+                       "N_SAMPLES": "whisper.audio",
+                       "TO_LANGUAGE_CODE": "whisper.tokenizer"}
+
+
+def __getattr__(name: str):
+    module = _WHISPER_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
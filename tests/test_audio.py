@@ -1,6 +1,8 @@
 import pytest
-from scraibe.audio import AudioProcessor
+import wave
+from scraibe.audio import AUDIO_DECODERS, AudioProcessor, AudioCache, AudioPrefetcher
 import torch
+import numpy as np
 
 
 DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
@@ -94,3 +96,299 @@ def test_audio_processor_SAMPLE_RATE():
     """
     probe_audio_processor = AudioProcessor(TEST_WAVEFORM)
     assert probe_audio_processor.sr == SAMPLE_RATE
+
+
+def test_load_audio_stream():
+    """Test the streaming decode mode of the load_audio function.
+
+    This test verifies that decoding an audio file in chunks into a preallocated buffer
+    yields the same float32 waveform as the default decode, and that the chunks returned by
+    iter_audio concatenate to the same waveform.
+
+    Returns:
+           None
+    """
+    expected, sr = AudioProcessor.load_audio('tests/audio_test_2.mp4')
+    streamed, streamed_sr = AudioProcessor.load_audio('tests/audio_test_2.mp4',
+                                                      stream=True, chunk_size=4096)
+    chunks = list(AudioProcessor.iter_audio('tests/audio_test_2.mp4', chunk_size=4096))
+
+    assert streamed_sr == sr
+    assert streamed.dtype == np.float32
+    assert np.array_equal(streamed, expected)
+    assert all(len(chunk) <= 4096 for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks), expected)
+
+
+def test_audio_cache(tmp_path):
+    """Test the on-disk audio cache.
+
+    This test verifies that a decoded audio file is stored in the cache on the first load and
+    returned as a memory map on the second load, with an unchanged waveform. It also checks that
+    entries are evicted once the cache exceeds its size budget.
+
+    Args:
+        tmp_path (Path): Temporary directory provided by pytest.
+
+    Returns:
+           None
+    """
+    cache = AudioCache(cache_dir=str(tmp_path))
+    key = cache.key('tests/audio_test_2.mp4', SAMPLE_RATE)
+    assert cache.load(key) is None
+
+    first = AudioProcessor.from_file('tests/audio_test_2.mp4', cache=cache)
+    cached = cache.load(key)
+    second = AudioProcessor.from_file('tests/audio_test_2.mp4', cache=cache)
+
+    assert isinstance(cached, np.memmap)
+    assert torch.equal(first.waveform, second.waveform)
+
+    cache.max_bytes = 0
+    cache.evict()
+    assert cache.load(key) is None
+
+
+def test_cut_many(probe_audio_processor):
+    """Test the cut_many function of the AudioProcessor class.
+
+    This test verifies that cutting several segments at once returns the same segments as
+    repeated calls to cut, both as a list of views and as a zero-padded batch with lengths.
+
+    Args:
+        probe_audio_processor (obj): An instance of the AudioProcessor class to be tested.
+
+    Returns:
+           None
+    """
+    segments = [[0.5, 1.25], [4, 7], [9.5, 12]]
+    expected = [probe_audio_processor.cut(start, end) for start, end in segments]
+
+    views = probe_audio_processor.cut_many(segments)
+    batch, lengths = probe_audio_processor.cut_many(segments, pad=True)
+
+    assert all(torch.equal(view, exp) for view, exp in zip(views, expected))
+    assert batch.shape == (len(segments), max(len(exp) for exp in expected))
+    for row, length, exp in zip(batch, lengths, expected):
+        assert length == len(exp)
+        assert torch.equal(row[:length], exp)
+        assert not row[length:].any()
+
+
+@pytest.fixture
+def wav_file(tmp_path):
+    """Fixture for writing a mono 16-bit PCM WAV file at the default sample rate.
+
+    Returns:
+        str: Path to the WAV file.
+    """
+    path = str(tmp_path / 'test.wav')
+    pcm = (TEST_WAVEFORM.cpu().numpy() * (NORMALIZATION_FACTOR - 1)).astype(np.int16)
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(pcm.tobytes())
+    return path
+
+
+def test_in_process_decoder(wav_file):
+    """Test the in-process decoding of PCM WAV files.
+
+    This test verifies that a mono 16 kHz PCM WAV file is decoded without ffmpeg, that the
+    chosen backend is reported on the AudioProcessor, and that the waveform matches the
+    one decoded by ffmpeg.
+
+    Args:
+        wav_file (str): Path to a mono 16-bit PCM WAV file.
+
+    Returns:
+           None
+    """
+    processor = AudioProcessor.from_file(wav_file)
+    expected, _ = AudioProcessor.load_audio(wav_file, decoder='ffmpeg')
+
+    assert processor.decoder in ('soundfile', 'wave')
+    assert np.array_equal(processor.waveform.numpy(), expected)
+    assert np.array_equal(AudioProcessor.load_audio(wav_file, decoder='wave')[0], expected)
+    assert AudioProcessor.from_file('tests/audio_test_2.mp4').decoder == 'ffmpeg'
+
+    with pytest.raises(ValueError):
+        AudioProcessor.load_audio(wav_file, decoder='unknown')
+
+
+def test_audio_prefetcher(wav_file):
+    """Test the AudioPrefetcher class.
+
+    This test verifies that prefetched audio files are yielded as AudioProcessor objects in input
+    order, both with and without background decoding, and that loading errors are raised when the
+    failing file is reached.
+
+    Args:
+        wav_file (str): Path to a mono 16-bit PCM WAV file.
+
+    Returns:
+           None
+    """
+    files = [wav_file, 'tests/audio_test_2.mp4', wav_file]
+    expected = [AudioProcessor.from_file(file) for file in files]
+
+    for num_prefetch in (0, 2):
+        loaded = list(AudioPrefetcher(files, num_prefetch))
+        assert len(loaded) == len(files)
+        for processor, exp in zip(loaded, expected):
+            assert isinstance(processor, AudioProcessor)
+            assert torch.equal(processor.waveform, exp.waveform)
+
+    prefetched = iter(AudioPrefetcher([wav_file, 'non_existing_file.wav'], 2))
+    assert isinstance(next(prefetched), AudioProcessor)
+    with pytest.raises(RuntimeError):
+        next(prefetched)
+
+
+@pytest.mark.parametrize("dtype", [torch.int16, torch.float16])
+def test_compact_storage(dtype):
+    """Test the compact storage dtypes of the AudioProcessor class.
+
+    This test verifies that the waveform is kept in the requested storage dtype, while cut,
+    cut_many and float_waveform return float32 tensors close to the original waveform.
+
+    Args:
+        dtype (torch.dtype): The storage dtype to test.
+
+    Returns:
+           None
+    """
+    waveform = TEST_WAVEFORM.cpu()
+    processor = AudioProcessor(waveform, TEST_SR, dtype=dtype)
+    reference = AudioProcessor(waveform, TEST_SR)
+
+    assert processor.waveform.dtype == dtype
+    assert processor.float_waveform().dtype == torch.float32
+    assert torch.allclose(processor.float_waveform(), waveform, atol=1e-3)
+
+    cut = processor.cut(4, 7)
+    assert cut.dtype == torch.float32
+    assert torch.allclose(cut, reference.cut(4, 7), atol=1e-3)
+
+    batch, lengths = processor.cut_many([[0, 1], [2, 4]], pad=True)
+    assert batch.dtype == torch.float32
+    assert lengths.tolist() == [TEST_SR, 2 * TEST_SR]
+
+
+def test_int16_storage_is_lossless():
+    """Test that int16 storage keeps audio decoded from 16-bit PCM unchanged.
+
+    Returns:
+           None
+    """
+    expected = AudioProcessor.from_file('tests/audio_test_2.mp4')
+    processor = AudioProcessor.from_file('tests/audio_test_2.mp4', dtype='int16')
+
+    assert processor.waveform.dtype == torch.int16
+    assert torch.equal(processor.float_waveform(), expected.waveform)
+
+    with pytest.raises(ValueError):
+        AudioProcessor(TEST_WAVEFORM, TEST_SR, dtype='int8')
+
+
+@pytest.mark.parametrize("decoder, stream", [('soundfile', False), ('wave', False),
+                                             ('ffmpeg', False), ('ffmpeg', True)])
+def test_int16_decoding(wav_file, decoder, stream, monkeypatch):
+    """Test that int16 storage decodes straight to int16.
+
+    This test verifies that the decoders return the 16-bit PCM samples for int16 storage,
+    so the float32 waveform is never built, and that the samples match the float32 decode.
+
+    Args:
+        wav_file (str): Path to a mono 16-bit PCM WAV file.
+        decoder (str): Name of the decoder backend to test.
+        stream (bool): Whether ffmpeg's output is streamed.
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Returns:
+           None
+    """
+    decoded = []
+    backend = AUDIO_DECODERS[decoder]
+    monkeypatch.setitem(AUDIO_DECODERS, decoder,
+                        lambda *args, **kwargs: decoded.append(backend(*args, **kwargs)) or
+                        decoded[-1])
+
+    processor = AudioProcessor.from_file(wav_file, dtype='int16', decoder=decoder, stream=stream)
+    expected = AudioProcessor.from_file(wav_file, decoder=decoder, stream=stream)
+
+    assert [audio.dtype for audio in decoded] == [np.int16, np.float32]
+    assert processor.waveform.dtype == torch.int16
+    assert torch.equal(processor.float_waveform(), expected.waveform)
+
+
+def test_detect_speech():
+    """Test the voice activity detection of the AudioProcessor class.
+
+    This test verifies that detect_speech finds tones embedded in low-level noise, that
+    keep_regions only keeps the detected speech, and that map_segments maps times on the
+    shortened timeline back to the original one.
+
+    Returns:
+           None
+    """
+    t = torch.arange(10 * TEST_SR) / TEST_SR
+    waveform = torch.randn(len(t)) * 1e-4
+    for start, end in [(2, 4), (6, 7)]:
+        tone = slice(start * TEST_SR, end * TEST_SR)
+        waveform[tone] += 0.3 * torch.sin(2 * np.pi * 220 * t[tone])
+
+    processor = AudioProcessor(waveform, TEST_SR)
+    regions = processor.detect_speech(padding=0.1)
+
+    assert regions.shape == (2, 2)
+    assert np.allclose(regions, [[2, 4], [6, 7]], atol=0.15)
+
+    speech = processor.keep_regions(regions)
+    durations = regions[:, 1] - regions[:, 0]
+    assert len(speech.waveform) == round(durations.sum() * TEST_SR)
+
+    mapped = AudioProcessor.map_segments([[0, durations[0]], [durations[0], durations.sum()]],
+                                         regions)
+    assert np.allclose(mapped, regions)
+
+
+@pytest.mark.parametrize("decoder", ['wave', 'ffmpeg'])
+def test_partial_decoding(wav_file, decoder):
+    """Test decoding a time range of an audio file.
+
+    This test verifies that from_file only decodes the requested range, keeps the start time as
+    offset, and that cut still takes absolute file times.
+
+    Args:
+        wav_file (str): Path to a mono 16-bit PCM WAV file.
+        decoder (str): Name of the decoder backend to test.
+
+    Returns:
+           None
+    """
+    full = AudioProcessor.from_file(wav_file, decoder=decoder)
+    partial = AudioProcessor.from_file(wav_file, start=2, duration=3, decoder=decoder)
+
+    assert partial.offset == 2
+    assert len(partial.waveform) == 3 * TEST_SR
+    assert torch.equal(partial.cut(3, 4), full.cut(3, 4))
+    assert torch.equal(partial.cut_many([[2.5, 4.5]])[0], full.cut(2.5, 4.5))
+
+
+def test_cut_outside_partial_decode():
+    """Test cutting times outside a partial decode.
+
+    This test verifies that cut clamps to the decoded range instead of wrapping
+    around to the end of the buffer for times before the offset, like cut_many.
+
+    Returns:
+           None
+    """
+    audio = AudioProcessor(torch.arange(10 * TEST_SR, dtype=torch.float32), TEST_SR, offset=5.0)
+
+    assert len(audio.cut(0, 4)) == 0
+    assert len(audio.cut(0, 5.5)) == TEST_SR // 2
+    assert len(audio.cut(20, 30)) == 0
+    assert torch.equal(audio.cut(0, 4), audio.cut_many([[0, 4]])[0])
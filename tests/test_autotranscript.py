@@ -1,7 +1,11 @@
+import asyncio
 import pytest
-from scraibe import Scraibe, Diariser, Transcriber, Transcript
+import torch
+from scraibe import AudioProcessor, Scraibe, Diariser, Transcriber, Transcript
 import os
 
+from benchmarks.stubs import StubDiariser, StubTranscriber
+
 
 @pytest.fixture
 def create_scraibe_instance():
@@ -23,6 +27,101 @@ def test_scraibe_autotranscribe(create_scraibe_instance):
     assert isinstance(transcript, Transcript)
 
 
+def test_scraibe_autotranscribe_single_pass(create_scraibe_instance):
+    model = create_scraibe_instance
+    transcript = model.autotranscribe('tests/audio_test_2.mp4', single_pass=True)
+    assert isinstance(transcript, Transcript)
+
+
+def test_scraibe_iter_autotranscribe(create_scraibe_instance):
+    model = create_scraibe_instance
+    segments = list(model.iter_autotranscribe('tests/audio_test_2.mp4'))
+    assert segments
+    assert all(set(segment) == {"speakers", "segments", "text"} for segment in segments)
+    starts = [segment["segments"][0] for segment in segments]
+    assert starts == sorted(starts)
+
+
+def test_scraibe_aautotranscribe(create_scraibe_instance):
+    model = create_scraibe_instance
+    transcript = asyncio.run(model.aautotranscribe('tests/audio_test_2.mp4'))
+    assert isinstance(transcript, Transcript)
+    model.close()
+
+
+def test_aautotranscribe_per_call_state():
+    turns = [(0.0, 4.0, "A"), (4.2, 4.6, "B"), (4.8, 10.0, "A")]
+    model = Scraibe(StubTranscriber(latency=0.01), dia_model=StubDiariser(turns),
+                    max_concurrency=2)
+    audio = AudioProcessor(torch.zeros(10 * 16000))
+
+    async def run():
+        return await asyncio.gather(
+            model.aautotranscribe(audio, language="en", coalesce=True, verbose=True),
+            model.aautotranscribe(audio, language="en"))
+
+    coalesced, plain = asyncio.run(run())
+    assert coalesced.transcript.keys() == plain.transcript.keys()
+    # verbose only applied to its own call, the reports are stored afterwards
+    assert model.verbose is False
+    assert model.schedule_report["windows"] == 1
+
+    with pytest.raises(ValueError):
+        Scraibe(StubTranscriber(), dia_model=StubDiariser(turns),
+                max_concurrency=2, report_memory=True)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_cancelled_async_call_stores_reports(streaming):
+    turns = [(0.0, 4.0, "A"), (4.8, 10.0, "B")]
+    model = Scraibe(StubTranscriber(latency=0.2), dia_model=StubDiariser(turns))
+    audio = AudioProcessor(torch.zeros(10 * 16000))
+
+    async def run():
+        # the language is detected in the worker thread after the cancellation
+        if streaming:
+            task = asyncio.ensure_future(model.aiter_autotranscribe(audio).__anext__())
+        else:
+            task = asyncio.ensure_future(model.aautotranscribe(audio))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    model.close()
+    assert model.language_report["language"] == "en"
+
+
+def test_aiter_autotranscribe_failed_submit():
+    model = Scraibe(StubTranscriber(), dia_model=StubDiariser())
+    audio = AudioProcessor(torch.zeros(16000))
+
+    async def run():
+        model._get_async_executor()[0].shutdown()
+        return await model.aautotranscribe(audio, language="en")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+
+def test_assign_words():
+    segments = [[0.0, 2.0], [2.5, 5.0], [6.0, 8.0]]
+    words = [(0.0, 0.5, " a"), (1.8, 2.6, " b"), (2.3, 2.45, " c"),
+             (5.2, 5.4, " d"), (5.7, 5.9, " e"), (7.0, 9.0, " f")]
+    assert Scraibe.assign_words(words, segments) == [" a b", " c d", " e f"]
+    assert Scraibe.assign_words([], segments) == ["", "", ""]
+
+
+def test_assign_words_nested_segments():
+    segments = [[0.0, 100.0], [10.0, 11.0], [20.0, 21.0], [30.0, 31.0], [99.0, 105.0]]
+    words = [(50.0, 51.0, " w"), (10.2, 10.8, " x"), (20.5, 22.0, " y"),
+             (30.0, 30.2, " z"), (104.0, 104.5, " v"), (106.0, 107.0, " u")]
+    assert Scraibe.assign_words(words, segments) == [" w y", " x", "", " z", " v u"]
+    # unsorted segments keep their order in the result
+    assert Scraibe.assign_words([(50.0, 51.0, " w")], [[10.0, 11.0], [0.0, 100.0]]) == ["", " w"]
+
+
 def test_scraibe_diarization(create_scraibe_instance):
     model = create_scraibe_instance
     diarisation_result = model.diarization('tests/audio_test_2.mp4')
@@ -0,0 +1,27 @@
+import json
+
+from benchmarks.run import main
+from benchmarks.synthetic import synthetic_audio
+
+
+def test_synthetic_audio():
+    waveform, turns = synthetic_audio(20.0, num_speakers=3, seed=1)
+    again, _ = synthetic_audio(20.0, num_speakers=3, seed=1)
+
+    assert waveform.shape == (20 * 16000,)
+    assert waveform.equal(again)
+    assert all(end <= 20.0 for _, end, _ in turns)
+    assert all(a[2] != b[2] for a, b in zip(turns, turns[1:]))
+
+
+def test_benchmark_run(tmp_path):
+    path = str(tmp_path / "results.json")
+    main(["--durations", "10", "--repeat", "1", "--output", path,
+          "--benchmarks", "format_diarization_output", "autotranscribe_batch"])
+
+    with open(path) as f:
+        results = json.load(f)
+
+    assert [r["name"] for r in results["results"]] == ["format_diarization_output",
+                                                      "autotranscribe_batch"]
+    assert "transcribe_batch" in results["results"][1]["stages"]
@@ -0,0 +1,71 @@
+import subprocess
+import sys
+import wave
+
+import numpy as np
+import pytest
+import torch
+from scraibe import AudioProcessor, Scraibe, process_file, run_workers
+
+from benchmarks.stubs import StubDiariser, StubTranscriber
+
+OPTIONS = dict(task="transcribe", language="en", verbose=False, num_speakers=2,
+               vad=False, batch_size=1, single_pass=False, coalesce=False, journal=False)
+
+
+def _write_wav(path, seconds=2.0, sr=16000):
+    samples = (np.sin(np.arange(int(seconds * sr)) / 10) * 8000).astype(np.int16)
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sr)
+        f.writeframes(samples.tobytes())
+
+
+def test_run_workers(tmp_path, capsys):
+    files = []
+    for i in range(4):
+        files.append(str(tmp_path / f"audio_{i}.wav"))
+        _write_wav(files[-1])
+    broken = tmp_path / "broken.wav"
+    broken.write_bytes(b"not audio")
+    files.insert(2, str(broken))
+
+    class_kwargs = dict(whisper_model=StubTranscriber(latency=0.5),
+                        dia_model=StubDiariser(latency=0.5))
+    results = run_workers(files, 2, class_kwargs, 2, "autotranscribe", OPTIONS,
+                          dict(start=None, duration=None), str(tmp_path), "txt")
+
+    assert sorted(result["file"] for result in results) == sorted(files)
+    assert [result["file"] for result in results if result["error"]] == [str(broken)]
+    # the files are split between both workers
+    assert len({result["worker"] for result in results}) == 2
+    assert all((tmp_path / f"audio_{i}.txt").exists() for i in range(4))
+
+    out = capsys.readouterr().out
+    assert "Processed 4/5 files with 2 workers and 1 threads each" in out
+    assert f"failed: {broken}" in out
+
+
+def test_cli_workers_exit_code(tmp_path):
+    result = subprocess.run([sys.executable, "-m", "scraibe.cli",
+                             "-f", str(tmp_path / "missing_1.wav"), str(tmp_path / "missing_2.wav"),
+                             "--workers", "2", "-o", str(tmp_path), "--verbose-output", "False"],
+                            capture_output=True, text=True, timeout=300)
+
+    assert result.returncode == 1
+    assert "Processed 0/2 files with 2 workers" in result.stdout
+
+
+def test_process_file_diarization_options(tmp_path):
+    model = Scraibe(StubTranscriber(), dia_model=StubDiariser())
+    audio_file = AudioProcessor(torch.zeros(3 * 16000))
+
+    process_file(model, "audio.wav", audio_file, "diarization",
+                 dict(diarisation_window=None, diarisation_overlap=0.2), str(tmp_path), "json")
+    assert (tmp_path / "audio.json").exists()
+
+    # the window options reach the diariser, which cannot stitch windows without embeddings
+    with pytest.raises(ValueError, match="speaker embeddings"):
+        process_file(model, "audio.wav", audio_file, "diarization",
+                     dict(diarisation_window=1.0, diarisation_overlap=0.2), str(tmp_path), "json")
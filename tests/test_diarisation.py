@@ -1,4 +1,11 @@
+import os
+
+import numpy as np
 import pytest
+import torch
+import yaml
+from pyannote.audio import Pipeline
+
 from scraibe import Diariser
 
 
@@ -30,3 +37,138 @@ def test_Diariser_init(diariser_instance):
            None
     """
     assert diariser_instance.model == 'pyannote'
+
+
+class DummyPipeline(Pipeline):
+    """Pipeline without models, loadable from a config file."""
+
+    def __init__(self, segmentation=None, use_auth_token=None):
+        super().__init__()
+        self.segmentation = segmentation
+
+
+def _write_config(path, segmentation):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        yaml.safe_dump({"pipeline": {"name": f"{__name__}.DummyPipeline",
+                                     "params": {"segmentation": segmentation}}}, f)
+
+
+def test_load_model_from_cache_offline(tmp_path):
+    """A cached repository is loaded without network access, the first cached one wins."""
+    snapshot = tmp_path / "models--pyannote--speaker-diarization-3.1" / "snapshots" / "abc"
+    _write_config(str(snapshot / "config.yaml"), "pyannote/segmentation-3.0")
+    (tmp_path / "models--pyannote--speaker-diarization-3.1" / "refs").mkdir()
+    (tmp_path / "models--pyannote--speaker-diarization-3.1" / "refs" / "main").write_text("abc")
+
+    model = ("Jaikinator/ScrAIbe", "pyannote/speaker-diarization-3.1")
+    diariser = Diariser.load_model(model, cache_dir=str(tmp_path), device="cpu", offline=True)
+
+    assert isinstance(diariser.model, DummyPipeline)
+    assert diariser.model_name == "pyannote/speaker-diarization-3.1"
+    # the loaded model is described by its files, like before it is loaded
+    assert diariser.config() == Diariser.describe(model, cache_dir=str(tmp_path))
+    assert diariser.config()["model_name"] == "pyannote/speaker-diarization-3.1"
+
+    with pytest.raises(FileNotFoundError):
+        Diariser.load_model(model, cache_dir=str(tmp_path / "empty"), offline=True)
+
+
+def test_load_model_from_cache_downloads_with_token(tmp_path, monkeypatch):
+    """A model missing from a cached config is downloaded with the caller's token."""
+    snapshot = tmp_path / "models--pyannote--speaker-diarization-3.1" / "snapshots" / "abc"
+    _write_config(str(snapshot / "config.yaml"), "pyannote/segmentation-3.0")
+    (tmp_path / "models--pyannote--speaker-diarization-3.1" / "refs").mkdir()
+    (tmp_path / "models--pyannote--speaker-diarization-3.1" / "refs" / "main").write_text("abc")
+
+    from_pretrained, tokens = Pipeline.from_pretrained.__func__, []
+
+    def fake_from_pretrained(cls, *args, use_auth_token=None, **kwargs):
+        tokens.append(use_auth_token)
+        # the first attempt reads the cache only and misses the segmentation model
+        if len(tokens) == 1:
+            raise OSError("pyannote/segmentation-3.0 is not cached")
+        return from_pretrained(cls, *args, use_auth_token=use_auth_token, **kwargs)
+
+    monkeypatch.setattr(Pipeline, "from_pretrained", classmethod(fake_from_pretrained))
+    model = ("Jaikinator/ScrAIbe", "pyannote/speaker-diarization-3.1")
+    with pytest.warns(UserWarning):
+        diariser = Diariser.load_model(model, use_auth_token="hf_token",
+                                       cache_dir=str(tmp_path), device="cpu")
+
+    assert isinstance(diariser.model, DummyPipeline)
+    assert tokens == ["hf_token", "hf_token"]
+
+
+def test_load_model_keeps_config_file(tmp_path):
+    """A missing segmentation model is found nearby without rewriting the config."""
+    config = tmp_path / "config.yaml"
+    _write_config(str(config), str(tmp_path / "missing.bin"))
+    (tmp_path / "pytorch_model.bin").write_bytes(b"")
+    before = config.read_text()
+
+    with pytest.warns(UserWarning):
+        diariser = Diariser.load_model(str(config), device="cpu", offline=True)
+
+    assert diariser.model.segmentation == str(tmp_path / "pytorch_model.bin")
+    assert config.read_text() == before
+
+
+class LevelPipeline:
+    """Reads the speaker from the signal level, labels speakers per call in order of
+    appearance and returns one-hot speaker embeddings, like a pipeline per window."""
+
+    frame = 0.25
+
+    def __call__(self, audio, return_embeddings=False, **kwargs):
+        from pyannote.core import Annotation, Segment
+
+        hop = int(self.frame * audio["sample_rate"])
+        speakers = (audio["waveform"][0, ::hop] * 10).round().int().tolist()
+        annotation, local = Annotation(), {}
+        for i, speaker in enumerate(speakers):
+            if speaker > 0:
+                label = local.setdefault(speaker, f"LOCAL_{len(local)}")
+                annotation[Segment(i * self.frame, (i + 1) * self.frame)] = label
+        annotation = annotation.support()
+        if not return_embeddings:
+            return annotation
+
+        embeddings = {label: np.eye(8)[speaker] + 0.1 for speaker, label in local.items()}
+        return annotation, np.array([embeddings[label] for label in annotation.labels()])
+
+
+def _level_audio(turns, sr=100):
+    waveform = torch.zeros(1, int(turns[-1][1] * sr))
+    for start, end, speaker in turns:
+        waveform[0, int(start * sr):int(end * sr)] = 0.1 * speaker
+    return {"waveform": waveform, "sample_rate": sr}
+
+
+def test_windowed_diarization_stitches_speakers():
+    """Windows reconcile their speakers by embedding, the output equals a single pass."""
+    turns = [(i * 7.0, i * 7.0 + 6.0, [1, 2, 3, 2][i % 4]) for i in range(15)]
+    audio = _level_audio(turns)
+    diariser = Diariser(LevelPipeline())
+
+    whole = diariser.diarization(audio)
+    windowed = diariser.diarization(audio, diarisation_window=30, diarisation_overlap=6)
+
+    assert len(windowed["segments"]) == len(turns)
+    assert windowed["segments"] == whole["segments"]
+    assert len(set(windowed["speakers"])) == 3
+    assert [windowed["speakers"].index(s) for s in windowed["speakers"]] == \
+        [whole["speakers"].index(s) for s in whole["speakers"]]
+
+
+def test_windowed_diarization_merges_to_num_speakers():
+    """With a threshold that splits every window, num_speakers merges them again."""
+    turns = [(i * 5.0, i * 5.0 + 4.0, 1 + i % 2) for i in range(12)]
+    diariser = Diariser(LevelPipeline())
+    kwargs = dict(diarisation_window=20, diarisation_overlap=4, speaker_threshold=-1)
+
+    split = diariser.diarization(_level_audio(turns), **kwargs)
+    merged = diariser.diarization(_level_audio(turns), num_speakers=2, **kwargs)
+
+    assert len(set(split["speakers"])) > 2
+    assert merged["speakers"] == ["SPEAKER_00", "SPEAKER_01"] * 6
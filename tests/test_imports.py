@@ -0,0 +1,26 @@
+import pytest
+
+from benchmarks.import_time import ENTRY_POINTS, measure
+
+
+@pytest.mark.parametrize("entry_point", ["import scraibe",
+                                         "from scraibe import Transcript",
+                                         "scraibe --help",
+                                         "from scraibe.transcriber import Transcriber",
+                                         "from scraibe import Scraibe"])
+def test_lightweight_imports(entry_point):
+    result = measure(entry_point)
+
+    assert result["modules"] == list(ENTRY_POINTS[entry_point])
+
+
+def test_lazy_attributes():
+    import scraibe
+
+    assert "Scraibe" in dir(scraibe)
+    assert callable(scraibe.run_workers)
+    assert scraibe.N_SAMPLES == 480000 and scraibe.TO_LANGUAGE_CODE["german"] == "de"
+    # the other names of the cli module do not shadow the function by the submodule
+    assert callable(scraibe.cli)
+    with pytest.raises(AttributeError):
+        scraibe.NotAnAttribute
@@ -0,0 +1,99 @@
+import json
+import time
+import wave
+
+import numpy as np
+import pytest
+import torch
+
+from scraibe import NULL_TIMER, AudioProcessor, Scraibe, StageTimer, TimingCollector
+
+from benchmarks.stubs import StubDiariser, StubTranscriber
+
+
+def test_stage_timer_without_observers():
+    with StageTimer("vad") as stage:
+        stage.audio_seconds = 1.0
+    # a timer without observers never reads the clocks
+    assert not hasattr(stage, "_wall")
+
+
+def test_timing_collector():
+    timings = TimingCollector()
+
+    for _ in range(2):
+        with StageTimer("transcribe", audio_seconds=2.0, observers=[timings]):
+            sum(range(10000))
+    with StageTimer("transcript", observers=[timings]):
+        pass
+
+    stages = timings.to_dict()
+    assert list(stages) == ["transcribe", "transcript"]
+    assert stages["transcribe"]["calls"] == 2
+    assert stages["transcribe"]["audio_seconds"] == 4.0
+    assert stages["transcribe"]["rtf"] == pytest.approx(stages["transcribe"]["wall_time"] / 4.0)
+    assert stages["transcript"]["rtf"] is None
+
+    other = TimingCollector()
+    other.merge(stages)
+    assert other.to_dict()["transcribe"]["calls"] == 2
+
+    timings.reset()
+    assert timings.to_dict() == {}
+
+
+def test_timing_collector_to_json(tmp_path):
+    timings = TimingCollector()
+    timings("diarization", 1.5, 1.0, 3.0)
+
+    path = tmp_path / "timings.json"
+    text = timings.to_json(str(path))
+
+    assert json.loads(path.read_text()) == json.loads(text)
+    assert json.loads(text)["diarization"]["rtf"] == 0.5
+
+
+def test_prefetch_times_decoding(tmp_path):
+    files = [str(tmp_path / f"audio_{i}.wav") for i in range(2)]
+    for file in files:
+        with wave.open(file, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(16000)
+            f.writeframes(np.zeros(32000, dtype=np.int16).tobytes())
+
+    timings = TimingCollector()
+    model = Scraibe(StubTranscriber(), dia_model=StubDiariser(), observers=[timings])
+    for audio_file in model.prefetch(files):
+        model.autotranscribe(audio_file, language="en")
+
+    # each file is timed once, when it is decoded, not again by autotranscribe
+    assert timings.to_dict()["load_audio"]["calls"] == 2
+    assert timings.to_dict()["load_audio"]["audio_seconds"] == 4.0
+
+
+def test_model_load_is_timed_with_its_stage(monkeypatch):
+    def load_transcriber(*args, **kwargs):
+        time.sleep(0.2)
+        return StubTranscriber()
+
+    monkeypatch.setattr("scraibe.autotranscript.load_transcriber", load_transcriber)
+    timings = TimingCollector()
+    model = Scraibe("tiny", dia_model=StubDiariser(), device="cpu", observers=[timings])
+    model.transcribe(AudioProcessor(torch.zeros(16000)), language="en")
+
+    assert timings.to_dict()["transcribe"]["wall_time"] >= 0.2
+
+
+def test_load_audio_without_observers(tmp_path):
+    file = str(tmp_path / "audio.wav")
+    with wave.open(file, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(16000)
+        f.writeframes(np.zeros(32000, dtype=np.int16).tobytes())
+
+    model = Scraibe(StubTranscriber(), dia_model=StubDiariser())
+    model.autotranscribe(file, language="en")
+    # the shared timer keeps no state of a call
+    assert NULL_TIMER.audio_seconds == 0.0
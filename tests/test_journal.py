@@ -0,0 +1,103 @@
+import pytest
+import torch
+from scraibe import AudioProcessor, Journal, Scraibe
+
+from benchmarks.stubs import StubDiariser, StubTranscriber
+
+
+def test_journal_resume(tmp_path):
+    path = str(tmp_path / "audio.journal.jsonl")
+    key = Journal.key(torch.zeros(16000), language="en")
+
+    journal = Journal(path)
+    state = journal.resume(key)
+    assert state == {"diarisation": None, "language": None, "segments": {}}
+
+    journal.write("diarisation", segments=[[0.0, 1.0], [1.0, 2.0]], speakers=["A", "B"])
+    journal.write("segment", id=0, text=" Hello.")
+    journal.close()
+
+    state = Journal(path).resume(key)
+    assert state["diarisation"] == {"segments": [[0.0, 1.0], [1.0, 2.0]],
+                                    "speakers": ["A", "B"]}
+    assert state["segments"] == {0: " Hello."}
+
+
+def test_journal_key():
+    waveform = torch.linspace(-1, 1, 32000)
+    key = Journal.key(waveform[::2], language="en")
+    # the samples are hashed, not their layout in memory
+    assert key == Journal.key(waveform[::2].clone(), language="en")
+    assert key != Journal.key(waveform[1::2], language="en")
+    assert Journal.key(waveform.to(torch.float16)) != Journal.key(waveform)
+
+
+def test_journal_other_run(tmp_path):
+    path = str(tmp_path / "audio.journal.jsonl")
+
+    with Journal(path) as journal:
+        journal.resume(Journal.key(torch.zeros(16000), language="en"))
+        journal.write("segment", id=0, text=" Hello.")
+
+    with Journal(path) as journal:
+        state = journal.resume(Journal.key(torch.zeros(16000), language="de"))
+    assert state["segments"] == {}
+
+
+def test_journal_incomplete_line(tmp_path):
+    path = str(tmp_path / "audio.journal.jsonl")
+    key = Journal.key(torch.zeros(16000))
+
+    with Journal(path) as journal:
+        journal.resume(key)
+        journal.write("segment", id=0, text=" Hello.")
+
+    with open(path, "a") as f:
+        f.write('{"type": "segment", "id": 1, "te')
+
+    with Journal(path) as journal:
+        assert journal.resume(key)["segments"] == {0: " Hello."}
+        journal.write("segment", id=1, text=" World.")
+
+    with Journal(path) as journal:
+        assert journal.resume(key)["segments"] == {0: " Hello.", 1: " World."}
+
+
+def test_resume_skips_diarisation(tmp_path):
+    path = str(tmp_path / "audio.journal.jsonl")
+    audio = AudioProcessor(torch.zeros(10 * 16000))
+    turns = [(0.0, 4.0, "A"), (4.5, 10.0, "B")]
+
+    model = Scraibe(StubTranscriber(), dia_model=StubDiariser(turns))
+    first = model.autotranscribe(audio, language="en", journal=path)
+
+    model = Scraibe(StubTranscriber(), dia_model=StubDiariser(turns))
+    built = []
+    diarisation_audio = model._diarisation_audio
+    model._diarisation_audio = lambda *args, **kwargs: built.append(1) or \
+        diarisation_audio(*args, **kwargs)
+    second = model.autotranscribe(audio, language="en", journal=path)
+
+    assert not built
+    assert second.transcript == first.transcript
+
+
+@pytest.mark.parametrize("changed", ["transcriber", "diariser"])
+def test_resume_with_other_model_starts_over(tmp_path, changed):
+    path = str(tmp_path / "audio.journal.jsonl")
+    audio = AudioProcessor(torch.zeros(10 * 16000))
+    turns = [(0.0, 4.0, "A"), (4.5, 10.0, "B")]
+
+    Scraibe(StubTranscriber(), dia_model=StubDiariser(turns)).autotranscribe(
+        audio, language="en", journal=path)
+
+    models = dict(transcriber=StubTranscriber(), diariser=StubDiariser(turns))
+    models[changed].model_name = "other"
+    model = Scraibe(models["transcriber"], dia_model=models["diariser"])
+    built = []
+    diarisation_audio = model._diarisation_audio
+    model._diarisation_audio = lambda *args, **kwargs: built.append(1) or \
+        diarisation_audio(*args, **kwargs)
+    model.autotranscribe(audio, language="en", journal=path)
+
+    assert built
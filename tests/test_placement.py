@@ -0,0 +1,109 @@
+import pytest
+
+from scraibe.placement import LazyModel, ModelPlacement
+
+
+class Model:
+    def __init__(self, model=True):
+        self.model = object() if model else None
+        self.device = "cpu"
+
+    def to(self, device):
+        self.device = device
+        return self
+
+
+def test_placement_unload():
+    placement = ModelPlacement("unload", device="cpu")
+    diariser, transcriber = LazyModel(Model(False)), LazyModel(Model(False))
+    diariser.instance = Model()
+    placement.register("diariser", diariser, loader=Model)
+    placement.register("transcriber", transcriber, loader=Model)
+
+    placement.activate("diarization")
+    assert diariser.instance is not None and transcriber.instance is None
+
+    placement.activate("transcribe_batch")
+    assert diariser.instance is None and transcriber.instance is not None
+    assert placement.report["loads"] == {"transcriber": 1}
+
+    with placement.pinned():
+        placement.activate("diarization")
+    assert diariser.instance is not None and transcriber.instance is not None
+
+
+def test_placement_cpu():
+    placement = ModelPlacement("cpu", device="cuda")
+    diariser, transcriber = Model(), LazyModel(Model(False))
+    transcriber.instance = Model()
+    placement.register("diariser", diariser)
+    placement.register("transcriber", transcriber, loader=Model)
+
+    placement.activate("transcribe")
+    assert diariser.device == "cpu"
+
+    placement.activate("diarization")
+    assert diariser.device == "cuda" and transcriber.device == "cpu"
+    assert transcriber.instance is not None
+
+
+def test_placement_report():
+    placement = ModelPlacement()
+    placement.activate("vad")
+    placement("vad", 0.1, 0.1, 1.0)
+
+    assert set(placement.report["stages"]["vad"]) == {"rss_mb", "peak_rss_mb"}
+
+    with pytest.raises(ValueError):
+        ModelPlacement("swap")
+
+
+def test_placement_lazy():
+    placement = ModelPlacement(device="cpu", track_memory=False)
+    transcriber = LazyModel(Model(False))
+    placement.register("transcriber", transcriber, loader=Model)
+    assert not placement.was_loaded("transcriber")
+    with pytest.raises(TypeError):
+        placement.register("diariser", Model(), loader=Model)
+
+    placement.activate("transcribe")
+    assert placement.was_loaded("transcriber") and transcriber.instance is not None
+    assert placement.report["loads"] == {"transcriber": 1}
+
+
+def test_scraibe_lazy_warmup():
+    from benchmarks.stubs import StubTranscriber
+    from scraibe import Scraibe
+
+    model = Scraibe(StubTranscriber(), dia_model="pyannote/speaker-diarization-3.1",
+                    device="cpu")
+    assert model.diariser.instance is None
+    assert model.memory_report is None
+
+    seconds = model.warmup(diarization=False)
+    assert set(seconds) == {"transcribe"}
+    assert model.diariser.instance is None
+
+
+def test_lazy_models_load_on_direct_use(monkeypatch):
+    import torch
+    from benchmarks.stubs import StubDiariser, StubTranscriber
+    from scraibe import Diariser, Scraibe
+
+    monkeypatch.setattr("scraibe.autotranscript.load_transcriber",
+                        lambda *args, **kwargs: StubTranscriber())
+    monkeypatch.setattr(Diariser, "load_model",
+                        classmethod(lambda cls, *args, **kwargs: StubDiariser()))
+    model = Scraibe("tiny", dia_model="pyannote/speaker-diarization-3.1", device="cpu")
+
+    # methods that do not need the weights leave the models unloaded
+    model.transcriber._get_whisper_kwargs(language="en")
+    model.diariser.config()
+    assert model.transcriber.instance is None and model.diariser.instance is None
+
+    assert model.transcriber.transcribe(torch.zeros(16000)).strip()
+    diarisation = model.diariser.diarization({"waveform": torch.zeros(1, 16000),
+                                              "sample_rate": 16000})
+    assert diarisation["speakers"] == ["SPEAKER_00"]
+    assert model.diariser.model is not None
+    assert model.placement.report["loads"] == {"transcriber": 1, "diariser": 1}
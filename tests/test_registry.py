@@ -0,0 +1,109 @@
+import pytest
+from torch import nn
+
+from scraibe.placement import LazyModel, ModelPlacement
+from scraibe.registry import ModelRegistry
+
+
+class Model:
+    def __init__(self, size=256):
+        self.model = nn.Linear(size, size, bias=False)
+
+
+def test_registry_shares_and_counts_references():
+    registry = ModelRegistry(max_bytes=0)
+    key = ModelRegistry.key("transcriber", model="tiny", device="cpu", compute_type=None)
+    assert key == ModelRegistry.key("transcriber", device="cpu", model="tiny")
+
+    first = registry.acquire(key, Model)
+    second = registry.acquire(key, Model)
+    assert first is second
+    assert registry.loads["transcriber"] == 1 and registry.hits["transcriber"] == 1
+    assert registry.report()["models"][0]["refs"] == 2
+
+    registry.release(key)
+    assert len(registry) == 1
+    registry.release(key)
+    assert len(registry) == 0 and registry.evictions == 1
+
+
+def test_registry_evicts_least_recently_used():
+    size = 256 * 256 * 4
+    registry = ModelRegistry(max_bytes=2 * size)
+    keys = [ModelRegistry.key("transcriber", model=name) for name in "abc"]
+
+    for key in keys[:2]:
+        registry.acquire(key, Model)
+        registry.release(key)
+    # "a" is used again, so "b" is the least recently used
+    registry.acquire(keys[0], Model)
+    registry.release(keys[0])
+    registry.acquire(keys[2], Model)
+
+    assert [model["model"] for model in registry.report()["models"]] == ["a", "c"]
+    assert registry.resident_bytes() == 2 * size
+
+
+def test_registry_recovers_from_failed_load():
+    registry = ModelRegistry()
+    key = ModelRegistry.key("transcriber", model="tiny")
+
+    def fail():
+        raise OSError("no such model")
+
+    with pytest.raises(OSError):
+        registry.acquire(key, fail)
+    assert not registry._loading and len(registry) == 0
+
+    model = registry.acquire(key, Model)
+    assert registry.acquire(key, Model) is model
+    assert registry.loads["transcriber"] == 1
+
+
+def test_placement_releases_shared_models():
+    registry = ModelRegistry(max_bytes=0)
+    key = ModelRegistry.key("transcriber", model="tiny")
+    placement = ModelPlacement("unload", device="cpu", track_memory=False)
+    unloaded = Model()
+    unloaded.model = None
+    transcriber, diariser = LazyModel(unloaded), LazyModel(unloaded)
+    diariser.instance = Model()
+    placement.register("transcriber", transcriber, lambda: registry.acquire(key, Model),
+                       release=lambda: registry.release(key))
+    placement.register("diariser", diariser, loader=Model)
+
+    placement.activate("transcribe")
+    assert transcriber.instance is not None and len(registry) == 1
+
+    placement.activate("diarization")
+    assert transcriber.instance is None and len(registry) == 0
+
+
+def test_update_transcriber_balances_references(monkeypatch):
+    from benchmarks.stubs import StubDiariser, StubTranscriber
+    from scraibe import Scraibe
+
+    monkeypatch.setattr("scraibe.autotranscript.load_transcriber",
+                        lambda *args, **kwargs: StubTranscriber())
+    registry = ModelRegistry(max_bytes=None)
+    first, second = (Scraibe("tiny", dia_model=StubDiariser(), registry=registry, device="cpu")
+                     for _ in range(2))
+    for model in (first, second):
+        model.warmup(diarization=False)
+
+    def refs():
+        return {model["model"]: model["refs"] for model in registry.report()["models"]}
+
+    # the wrapper is shared, not copied
+    assert first.transcriber.instance is second.transcriber.instance
+    assert refs() == {"tiny": 2}
+
+    first.update_transcriber("base")
+    first.update_transcriber("base")
+    assert refs() == {"tiny": 1, "base": 1}
+    assert first.placement.report["loads"] == {"transcriber": 3}
+
+    first.close()
+    second.close()
+    assert refs() == {"tiny": 0, "base": 0}
+    assert first.transcriber.instance is None and first.transcriber.model_name == "base"
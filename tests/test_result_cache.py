@@ -0,0 +1,92 @@
+import pytest
+import torch
+from scraibe import AudioProcessor, ResultCache, Scraibe
+
+from benchmarks.stubs import StubDiariser, StubTranscriber
+
+
+@pytest.fixture
+def audio_file():
+    return AudioProcessor(torch.linspace(-1, 1, 16000))
+
+
+def test_result_cache_store_and_load(tmp_path, audio_file):
+    cache = ResultCache(str(tmp_path))
+    key = ResultCache.key("diarisation", ResultCache.audio_key(audio_file), model="a")
+    diarisation = {"segments": [[0.0, 1.0]], "speakers": ["SPEAKER_00"]}
+
+    assert cache.load(key) is None
+    cache.store(key, diarisation)
+    assert cache.load(key) == diarisation
+    assert cache.stats()["hits"] == {"diarisation": 1}
+    assert cache.stats()["misses"] == {"diarisation": 1}
+
+
+def test_result_cache_failed_store(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+
+    with pytest.raises(TypeError):
+        cache.store("transcript_a", {"text": object()})
+    assert list(tmp_path.iterdir()) == []
+
+    # failing to remove the temporary file does not hide the error of the write
+    def remove(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr("scraibe.disk_cache.os.remove", remove)
+    with pytest.raises(TypeError):
+        cache.store("transcript_a", {"text": object()})
+
+
+def test_result_cache_key(audio_file):
+    audio_key = ResultCache.audio_key(audio_file)
+    assert audio_key == ResultCache.audio_key(AudioProcessor(audio_file.waveform.clone()))
+    assert audio_key != ResultCache.audio_key(AudioProcessor(audio_file.waveform * 0.5))
+
+    key = ResultCache.key("transcript", audio_key, model="tiny", language="en")
+    assert key == ResultCache.key("transcript", audio_key, language="en", model="tiny")
+    assert key != ResultCache.key("transcript", audio_key, model="medium", language="en")
+    assert key != ResultCache.key("diarisation", audio_key, model="tiny", language="en")
+
+    with pytest.raises(ValueError):
+        ResultCache.key("unknown", audio_key)
+
+
+def test_result_cache_eviction(tmp_path, audio_file):
+    cache = ResultCache(str(tmp_path), max_bytes=2048)
+    audio_key = ResultCache.audio_key(audio_file)
+    keys = [ResultCache.key("transcript", audio_key, model=str(i)) for i in range(4)]
+
+    for key in keys:
+        cache.store(key, [{"speakers": "A", "segments": [0, 1], "text": "x" * 900}])
+
+    assert cache.load(keys[0]) is None
+    assert cache.load(keys[-1]) is not None
+
+
+def test_diarisation_key_does_not_load_the_diariser(tmp_path, audio_file):
+    config = tmp_path / "config.yaml"
+    config.write_text("pipeline: {name: a}\n")
+    model = Scraibe(StubTranscriber(), dia_model=str(config),
+                    result_cache=ResultCache(str(tmp_path / "cache")))
+
+    key = model._diarisation_key(audio_file)
+    assert not model.placement.was_loaded("diariser")
+    assert key == model._diarisation_key(audio_file)
+
+    config.write_text("pipeline: {name: b}\n")
+    assert key != model._diarisation_key(audio_file)
+
+
+def test_result_cache_with_stub_models(tmp_path, audio_file):
+    transcriber = StubTranscriber()
+    model = Scraibe(transcriber, dia_model=StubDiariser(),
+                    result_cache=ResultCache(str(tmp_path)))
+
+    first = model.autotranscribe(audio_file, language="en")
+    calls = transcriber.calls
+    second = model.autotranscribe(audio_file, language="en")
+
+    assert second.transcript == first.transcript
+    assert transcriber.calls == calls
+    assert model.result_cache.stats()["hits"] == {"transcript": 1}
@@ -0,0 +1,96 @@
+import pytest
+import torch
+from scraibe import AudioProcessor, Scraibe, SegmentScheduler
+
+from benchmarks.stubs import StubDiariser, StubTranscriber
+
+
+SEGMENTS = [[0.0, 1.5], [1.6, 3.0], [3.2, 5.0], [9.0, 12.0], [12.5, 50.0]]
+SPEAKERS = ["A", "B", "A", "A", "B"]
+
+
+def test_schedule_same_speaker():
+    scheduler = SegmentScheduler(max_gap=5.0)
+    windows = scheduler.schedule(SEGMENTS, SPEAKERS)
+    assert windows == [[0], [1], [2, 3], [4]]
+
+
+def test_schedule_interjections():
+    segments = [[0.0, 5.0], [5.2, 5.8], [6.0, 10.0], [10.5, 12.0], [12.2, 12.6]]
+    speakers = ["A", "B", "A", "B", "A"]
+    scheduler = SegmentScheduler()
+    # the backchannel of B joins the window of A, the longer turn of B does not
+    assert scheduler.schedule(segments, speakers) == [[0, 1, 2], [3, 4]]
+    assert scheduler.stats["windows"] < scheduler.stats["turns"]
+    assert SegmentScheduler(max_interjection=0).schedule(segments, speakers) == [[i] for i in range(5)]
+
+
+def test_schedule_cross_speaker():
+    scheduler = SegmentScheduler(cross_speaker=True)
+    windows = scheduler.schedule(SEGMENTS)
+    assert windows == [[0, 1, 2], [3], [4]]
+    assert sorted(i for window in windows for i in window) == list(range(len(SEGMENTS)))
+
+
+def test_schedule_max_window():
+    scheduler = SegmentScheduler(max_window=3.5, cross_speaker=True)
+    windows = scheduler.schedule(SEGMENTS)
+    assert windows == [[0, 1], [2], [3], [4]]
+
+
+def test_schedule_stats():
+    scheduler = SegmentScheduler(cross_speaker=True)
+    scheduler.schedule(SEGMENTS)
+    stats = scheduler.stats
+    assert stats["turns"] == 5
+    assert stats["windows"] == 3
+    assert stats["padding_saved"] == pytest.approx(60.0 - 1.5 - 1.4 - 1.8 + 5.0)
+    assert 0 < stats["padding_saved_ratio"] < 1
+
+
+def test_schedule_invalid_arguments():
+    with pytest.raises(ValueError):
+        SegmentScheduler(max_window=0)
+    with pytest.raises(ValueError):
+        SegmentScheduler(max_interjection=-1)
+    with pytest.raises(ValueError):
+        SegmentScheduler().schedule(SEGMENTS)
+
+
+TURNS = [(0.0, 5.0, "A"), (5.2, 5.8, "B"), (6.0, 10.0, "A"),
+         (10.5, 14.0, "B"), (14.2, 14.6, "A"), (14.8, 18.0, "B")]
+
+
+def _stub_scraibe():
+    transcriber = StubTranscriber()
+    return Scraibe(transcriber, dia_model=StubDiariser(TURNS)), transcriber
+
+
+@pytest.mark.parametrize("batch_size, calls", [(1, 2), (8, 1)])
+def test_coalesce_reduces_decode_calls(batch_size, calls):
+    audio = AudioProcessor(torch.zeros(18 * 16000))
+    model, transcriber = _stub_scraibe()
+    plain = model.autotranscribe(audio, language="en", batch_size=batch_size)
+    assert transcriber.calls == -(-len(TURNS) // batch_size)
+
+    model, transcriber = _stub_scraibe()
+    coalesced = model.autotranscribe(audio, language="en", batch_size=batch_size,
+                                     coalesce=True)
+    assert model.schedule_report["windows"] == 2
+    assert transcriber.calls == calls
+    assert [segment["speakers"] for segment in coalesced.transcript.values()] == \
+        [segment["speakers"] for segment in plain.transcript.values()]
+    assert all(segment["text"] for segment in coalesced.transcript.values())
+
+
+def test_coalesce_keeps_done_turns():
+    model, transcriber = _stub_scraibe()
+    diarisation = {"segments": [[start, end] for start, end, _ in TURNS],
+                   "speakers": [speaker for _, _, speaker in TURNS]}
+    texts = dict(model._iter_transcribe_segments(AudioProcessor(torch.zeros(18 * 16000)),
+                                                 diarisation, coalesce=True,
+                                                 done={0: " kept", 3: " kept", 4: " kept"}))
+    assert sorted(texts) == list(range(len(TURNS)))
+    assert texts[0] == texts[3] == texts[4] == " kept"
+    # the rest of the first window and the last turn, once each
+    assert transcriber.calls == 2
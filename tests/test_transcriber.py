@@ -78,3 +78,29 @@ def test_faster_whisper_transcribe(faster_whisper_instance):
     # mocker.patch.object(transcriber_instance.model, 'transcribe', return_value={'Hello, World !'} )
     transcript = model.transcribe('tests/audio_test_2.mp4')
     assert isinstance(transcript, str)
+
+
+@pytest.mark.parametrize("instance", ["whisper_instance", "faster_whisper_instance"])
+def test_transcribe_batch(instance, request):
+    model = request.getfixturevalue(instance)
+    audios = [torch.zeros(16000), torch.zeros(2 * 16000), torch.zeros(31 * 16000)]
+    transcripts = model.transcribe_batch(audios, batch_size=2, language="en")
+    assert len(transcripts) == len(audios)
+    assert all(isinstance(transcript, str) for transcript in transcripts)
+
+
+@pytest.mark.parametrize("instance", ["whisper_instance", "faster_whisper_instance"])
+def test_transcribe_batch_without_thresholds(instance, request):
+    model = request.getfixturevalue(instance)
+    audios = [torch.zeros(16000), torch.zeros(2 * 16000)]
+    transcripts = model.transcribe_batch(audios, batch_size=2, no_speech_threshold=None,
+                                         logprob_threshold=None, log_prob_threshold=None)
+    assert len(transcripts) == len(audios)
+
+
+@pytest.mark.parametrize("instance", ["whisper_instance", "faster_whisper_instance"])
+def test_detect_language(instance, request):
+    model = request.getfixturevalue(instance)
+    language, probability = model.detect_language(torch.zeros(16000))
+    assert isinstance(language, str)
+    assert 0 <= probability <= 1